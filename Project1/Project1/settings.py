@@ -76,10 +76,46 @@ WSGI_APPLICATION = 'Project1.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+# 연결마다 실행할 SQLite PRAGMA
+#   - journal_mode=WAL: 저장(ingestion) 중에도 조회가 막히지 않음
+#   - synchronous=NORMAL: WAL에서는 커밋마다 fsync 하지 않아도 안전 (checkpoint 시에만 fsync)
+#   - cache_size=-64000: 페이지 캐시 64MB, mmap_size: 256MB 메모리 매핑 읽기, temp_store: 임시 테이블을 메모리에
+SQLITE_PRAGMAS = [
+    'journal_mode=WAL',
+    'synchronous=NORMAL',
+    'cache_size=-64000',
+    'mmap_size=268435456',
+    'temp_store=MEMORY',
+]
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # 요청마다 연결을 새로 열지 않고 10분간 재사용 (PRAGMA 실행도 연결당 한 번)
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'init_command': ';'.join(f'PRAGMA {pragma}' for pragma in SQLITE_PRAGMAS),
+            # 쓰기 트랜잭션은 시작할 때 잠금을 잡아 동시 저장 시 중간에 실패하지 않도록 함
+            'transaction_mode': 'IMMEDIATE',
+            'timeout': 20,
+        },
+    }
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# 국가별 영화 조회 캐시 (키에 데이터 버전이 포함되므로 만료 없음)
+# 여러 프로세스로 서비스할 때는 Redis/Memcached 등 공유 backend로 바꿔야 저장 후 무효화가 모든 프로세스에 반영됨
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'db-storage',
+        'TIMEOUT': None,
+        'OPTIONS': {'MAX_ENTRIES': 1000},
     }
 }
 
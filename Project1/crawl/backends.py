@@ -0,0 +1,152 @@
+import json
+import re
+
+import requests
+
+
+class SearchPageParseError(ValueError):
+    """검색 페이지에서 영화 데이터를 추출하지 못했을 때 발생하는 예외"""
+
+
+class HttpSearchBackend:
+    """
+    브라우저 없이 IMDb 검색 페이지를 HTTP로 내려받아
+    페이지에 포함된 `__NEXT_DATA__` JSON에서 영화 정보를 추출하는 백엔드
+    """
+    NEXT_DATA_PATTERN = re.compile(
+        r'<script[^>]*id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL
+    )
+    HEADERS = {
+        'User-Agent': (
+            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+            '(KHTML, like Gecko) Chrome/131.0 Safari/537.36'
+        ),
+        'Accept-Language': 'en-US,en;q=0.9',
+    }
+
+    def __init__(self, timeout: float = 10):
+        """
+        :param timeout: HTTP 요청 타임아웃(초)
+        """
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(self.HEADERS)
+
+    def fetch(self, url: str) -> str:
+        """
+        검색 페이지 HTML을 내려받는 함수
+
+        :param url: 검색 페이지 URL
+        :return: HTML 문자열
+        """
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response.text
+
+    def extract_title_items(self, html: str) -> list:
+        """
+        HTML에 포함된 `__NEXT_DATA__`에서 검색 결과 목록을 꺼내는 함수
+
+        :param html: 검색 페이지 HTML
+        :return: 검색 결과 항목 리스트 (순위 순서)
+        """
+        match = self.NEXT_DATA_PATTERN.search(html)
+        if not match:
+            raise SearchPageParseError("__NEXT_DATA__ script not found")
+        try:
+            data = json.loads(match.group(1))
+            items = data['props']['pageProps']['searchResults']['titleResults']['titleListItems']
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            raise SearchPageParseError(f"unexpected page data: {e}") from e
+        if not isinstance(items, list):
+            raise SearchPageParseError("titleListItems is not a list")
+        return items
+
+    def parse_item(self, item: dict, rank: int) -> dict:
+        """
+        검색 결과 항목 하나를 Selenium 경로(process_movie)와 같은 키의 딕셔너리로 변환하는 함수
+
+        :param item: `titleListItems`의 항목
+        :param rank: 영화의 순위
+        :return: id, img, title, year, score, summary, genre, stars, rank 키를 가진 딕셔너리
+        """
+        title = item.get('titleText')
+        if isinstance(title, dict):
+            title = title.get('text')
+        if not title:
+            raise SearchPageParseError(f"title missing for rank {rank}")
+
+        year = item.get('releaseYear')
+        if isinstance(year, dict):
+            year = year.get('year')
+        end_year = item.get('endYear')
+        if year and end_year and end_year != year:
+            year = f"{year}–{end_year}"
+
+        rating = (item.get('ratingSummary') or {}).get('aggregateRating')
+        plot = item.get('plot')
+        if isinstance(plot, dict):
+            plot = (plot.get('plotText') or {}).get('plainText')
+        image = item.get('primaryImage') or {}
+
+        return {
+            'id': item.get('titleId'),
+            'img': image.get('url'),
+            'title': title,
+            'year': str(year) if year else None,
+            'score': f"{float(rating):.1f}" if rating is not None else None,
+            'summary': plot,
+            'genre': self.parse_genres(item),
+            'stars': self.parse_stars(item),
+            'rank': rank,
+        }
+
+    def parse_genres(self, item: dict) -> list:
+        """장르 목록 추출 (문자열 리스트 또는 {'genre': {'text'}} 형태 모두 지원)"""
+        genres = item.get('genres') or (item.get('titleGenres') or {}).get('genres') or []
+        names = []
+        for genre in genres:
+            if isinstance(genre, dict):
+                genre = (genre.get('genre') or genre).get('text')
+            if genre:
+                names.append(genre)
+        return names
+
+    def parse_stars(self, item: dict) -> list:
+        """출연진 목록 추출 (`principalCredits` 중 Stars 카테고리 우선)"""
+        credits = item.get('principalCredits') or []
+        for group in credits:
+            category = (group.get('category') or {}).get('text', '')
+            if category.lower().startswith('star'):
+                return [
+                    credit['name']['nameText']['text']
+                    for credit in group.get('credits', [])
+                    if ((credit.get('name') or {}).get('nameText') or {}).get('text')
+                ]
+        return list(item.get('stars') or [])
+
+    def parse(self, html: str, top_n: int) -> list:
+        """
+        검색 페이지 HTML에서 1~top_n위 영화 정보를 추출하는 함수
+
+        :param html: 검색 페이지 HTML
+        :param top_n: 추출할 영화의 수
+        :return: 순위 순서의 콘텐츠 딕셔너리 리스트
+        """
+        items = self.extract_title_items(html)
+        if len(items) < top_n:
+            raise SearchPageParseError(f"expected {top_n} items, found {len(items)}")
+        contents = []
+        for rank, item in enumerate(items[:top_n], start=1):
+            try:
+                contents.append(self.parse_item(item, rank))
+            except SearchPageParseError:
+                raise
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                # 항목 구조가 예상과 다르면 selenium 대체 경로를 타도록 파싱 실패로 변환
+                raise SearchPageParseError(f"unexpected item data for rank {rank}: {e}") from e
+        return contents
+
+    def scrape(self, url: str, top_n: int) -> list:
+        """검색 페이지를 내려받아 1~top_n위 영화 정보를 반환"""
+        return self.parse(self.fetch(url), top_n)
@@ -4,23 +4,75 @@ from selenium.webdriver import ActionChains
 from selenium import webdriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import TimeoutException
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import time
 import json
 import os
+import hashlib
+import requests
+from collections import defaultdict
 from tqdm import tqdm
 from datetime import datetime
 from typing import Final
+from crawl.backends import HttpSearchBackend, SearchPageParseError
+from crawl.journal import CrawlJournal
+from crawl.driver_manager import resolve_driver_path, get_process_session, close_process_session
+from crawl.scheduler import CrawlScheduler
+
+# 모달의 단일 요소와 반복 요소를 한 번의 스크립트 실행으로 추출하는 JavaScript
+# arguments[0]: {요소 이름: 전체 XPATH}, arguments[1]: {목록 이름: 전체 XPATH (모든 항목 선택)}
+MODAL_EXTRACT_SCRIPT: Final = '''
+const [fields, lists] = arguments;
+const result = {};
+for (const [name, xpath] of Object.entries(fields)) {
+    const node = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (node) {
+        result[name] = name === 'img' ? (node.src || node.getAttribute('src')) : node.innerText.trim();
+    }
+}
+for (const [name, xpath] of Object.entries(lists)) {
+    const snapshot = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    result[name] = [];
+    for (let i = 0; i < snapshot.snapshotLength; i++) {
+        result[name].push(snapshot.snapshotItem(i).innerText.trim());
+    }
+}
+return result;
+'''
+
+# 목록 페이지에서 1~n위 항목의 식별자(IMDb title id, 없으면 제목)를 순서대로 추출하는 JavaScript
+# arguments[0]: 목록 항목 전체를 선택하는 XPATH, arguments[1]: 항목 수
+LIST_KEYS_SCRIPT: Final = '''
+const [xpath, n] = arguments;
+const snapshot = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const keys = [];
+for (let i = 0; i < Math.min(n, snapshot.snapshotLength); i++) {
+    const item = snapshot.snapshotItem(i);
+    const link = item.querySelector('a[href*="/title/tt"]');
+    const match = link && link.getAttribute('href').match(/tt\\d+/);
+    keys.push(match ? match[0] : item.innerText.split('\\n')[0].trim());
+}
+return keys;
+'''
 
 class MovieCrawler:
     def initialize_driver(self):
         """
-        Chrome WebDriver를 초기화하는 함수
+        Chrome WebDriver를 초기화하는 함수 (드라이버 바이너리 경로는 프로세스당 한 번만 확인)
         
         :return: 초기화된 WebDriver 인스턴스
         """
         options = self.configure_chrome_options()
-        return webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+        return webdriver.Chrome(service=Service(resolve_driver_path()), options=options)
+
+    def driver_session(self):
+        """
+        현재 프로세스에서 재사용하는 브라우저 세션을 반환하는 함수
+
+        :return: DriverSession 인스턴스
+        """
+        return get_process_session(self.initialize_driver, **self.DRIVER_RECYCLE)
 
     def configure_chrome_options(self):
         """
@@ -43,9 +95,51 @@ class MovieCrawler:
         :param wait: WebDriverWait 인스턴스 (타임아웃 설정)
         :param xpath: 클릭할 버튼의 XPATH
         """
-        button = wait.until(EC.element_to_be_clickable((By.XPATH, xpath)))
+        button = self.timed_wait('button', wait, EC.element_to_be_clickable((By.XPATH, xpath)))
         ActionChains(driver).click(button).perform()
 
+    def timed_wait(self, name: str, wait, condition):
+        """
+        WebDriverWait 조건을 기다리고 실제 대기 시간을 기록하는 함수
+
+        :param name: 대기 항목 이름 (예: 'modal_open', 'field:title')
+        :param wait: WebDriverWait 인스턴스
+        :param condition: expected_conditions 조건
+        :return: 조건의 반환값 (타임아웃 시 TimeoutException 발생)
+        """
+        started = time.perf_counter()
+        try:
+            return wait.until(condition)
+        except TimeoutException:
+            self.wait_timeouts[name] += 1
+            raise
+        finally:
+            self.wait_timings[name].append(time.perf_counter() - started)
+
+    def wait_summary(self) -> dict:
+        """
+        대기 항목별 통계를 반환하는 함수
+
+        :return: {이름: {'count', 'total', 'max', 'timeouts'}} 딕셔너리
+        """
+        return {
+            name: {
+                'count': len(timings),
+                'total': sum(timings),
+                'max': max(timings),
+                'timeouts': self.wait_timeouts.get(name, 0),
+            }
+            for name, timings in self.wait_timings.items() if timings
+        }
+
+    def print_wait_summary(self):
+        """대기 시간 통계 출력"""
+        for name, stat in sorted(self.wait_summary().items()):
+            print(
+                f"[wait] {name}: count={stat['count']} total={stat['total']:.2f}s "
+                f"max={stat['max']:.2f}s timeouts={stat['timeouts']}"
+            )
+
     def transform_content_to_result(self, content: dict, country: str) -> dict:
         """
         추출한 콘텐츠를 요구되는 JSON 구조로 변환하는 함수
@@ -68,12 +162,16 @@ class MovieCrawler:
             "rank": content["rank"]
         }
 
-    def __init__(self, country_codes_filepath='./data/raw/country_code.json', top_n=10):
+    def __init__(self, country_codes_filepath='./data/raw/country_code.json', top_n=10, backend='selenium', resume=True,
+                 skip_unchanged=True):
         """
         크롤러 초기화 함수
 
         :param country_codes_filepath: 국가 코드가 저장된 JSON 파일 경로
         :param top_n: 크롤링할 영화의 수
+        :param backend: 'selenium' (브라우저) 또는 'http' (검색 페이지 직접 파싱, 실패 시 selenium으로 대체)
+        :param resume: True이면 저널에 기록된 (국가, 순위)를 건너뛰고 이어서 크롤링
+        :param skip_unchanged: True이면 목록 페이지 fingerprint가 지난 실행과 같은 국가는 상세 크롤링을 건너뛰고 이전 결과를 재사용
         """
         self.BASE_URL = 'https://www.imdb.com/search/title/?countries={}'
         self.BASE_XPATH = '/html/body/div[4]/div[2]/div/div[2]/div/div'
@@ -94,8 +192,50 @@ class MovieCrawler:
             'div[2]/div[2]/ul/li[{}]/div/div/div/div[1]/div[3]/button'
         )
         self.save_at:Final = './crawl/data/raw/movies_data_country.json'
+        self.journal = CrawlJournal('./crawl/data/raw/movies_data_country.journal.jsonl')
+        self.resume = resume
+        self.fingerprints_path = './crawl/data/raw/country_fingerprints.json'
+        self.skip_unchanged = skip_unchanged
+        self.fingerprints = {}
+        self.previous_movies = {}
+        self.new_fingerprints = {}
         self.country_codes_filepath = country_codes_filepath
         self.top_n = top_n
+        self.backend = backend
+        # 대기 조건별 타임아웃(초): 고정 sleep 대신 DOM 상태를 기다림
+        self.WAIT_TIMEOUTS = {
+            'button': 5,
+            'modal': 5,
+            'field': 2,
+        }
+        # True이면 모달 데이터를 한 번의 스크립트 실행으로 추출 (실패 시 요소별 추출로 대체)
+        self.batched_extraction = True
+        # 브라우저 재시작 기준: 처리한 페이지(국가) 수, JS 힙 사용량(MB)
+        self.DRIVER_RECYCLE = {
+            'max_pages': 30,
+            'max_memory_mb': 1024,
+        }
+        self.wait_timings = defaultdict(list)
+        self.wait_timeouts = defaultdict(int)
+        self.http_backend = HttpSearchBackend() if backend == 'http' else None
+        # CrawlScheduler가 실행 중일 때 설정되는 호스트별 요청 속도 제한기
+        self.rate_limiter = None
+        # 영화 레코드가 완료될 때마다 호출되는 함수 (진행률 보고용, 같은 프로세스에서만 호출됨)
+        self.progress_callback = None
+        self.worker_stats = {}
+        self.scheduler_stats = {}
+        # crawling_parallel에서 워커가 실패한 국가 코드 목록
+        self.failed_countries = []
+
+    def __getstate__(self):
+        """
+        워커 프로세스로 보낼 때 pickle되지 않는 부모 프로세스 전용 속성을 제외하는 함수
+        (진행률 콜백은 부모에서 완료된 작업 결과로 호출됨)
+        """
+        state = self.__dict__.copy()
+        state['progress_callback'] = None
+        state['rate_limiter'] = None
+        return state
         
     def load_country_codes(self, filepath='./crawl/data/raw/country_code.json'):
         """국가 코드 로드"""
@@ -128,34 +268,40 @@ class MovieCrawler:
         
         print(f"기본 국가 코드 파일이 {filepath}에 생성되었습니다.")
     
-    def initialize_driver(self):
-        """WebDriver 초기화"""
-        options = self.configure_chrome_options()
-        return webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-
-    def scrape_modal_content(self, wait, base_xpath: str, relative_xpaths: dict) -> dict:
+    def scrape_modal_content(self, driver, base_xpath: str, relative_xpaths: dict) -> dict:
         """
-        모달 창에서 콘텐츠를 추출하는 함수
+        모달 창에서 콘텐츠를 추출하는 함수.
+        첫 요소가 발견되면 모달 본문이 렌더링된 것으로 보고, 이후 없는 요소는 기다리지 않고 건너뛴다.
 
-        :param wait: WebDriverWait 인스턴스 (타임아웃 설정)
+        :param driver: Selenium WebDriver 인스턴스
         :param base_xpath: 모든 요소에 공통으로 사용되는 XPATH
         :param relative_xpaths: 각 요소별 상대적인 XPATH가 담긴 딕셔너리
         :return: 추출된 콘텐츠(img_url, 제목, 개봉년도, 평점, 요약)가 담긴 딕셔너리
         """
         extracted_content = {}
+        rendered = False
         for element_name, relative_xpath in relative_xpaths.items():
+            full_xpath = base_xpath + relative_xpath
             try:
-                full_xpath = base_xpath + relative_xpath
+                if rendered:
+                    # 모달이 렌더링된 뒤에는 존재 여부만 즉시 확인 (fail-fast)
+                    elements = driver.find_elements(By.XPATH, full_xpath)
+                    if not elements:
+                        print(f"Element {element_name} not present, skipping")
+                        continue
+                    element = elements[0]
+                else:
+                    wait = WebDriverWait(driver, self.WAIT_TIMEOUTS['field'])
+                    element = self.timed_wait(
+                        f'field:{element_name}', wait, EC.presence_of_element_located((By.XPATH, full_xpath))
+                    )
+                    rendered = True
                 if element_name == 'img':
                     # 이미지의 경우 'src' 속성을 가져옴
-                    extracted_content[element_name] = wait.until(
-                        EC.presence_of_element_located((By.XPATH, full_xpath))
-                    ).get_attribute('src')
+                    extracted_content[element_name] = element.get_attribute('src')
                 else:
                     # 나머지 요소는 텍스트를 가져옴
-                    extracted_content[element_name] = wait.until(
-                        EC.presence_of_element_located((By.XPATH, full_xpath))
-                    ).text
+                    extracted_content[element_name] = element.text
             except Exception as e:
                 print(f"Error fetching {element_name}: {e}")
         return extracted_content
@@ -186,35 +332,77 @@ class MovieCrawler:
             extracted_data[element_name] = values
         return extracted_data
 
+    def build_modal_extraction_spec(self) -> tuple:
+        """
+        RELATIVE_XPATHS / ELEMENTS_PATH 로부터 배치 추출용 전체 XPATH를 만드는 함수.
+        반복 요소 템플릿의 인덱스(`[{}]`)를 제거해 모든 항목을 한 번에 선택한다.
+
+        :return: ({요소 이름: XPATH}, {목록 이름: XPATH}) 튜플
+        """
+        fields = {name: self.BASE_XPATH + xpath for name, xpath in self.RELATIVE_XPATHS.items()}
+        lists = {name: self.BASE_XPATH + template.replace('[{}]', '') for name, template in self.ELEMENTS_PATH.items()}
+        return fields, lists
+
+    def scrape_modal_batch(self, driver) -> dict:
+        """
+        열린 모달의 모든 요소(img_url, 제목, 개봉년도, 평점, 요약, 장르, 출연진)를
+        한 번의 execute_script 호출로 추출하는 함수
+
+        :param driver: Selenium WebDriver 인스턴스
+        :return: scrape_modal_content + scrape_modal_data 와 같은 키의 딕셔너리
+        """
+        fields, lists = self.build_modal_extraction_spec()
+        return driver.execute_script(MODAL_EXTRACT_SCRIPT, fields, lists) or {}
+
+    def scrape_modal(self, driver) -> dict:
+        """
+        모달 데이터를 추출하는 함수. 배치 추출 결과에 제목이 없으면 요소별 추출로 대체한다.
+
+        :param driver: Selenium WebDriver 인스턴스
+        :return: 추출된 콘텐츠 딕셔너리
+        """
+        if self.batched_extraction:
+            try:
+                content = self.scrape_modal_batch(driver)
+                if content.get('title'):
+                    return content
+            except Exception as e:
+                print(f"Batched extraction failed, falling back to per-element extraction: {e}")
+        # 콘텐츠 크롤링 -> img_url, 제목, 개봉년도, 평점, 요약
+        content = self.scrape_modal_content(driver, self.BASE_XPATH, self.RELATIVE_XPATHS)
+        # 추가 데이터 -> 장르, 출연진
+        content.update(self.scrape_modal_data(driver, self.BASE_XPATH, self.ELEMENTS_PATH))
+        return content
+
     def process_movie(self, driver, wait, country, country_code, rank):
         """
         단일 영화 항목을 처리하는 함수
 
         :param driver: Selenium WebDriver 인스턴스
-        :param wait: WebDriverWait 인스턴스 (타임아웃 설정)
+        :param wait: WebDriverWait 인스턴스 (버튼 클릭 대기용)
         :param country: 영화가 속한 국가
         :param country_code: 국가 코드
         :param rank: 영화의 순위
         :return: 추출된 영화 정보가 담긴 딕셔너리
         """
         content = {}
+        modal_wait = WebDriverWait(driver, self.WAIT_TIMEOUTS['modal'])
+        modal_locator = (By.XPATH, self.BASE_XPATH)
         try:
             print(f"Processing item {rank} for {country}({country_code})")
-            # 버튼 클릭
+            # 버튼 클릭 후 모달이 열릴 때까지 대기
             button_xpath = self.BUTTON_XPATH_TEMPLATE.format(rank)
             self.click_button(driver, wait, button_xpath)
-            time.sleep(0.5)
-            # 콘텐츠 크롤링 -> img_url, 제목, 개봉년도, 평점, 요약
-            content = self.scrape_modal_content(wait, self.BASE_XPATH, self.RELATIVE_XPATHS)
+            self.timed_wait('modal_open', modal_wait, EC.visibility_of_element_located(modal_locator))
+            # 콘텐츠 크롤링 -> img_url, 제목, 개봉년도, 평점, 요약, 장르, 출연진
+            content = self.scrape_modal(driver)
             # 국가 추가
             content['country'] = country
-            # 추가 데이터 -> 장르, 출연진
-            content.update(self.scrape_modal_data(driver, self.BASE_XPATH, self.ELEMENTS_PATH))
             # 순위 추가
             content['rank'] = rank
-            # 모달 닫기
+            # 모달 닫기 후 모달이 사라질 때까지 대기
             self.click_button(driver, wait, self.CLOSE_BUTTON_XPATH)
-            time.sleep(0.5)
+            self.timed_wait('modal_close', modal_wait, EC.invisibility_of_element_located(modal_locator))
         except Exception as e:
             self.log_error(country, rank, e)
         return content
@@ -243,42 +431,277 @@ class MovieCrawler:
         except Exception as e:
             print(f"An error occured:{e}")
     
-    def crawling(self):
-        """크롤링 메인 함수"""
-        result = {"movies": []}
+    def load_country_code_dict(self) -> dict:
+        """
+        국가 코드 파일을 로드하는 함수 (로드 실패 시 빈 딕셔너리 반환)
 
+        :return: {국가 코드: 국가 이름} 딕셔너리
+        """
         try:
             # 국가 코드 로드
-            country_code_dict = self.load_country_codes()
+            return self.load_country_codes()
         except FileNotFoundError:
             print("Country code file not found. Creating default file.")
             self.create_default_country_code_file(self.country_codes_filepath)
-            country_code_dict = self.load_country_codes()
+            return self.load_country_codes()
         except json.JSONDecodeError:
             print("Error decoding the country code file. Please check the file format.")
-            return result
         except Exception as e:
             print(f"Unexpected error while loading country codes: {e}")
-            return result
+        return {}
 
-        for country_code, country in country_code_dict.items():
-            try:
-                with self.initialize_driver() as driver:
-                    wait = WebDriverWait(driver, 10)
-                    driver.get(self.BASE_URL.format(country_code))
-
-                    for rank in range(1, self.top_n + 1):
-                        try:
-                            content = self.process_movie(driver, wait, country, country_code, rank)
-                            if content:
-                                result["movies"].append(self.transform_content_to_result(content, country))
-                        except Exception as e:
-                            self.log_error(country, rank, e)
-            except webdriver.WebDriverException:
-                print(f"WebDriver error while processing country: {country} ({country_code})")
-            except Exception as e:
-                print(f"Unexpected error for country {country} ({country_code}): {e}")
+    def throttle(self, url: str = None):
+        """
+        요청 전에 호출하여 스케줄러의 요청 예산(토큰 버킷)을 기다리는 함수
+
+        :param url: 요청할 URL (호스트별 예산 구분용, 없으면 BASE_URL)
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(url or self.BASE_URL)
+
+    def record_movie(self, movies: list, record: dict):
+        """
+        완료된 영화 레코드를 결과 리스트와 저널에 추가하는 함수
+
+        :param movies: 국가별 결과 리스트
+        :param record: transform_content_to_result 형태의 영화 레코드
+        """
+        movies.append(record)
+        try:
+            self.journal.append(record)
+        except OSError as e:
+            print(f"Failed to append to crawl journal: {e}")
+        if self.progress_callback is not None:
+            self.progress_callback(record)
+
+    def crawl_country(self, country_code: str, country: str, skip_ranks=()) -> list:
+        """
+        단일 국가의 1~top_n위 영화를 크롤링하는 함수.
+        http 백엔드는 검색 페이지 파싱에 실패한 경우에만 selenium 경로로 대체한다.
+
+        :param country_code: 국가 코드
+        :param country: 국가 이름
+        :param skip_ranks: 이미 완료되어 건너뛸 순위 목록
+        :return: 새로 크롤링한 영화 정보 리스트 (순위 오름차순)
+        """
+        if self.http_backend is not None:
+            movies = self.crawl_country_http(country_code, country, skip_ranks)
+            if movies is not None:
+                return movies
+        return self.crawl_country_selenium(country_code, country, skip_ranks)
+
+    def crawl_country_http(self, country_code: str, country: str, skip_ranks=()):
+        """
+        HTTP 백엔드로 단일 국가를 크롤링하는 함수
+
+        :param country_code: 국가 코드
+        :param country: 국가 이름
+        :param skip_ranks: 이미 완료되어 건너뛸 순위 목록
+        :return: 변환된 영화 정보 리스트, 실패 시 None
+        """
+        try:
+            url = self.BASE_URL.format(country_code)
+            self.throttle(url)
+            contents = self.http_backend.scrape(url, self.top_n)
+        except (SearchPageParseError, requests.RequestException) as e:
+            print(f"HTTP backend failed for {country}({country_code}), falling back to selenium: {e}")
+            return None
+        fingerprint = self.compute_fingerprint([content.get('id') or content['title'] for content in contents])
+        reused = self.reuse_if_unchanged(country_code, country, fingerprint, skip_ranks)
+        if reused is not None:
+            return reused
+        movies = []
+        for content in contents:
+            if content['rank'] in skip_ranks:
+                continue
+            content['country'] = country
+            self.record_movie(movies, self.transform_content_to_result(content, country))
+        self.new_fingerprints[country_code] = {"fingerprint": fingerprint, "top_n": self.top_n}
+        return movies
+
+    def crawl_country_selenium(self, country_code: str, country: str, skip_ranks=()) -> list:
+        """
+        Selenium(브라우저)으로 단일 국가를 크롤링하는 함수
 
+        :param country_code: 국가 코드
+        :param country: 국가 이름
+        :param skip_ranks: 이미 완료되어 건너뛸 순위 목록
+        :return: 변환된 영화 정보 리스트 (순위 오름차순)
+        """
+        movies = []
+        try:
+            # 프로세스에서 띄워 둔 브라우저를 재사용 (국가 사이 상태 초기화)
+            driver = self.driver_session().acquire()
+            wait = WebDriverWait(driver, self.WAIT_TIMEOUTS['button'])
+            url = self.BASE_URL.format(country_code)
+            self.throttle(url)
+            driver.get(url)
+
+            fingerprint = self.fingerprint_list_page(driver)
+            reused = self.reuse_if_unchanged(country_code, country, fingerprint, skip_ranks)
+            if reused is not None:
+                return reused
+
+            for rank in range(1, self.top_n + 1):
+                if rank in skip_ranks:
+                    continue
+                try:
+                    # 모달을 열 때마다 영화 상세 데이터를 요청하므로 예산을 소모
+                    self.throttle(url)
+                    content = self.process_movie(driver, wait, country, country_code, rank)
+                    if content:
+                        self.record_movie(movies, self.transform_content_to_result(content, country))
+                except Exception as e:
+                    self.log_error(country, rank, e)
+            if fingerprint and len(movies) + len(skip_ranks) >= self.top_n:
+                self.new_fingerprints[country_code] = {"fingerprint": fingerprint, "top_n": self.top_n}
+        except webdriver.WebDriverException:
+            print(f"WebDriver error while processing country: {country} ({country_code})")
+            # 브라우저 상태를 알 수 없으므로 다음 국가에서 새로 띄움
+            self.driver_session().discard()
+        except Exception as e:
+            print(f"Unexpected error for country {country} ({country_code}): {e}")
+        return movies
+
+    def compute_fingerprint(self, keys: list) -> str:
+        """
+        목록 페이지의 순서 있는 항목 식별자 리스트로 fingerprint를 계산하는 함수
+
+        :param keys: 1~top_n위 항목의 식별자 리스트
+        :return: sha256 hex 문자열 (항목 수가 top_n보다 적으면 None)
+        """
+        if len(keys) < self.top_n or not all(keys):
+            return None
+        return hashlib.sha256('\n'.join(keys[:self.top_n]).encode('utf-8')).hexdigest()
+
+    def fingerprint_list_page(self, driver) -> str:
+        """
+        모달을 열기 전에 목록 페이지의 fingerprint를 한 번의 스크립트 실행으로 계산하는 함수
+
+        :param driver: Selenium WebDriver 인스턴스
+        :return: fingerprint 문자열, 실패 시 None
+        """
+        list_xpath = self.BUTTON_XPATH_TEMPLATE.split('/li[{}]')[0] + '/li'
+        try:
+            keys = driver.execute_script(LIST_KEYS_SCRIPT, list_xpath, self.top_n) or []
+        except Exception as e:
+            print(f"Failed to fingerprint list page: {e}")
+            return None
+        return self.compute_fingerprint(keys)
+
+    def reuse_if_unchanged(self, country_code: str, country: str, fingerprint: str, skip_ranks=()):
+        """
+        fingerprint가 지난 실행과 같으면 이전 결과를 재사용하는 함수
+
+        :param country_code: 국가 코드
+        :param country: 국가 이름
+        :param fingerprint: 이번 목록 페이지의 fingerprint
+        :param skip_ranks: 이미 완료되어 건너뛸 순위 목록
+        :return: 재사용한 영화 정보 리스트, 재사용할 수 없으면 None
+        """
+        if not self.skip_unchanged or fingerprint is None:
+            return None
+        stored = self.fingerprints.get(country_code, {})
+        previous = [movie for movie in self.previous_movies.get(country, []) if movie["rank"] <= self.top_n]
+        if stored.get("fingerprint") != fingerprint or stored.get("top_n") != self.top_n or len(previous) < self.top_n:
+            return None
+        print(f"Ranking unchanged for {country}({country_code}), reusing previous records")
+        movies = []
+        for movie in sorted(previous, key=lambda movie: movie["rank"]):
+            if movie["rank"] not in skip_ranks:
+                self.record_movie(movies, movie)
+        self.new_fingerprints[country_code] = stored
+        return movies
+
+    def load_fingerprints(self):
+        """
+        지난 실행의 국가별 fingerprint와 결과 파일(save_at)의 영화 정보를 로드하는 함수
+        """
+        self.new_fingerprints = {}
+        if not self.skip_unchanged:
+            return
+        try:
+            with open(self.fingerprints_path, 'r', encoding='utf-8') as f:
+                self.fingerprints = json.load(f)
+            with open(self.save_at, 'r', encoding='utf-8') as f:
+                previous = json.load(f).get("movies", [])
+        except (OSError, json.JSONDecodeError, AttributeError):
+            self.fingerprints, self.previous_movies = {}, {}
+            return
+        self.previous_movies = {}
+        for movie in previous:
+            self.previous_movies.setdefault(movie["country"], []).append(movie)
+
+    def save_fingerprints(self):
+        """이번 실행에서 확인된 fingerprint를 기존 값에 합쳐 저장"""
+        if not self.new_fingerprints:
+            return
+        fingerprints = {**self.fingerprints, **self.new_fingerprints}
+        try:
+            os.makedirs(os.path.dirname(self.fingerprints_path), exist_ok=True)
+            with open(self.fingerprints_path, 'w', encoding='utf-8') as f:
+                json.dump(fingerprints, f, ensure_ascii=False, indent=4)
+            self.fingerprints = fingerprints
+        except OSError as e:
+            print(f"Failed to save fingerprints: {e}")
+
+    def crawl_country_timed(self, country_code: str, country: str, skip_ranks=()) -> dict:
+        """
+        워커 프로세스에서 실행되는 국가 단위 크롤링 작업 (처리량 측정 포함)
+
+        :param country_code: 국가 코드
+        :param country: 국가 이름
+        :param skip_ranks: 이미 완료되어 건너뛸 순위 목록
+        :return: {'pid', 'country_code', 'movies', 'elapsed', 'wait_timings', 'wait_timeouts', 'fingerprints'} 딕셔너리
+        """
+        self.wait_timings = defaultdict(list)
+        self.wait_timeouts = defaultdict(int)
+        self.new_fingerprints = {}
+        started = time.perf_counter()
+        movies = self.crawl_country(country_code, country, skip_ranks)
+        return {
+            "pid": os.getpid(),
+            "country_code": country_code,
+            "movies": movies,
+            "elapsed": time.perf_counter() - started,
+            "wait_timings": dict(self.wait_timings),
+            "wait_timeouts": dict(self.wait_timeouts),
+            "fingerprints": self.new_fingerprints,
+        }
+
+    def merge_country_results(self, country_code_dict: dict, movies_by_code: dict) -> dict:
+        """
+        국가별 크롤링 결과를 국가 코드 파일 순서, 순위 순서로 병합하는 함수
+
+        :param country_code_dict: {국가 코드: 국가 이름} 딕셔너리 (병합 순서 기준)
+        :param movies_by_code: {국가 코드: 영화 정보 리스트} 딕셔너리
+        :return: {"movies": [...]} 형태의 결과
+        """
+        result = {"movies": []}
+        for country_code in country_code_dict:
+            movies = movies_by_code.get(country_code, [])
+            result["movies"].extend(sorted(movies, key=lambda movie: movie["rank"]))
+        return result
+
+    def summarize_worker_stats(self, task_results: list) -> dict:
+        """
+        워커(프로세스)별 처리량을 집계하는 함수
+
+        :param task_results: crawl_country_timed 결과 리스트
+        :return: {pid: {'countries', 'movies', 'elapsed', 'movies_per_sec'}} 딕셔너리
+        """
+        stats = {}
+        for task in task_results:
+            worker = stats.setdefault(task["pid"], {"countries": 0, "movies": 0, "elapsed": 0.0})
+            worker["countries"] += 1
+            worker["movies"] += len(task["movies"])
+            worker["elapsed"] += task["elapsed"]
+        for worker in stats.values():
+            worker["movies_per_sec"] = worker["movies"] / worker["elapsed"] if worker["elapsed"] else 0.0
+        return stats
+
+    def save_result(self, result: dict):
+        """크롤링 결과를 save_at 경로에 저장"""
         try:
             self.save_dict_as_json(result, self.save_at)
         except IOError:
@@ -286,6 +709,184 @@ class MovieCrawler:
         except Exception as e:
             print(f"Unexpected error while saving results: {e}")
 
+    def load_completed_movies(self, country_code_dict: dict) -> dict:
+        """
+        저널에서 이미 완료된 영화 레코드를 국가 코드별로 읽는 함수 (resume=False이면 저널 초기화)
+
+        :param country_code_dict: {국가 코드: 국가 이름} 딕셔너리
+        :return: {국가 코드: 완료된 영화 정보 리스트} 딕셔너리
+        """
+        if not self.resume:
+            self.journal.clear()
+            return {}
+        journal_records = self.journal.load()
+        completed = {
+            country_code: [record for (name, _), record in journal_records.items() if name == country]
+            for country_code, country in country_code_dict.items()
+        }
+        resumed = sum(len(records) for records in completed.values())
+        if resumed:
+            print(f"Resuming crawl: {resumed} movies restored from {self.journal.path}")
+        return completed
+
+    def compact_journal(self, country_code_dict: dict, movies_by_code: dict) -> dict:
+        """
+        저널 + 새로 크롤링한 결과를 최종 JSON 파일로 정리하는 함수.
+        모든 국가의 top_n이 채워진 경우에만 저널을 삭제한다 (아니면 다음 실행에서 이어서 진행).
+
+        :param country_code_dict: {국가 코드: 국가 이름} 딕셔너리
+        :param movies_by_code: {국가 코드: 영화 정보 리스트} 딕셔너리
+        :return: {"movies": [...]} 형태의 결과
+        """
+        result = self.merge_country_results(country_code_dict, movies_by_code)
+        self.save_result(result)
+        self.save_fingerprints()
+        if all(len(movies_by_code.get(country_code, [])) >= self.top_n for country_code in country_code_dict):
+            self.journal.clear()
         return result
 
+    def crawling(self):
+        """크롤링 메인 함수"""
+        country_code_dict = self.load_country_code_dict()
+        if not country_code_dict:
+            return {"movies": []}
+
+        self.load_fingerprints()
+        movies_by_code = self.load_completed_movies(country_code_dict)
+        for country_code, country in country_code_dict.items():
+            movies = movies_by_code.setdefault(country_code, [])
+            skip_ranks = {movie["rank"] for movie in movies}
+            if len(skip_ranks) >= self.top_n:
+                continue
+            movies.extend(self.crawl_country(country_code, country, skip_ranks))
+
+        close_process_session()
+        self.print_wait_summary()
+        return self.compact_journal(country_code_dict, movies_by_code)
+
+    def iter_movies(self):
+        """
+        크롤링 결과를 국가 단위로 바로 내보내는 제너레이터 (결과 전체를 메모리에 모으지 않음).
+        저널에 남아 있는 완료 레코드가 있으면 먼저 내보낸 뒤 나머지 순위를 크롤링하며,
+        모든 국가의 top_n이 채워진 경우에만 저널을 비운다.
+        결과 파일(save_at)을 저장하지 않으므로 fingerprint도 저장하지 않는다
+        (저장하면 다음 crawling()이 이전 결과 파일의 레코드를 "변경 없음"으로 재사용하게 됨).
+
+        :return: transform_content_to_result 형태의 영화 레코드 제너레이터
+        """
+        country_code_dict = self.load_country_code_dict()
+        if not country_code_dict:
+            return
+
+        self.load_fingerprints()
+        completed_by_code = self.load_completed_movies(country_code_dict)
+        ranks_by_code = {}
+        try:
+            for country_code, country in country_code_dict.items():
+                completed = completed_by_code.pop(country_code, [])
+                yield from sorted(completed, key=lambda movie: movie["rank"])
+                ranks = ranks_by_code[country_code] = {movie["rank"] for movie in completed}
+                if len(ranks) < self.top_n:
+                    for movie in self.crawl_country(country_code, country, set(ranks)):
+                        ranks.add(movie["rank"])
+                        yield movie
+        finally:
+            close_process_session()
+            self.print_wait_summary()
+        if all(len(ranks_by_code.get(country_code, ())) >= self.top_n for country_code in country_code_dict):
+            self.journal.clear()
+
+    def crawling_parallel(self, max_workers: int = None):
+        """
+        국가 단위로 작업을 워커 프로세스 풀에 분배하는 병렬 크롤링 함수.
+        각 워커는 자신의 WebDriver를 사용하며, 결과는 국가/순위 순서로 병합된다.
+
+        :param max_workers: 워커 프로세스 수 (None이면 CPU 수)
+        :return: {"movies": [...]} 형태의 결과 (crawling()과 동일)
+        """
+        country_code_dict = self.load_country_code_dict()
+        if not country_code_dict:
+            return {"movies": []}
+
+        self.load_fingerprints()
+        movies_by_code = self.load_completed_movies(country_code_dict)
+        skip_ranks_by_code = {
+            country_code: {movie["rank"] for movie in movies_by_code.get(country_code, [])}
+            for country_code in country_code_dict
+        }
+
+        started = time.perf_counter()
+        task_results = []
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.crawl_country_timed, country_code, country, skip_ranks_by_code[country_code]): country_code
+                for country_code, country in country_code_dict.items()
+                if len(skip_ranks_by_code[country_code]) < self.top_n
+            }
+            self.failed_countries = []
+            for future in as_completed(futures):
+                try:
+                    task = future.result()
+                except Exception as e:
+                    self.failed_countries.append(futures[future])
+                    print(f"Worker failed for country code {futures[future]}: {e}")
+                    continue
+                task_results.append(task)
+                # 워커 프로세스에서는 콜백이 없으므로 완료된 국가의 레코드로 부모에서 진행률을 보고
+                if self.progress_callback is not None:
+                    for movie in task["movies"]:
+                        self.progress_callback(movie)
+
+        for task in task_results:
+            movies_by_code.setdefault(task["country_code"], []).extend(task["movies"])
+            self.new_fingerprints.update(task["fingerprints"])
+        self.worker_stats = self.summarize_worker_stats(task_results)
+        for task in task_results:
+            for name, timings in task["wait_timings"].items():
+                self.wait_timings[name].extend(timings)
+            for name, count in task["wait_timeouts"].items():
+                self.wait_timeouts[name] += count
+        for pid, worker in self.worker_stats.items():
+            print(
+                f"[worker {pid}] countries={worker['countries']} movies={worker['movies']} "
+                f"elapsed={worker['elapsed']:.1f}s ({worker['movies_per_sec']:.2f} movies/s)"
+            )
+        print(f"Parallel crawl finished in {time.perf_counter() - started:.1f}s")
+        self.print_wait_summary()
+
+        return self.compact_journal(country_code_dict, movies_by_code)
+
+    def crawling_scheduled(self, rate: float = 1.0, burst: int = 5, max_concurrency: int = 2, priorities: dict = None):
+        """
+        CrawlScheduler로 국가 작업을 우선순위 순서로, 요청 예산과 최대 동시 실행 수 안에서 실행하는 크롤링 함수
+
+        :param rate: 호스트당 초당 허용 요청 수
+        :param burst: 호스트당 최대 버스트
+        :param max_concurrency: 동시에 실행할 최대 국가 작업 수
+        :param priorities: {국가 코드: 'high' | 'normal' | 'low'}
+        :return: {"movies": [...]} 형태의 결과 (crawling()과 동일)
+        """
+        country_code_dict = self.load_country_code_dict()
+        if not country_code_dict:
+            return {"movies": []}
+
+        self.load_fingerprints()
+        movies_by_code = self.load_completed_movies(country_code_dict)
+        scheduler = CrawlScheduler(self, rate=rate, burst=burst, max_concurrency=max_concurrency, priorities=priorities)
+        for country_code, country in country_code_dict.items():
+            skip_ranks = {movie["rank"] for movie in movies_by_code.get(country_code, [])}
+            if len(skip_ranks) < self.top_n:
+                scheduler.submit(country_code, country, skip_ranks)
 
+        for country_code, movies in scheduler.run().items():
+            movies_by_code.setdefault(country_code, []).extend(movies)
+
+        self.scheduler_stats = scheduler.stats()
+        print(
+            f"[scheduler] requests={self.scheduler_stats['requests']} "
+            f"({self.scheduler_stats['requests_per_sec']:.2f} req/s) "
+            f"max_queue_depth={self.scheduler_stats['max_queue_depth']} "
+            f"failed={self.scheduler_stats['failed']} rate_scale={self.scheduler_stats['rate_scale']:.2f}"
+        )
+        self.print_wait_summary()
+        return self.compact_journal(country_code_dict, movies_by_code)
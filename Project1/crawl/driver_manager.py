@@ -0,0 +1,160 @@
+import os
+import threading
+from multiprocessing.util import Finalize
+
+from webdriver_manager.chrome import ChromeDriverManager
+
+# 프로세스 단위 캐시: 드라이버 바이너리 경로와 스레드별로 재사용 중인 브라우저 세션
+_driver_path = None
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+DRIVER_PATH_CACHE = './crawl/data/cache/chromedriver_path.txt'
+
+
+def resolve_driver_path(cache_path: str = DRIVER_PATH_CACHE) -> str:
+    """
+    ChromeDriver 바이너리 경로를 프로세스당 한 번만 확인하는 함수.
+    CHROMEDRIVER_PATH 환경 변수 -> 캐시 파일(오프라인) -> ChromeDriverManager 순서로 찾는다.
+
+    :param cache_path: 확인된 경로를 저장하는 캐시 파일 경로
+    :return: 드라이버 바이너리 경로
+    """
+    global _driver_path
+    if _driver_path and os.path.exists(_driver_path):
+        return _driver_path
+
+    candidates = [os.environ.get('CHROMEDRIVER_PATH')]
+    if os.path.exists(cache_path):
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            candidates.append(f.read().strip())
+    for candidate in candidates:
+        if candidate and os.path.exists(candidate):
+            _driver_path = candidate
+            return _driver_path
+
+    _driver_path = ChromeDriverManager().install()
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            f.write(_driver_path)
+    except OSError as e:
+        print(f"Failed to cache driver path: {e}")
+    return _driver_path
+
+
+class DriverSession:
+    """
+    국가가 바뀌어도 브라우저를 계속 띄워 두고 재사용하는 WebDriver 세션.
+    국가 사이에는 쿠키/스토리지를 초기화하며, max_pages 페이지를 처리했거나
+    JS 힙 사용량이 max_memory_mb를 넘으면 브라우저를 새로 띄운다.
+    """
+
+    def __init__(self, driver_factory, max_pages: int = 30, max_memory_mb: int = 1024):
+        """
+        :param driver_factory: 새 WebDriver를 생성하는 함수
+        :param max_pages: 브라우저 하나로 처리할 최대 페이지(국가) 수
+        :param max_memory_mb: 브라우저 재시작 기준 JS 힙 사용량(MB)
+        """
+        self.driver_factory = driver_factory
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self.driver = None
+        self.pages = 0
+        self.launches = 0
+
+    def acquire(self):
+        """
+        다음 페이지에 사용할 WebDriver를 반환하는 함수 (필요 시 재시작, 아니면 상태 초기화)
+
+        :return: WebDriver 인스턴스
+        """
+        if self.driver is not None and self.needs_recycle():
+            self.discard()
+        if self.driver is None:
+            self.driver = self.driver_factory()
+            self.launches += 1
+            self.pages = 0
+        else:
+            self.reset()
+        self.pages += 1
+        return self.driver
+
+    def needs_recycle(self) -> bool:
+        """페이지 수 또는 메모리 기준을 넘었는지 확인"""
+        if self.pages >= self.max_pages:
+            return True
+        return self.memory_usage_mb() > self.max_memory_mb
+
+    def memory_usage_mb(self) -> float:
+        """현재 페이지의 JS 힙 사용량(MB), 확인할 수 없으면 0"""
+        try:
+            used = self.driver.execute_script(
+                'return window.performance && performance.memory ? performance.memory.usedJSHeapSize : 0'
+            )
+            return (used or 0) / (1024 * 1024)
+        except Exception:
+            return 0.0
+
+    def reset(self):
+        """이전 국가의 상태(스토리지, 쿠키, 열린 페이지) 초기화"""
+        try:
+            self.driver.execute_script('window.localStorage.clear(); window.sessionStorage.clear();')
+        except Exception:
+            pass
+        try:
+            self.driver.delete_all_cookies()
+            self.driver.get('about:blank')
+        except Exception as e:
+            print(f"Failed to reset browser, restarting: {e}")
+            self.discard()
+            self.driver = self.driver_factory()
+            self.launches += 1
+            self.pages = 0
+
+    def discard(self):
+        """브라우저 종료 (다음 acquire에서 새로 띄움)"""
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+        self.driver = None
+
+    close = discard
+
+
+def get_process_session(driver_factory, max_pages: int = 30, max_memory_mb: int = 1024) -> DriverSession:
+    """
+    현재 프로세스(스레드별)의 DriverSession을 반환하는 함수 (프로세스 종료 시 브라우저도 종료)
+
+    :param driver_factory: 새 WebDriver를 생성하는 함수
+    :param max_pages: 브라우저 하나로 처리할 최대 페이지(국가) 수
+    :param max_memory_mb: 브라우저 재시작 기준 JS 힙 사용량(MB)
+    :return: DriverSession 인스턴스
+    """
+    key = threading.get_ident()
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = _sessions[key] = DriverSession(driver_factory, max_pages, max_memory_mb)
+            # 워커 프로세스는 atexit 대신 multiprocessing 종료 처리기에서 정리됨
+            Finalize(session, session.close, exitpriority=10)
+    return session
+
+
+def close_process_session():
+    """현재 스레드의 DriverSession 종료"""
+    with _sessions_lock:
+        session = _sessions.pop(threading.get_ident(), None)
+    if session is not None:
+        session.close()
+
+
+def close_all_sessions():
+    """현재 프로세스의 모든 DriverSession 종료"""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
@@ -0,0 +1,76 @@
+import json
+import os
+import time
+import uuid
+
+
+class CrawlJournal:
+    """
+    크롤링 중 완료된 영화 레코드를 한 줄씩 추가 기록하는 JSON Lines 저널.
+    중단된 크롤링을 이어서 진행할 때 완료된 (국가, 순위) 쌍을 건너뛰는 데 사용한다.
+    각 줄은 {"run_id", "ts", "record"} 형태이며, max_age보다 오래된 기록은 이어서 진행할 때 무시한다.
+    """
+
+    def __init__(self, path: str, max_age: float = 24 * 60 * 60):
+        """
+        :param path: 저널 파일 경로
+        :param max_age: 이어서 진행할 때 사용할 기록의 최대 나이(초), None이면 제한 없음
+        """
+        self.path = path
+        self.max_age = max_age
+        self.run_id = uuid.uuid4().hex
+
+    def append(self, record: dict):
+        """
+        레코드 하나를 저널 끝에 추가하는 함수 (한 번의 write로 한 줄 전체를 기록)
+
+        :param record: transform_content_to_result 형태의 영화 레코드
+        """
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        line = json.dumps({'run_id': self.run_id, 'ts': time.time(), 'record': record}, ensure_ascii=False) + '\n'
+        # 이전 실행이 줄 중간에서 중단되었으면 새 기록이 깨진 줄에 붙지 않도록 줄을 끝냄
+        if not self._ends_with_newline():
+            line = '\n' + line
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(line)
+            f.flush()
+
+    def load(self) -> dict:
+        """
+        저널에 기록된 레코드를 읽는 함수.
+        쓰기 도중 중단되어 깨진 줄과 max_age보다 오래된 기록은 무시하며, 같은 (국가, 순위)는 나중 기록이 우선한다.
+
+        :return: {(국가 이름, 순위): 레코드} 딕셔너리
+        """
+        records = {}
+        if not os.path.exists(self.path):
+            return records
+        oldest = time.time() - self.max_age if self.max_age is not None else None
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    if oldest is not None and entry['ts'] < oldest:
+                        continue
+                    record = entry['record']
+                    records[(record['country'], record['rank'])] = record
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue
+        return records
+
+    def _ends_with_newline(self) -> bool:
+        """저널 파일이 없거나 비어 있거나 마지막 바이트가 줄바꿈이면 True"""
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    return True
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) == b'\n'
+        except FileNotFoundError:
+            return True
+
+    def clear(self):
+        """저널 파일 삭제"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,222 @@
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urlparse
+
+from crawl.driver_manager import close_all_sessions
+
+# 우선순위 클래스 (값이 작을수록 먼저 실행)
+PRIORITY_CLASSES = {
+    'high': 0,
+    'normal': 1,
+    'low': 2,
+}
+
+
+class TokenBucket:
+    """
+    초당 rate개의 토큰이 최대 burst개까지 쌓이는 토큰 버킷.
+    rate_scale을 줄이면(백오프) 토큰 충전 속도가 그만큼 느려진다.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, clock=time.monotonic, sleep=time.sleep):
+        """
+        :param rate: 초당 허용 요청 수
+        :param burst: 한 번에 몰아서 보낼 수 있는 최대 요청 수
+        :param clock: 시간 함수 (테스트용으로 교체 가능)
+        :param sleep: 대기 함수 (테스트용으로 교체 가능)
+        """
+        self.rate = rate
+        self.burst = burst
+        self.rate_scale = 1.0
+        self.tokens = float(burst)
+        self.clock = clock
+        self.sleep = sleep
+        self.updated_at = clock()
+        self.lock = threading.Lock()
+
+    def refill(self):
+        """경과 시간만큼 토큰 충전 (lock을 잡은 상태에서 호출)"""
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate * self.rate_scale)
+        self.updated_at = now
+
+    def acquire(self, tokens: int = 1) -> float:
+        """
+        토큰을 얻을 때까지 대기하는 함수
+
+        :param tokens: 필요한 토큰 수
+        :return: 대기한 시간(초)
+        """
+        waited = 0.0
+        while True:
+            with self.lock:
+                self.refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return waited
+                delay = (tokens - self.tokens) / (self.rate * self.rate_scale)
+            self.sleep(delay)
+            waited += delay
+
+
+class HostRateLimiter:
+    """호스트별 TokenBucket으로 요청 속도를 제한하고, 처리한 요청 수를 기록하는 클래스"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        :param rate: 호스트당 초당 허용 요청 수
+        :param burst: 호스트당 최대 버스트
+        """
+        self.rate = rate
+        self.burst = burst
+        self.buckets = {}
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def bucket(self, host: str) -> TokenBucket:
+        """호스트의 TokenBucket 반환 (없으면 생성)"""
+        with self.lock:
+            if host not in self.buckets:
+                self.buckets[host] = TokenBucket(self.rate, self.burst)
+            return self.buckets[host]
+
+    def acquire(self, url: str) -> float:
+        """
+        url의 호스트 예산에서 요청 하나를 허가받는 함수
+
+        :param url: 요청할 URL
+        :return: 대기한 시간(초)
+        """
+        waited = self.bucket(urlparse(url).netloc).acquire()
+        with self.lock:
+            self.requests += 1
+        return waited
+
+    def set_rate_scale(self, scale: float):
+        """모든 호스트의 충전 속도 배율 변경 (백오프/회복)"""
+        with self.lock:
+            buckets = list(self.buckets.values())
+        for bucket in buckets:
+            with bucket.lock:
+                bucket.refill()
+                bucket.rate_scale = scale
+
+
+class CrawlScheduler:
+    """
+    MovieCrawler 앞에서 국가 단위 작업을 우선순위 순서로, 최대 동시 실행 수와
+    호스트별 요청 예산(토큰 버킷) 안에서 실행하는 스케줄러.
+    최근 작업의 오류율이 기준을 넘으면 요청 속도를 절반으로 줄이고, 안정되면 천천히 회복한다.
+    """
+
+    def __init__(self, crawler, rate: float = 1.0, burst: int = 5, max_concurrency: int = 2,
+                 priorities: dict = None, error_threshold: float = 0.3, error_window: int = 10,
+                 min_rate_scale: float = 0.1):
+        """
+        :param crawler: MovieCrawler 인스턴스
+        :param rate: 호스트당 초당 허용 요청 수
+        :param burst: 호스트당 최대 버스트
+        :param max_concurrency: 동시에 실행할 최대 국가 작업 수
+        :param priorities: {국가 코드: 'high' | 'normal' | 'low'} (없으면 'normal')
+        :param error_threshold: 백오프를 시작할 최근 오류율
+        :param error_window: 오류율을 계산할 최근 작업 수
+        :param min_rate_scale: 백오프 시 최소 속도 배율
+        """
+        self.crawler = crawler
+        self.limiter = HostRateLimiter(rate, burst)
+        self.max_concurrency = max_concurrency
+        self.priorities = priorities or {}
+        self.error_threshold = error_threshold
+        self.outcomes = deque(maxlen=error_window)
+        self.min_rate_scale = min_rate_scale
+        self.rate_scale = 1.0
+        self.queue = []
+        self.sequence = itertools.count()
+        self.started_at = None
+        self.max_queue_depth = 0
+        self.completed = 0
+        self.failed = 0
+
+    def submit(self, country_code: str, country: str, skip_ranks=()):
+        """
+        국가 작업을 우선순위 큐에 추가하는 함수 (같은 우선순위는 추가 순서대로 실행)
+
+        :param country_code: 국가 코드
+        :param country: 국가 이름
+        :param skip_ranks: 이미 완료되어 건너뛸 순위 목록
+        """
+        priority = PRIORITY_CLASSES.get(self.priorities.get(country_code, 'normal'), PRIORITY_CLASSES['normal'])
+        heapq.heappush(self.queue, (priority, next(self.sequence), country_code, country, skip_ranks))
+        self.max_queue_depth = max(self.max_queue_depth, len(self.queue))
+
+    def record_outcome(self, success: bool):
+        """작업 결과를 기록하고 오류율에 따라 요청 속도를 조절하는 함수"""
+        self.outcomes.append(success)
+        error_rate = self.outcomes.count(False) / len(self.outcomes)
+        if error_rate > self.error_threshold:
+            self.rate_scale = max(self.min_rate_scale, self.rate_scale / 2)
+        else:
+            self.rate_scale = min(1.0, self.rate_scale * 1.25)
+        self.limiter.set_rate_scale(self.rate_scale)
+
+    def run_job(self, country_code: str, country: str, skip_ranks) -> list:
+        """국가 작업 하나를 실행 (워커 스레드)"""
+        return self.crawler.crawl_country(country_code, country, skip_ranks)
+
+    def run(self) -> dict:
+        """
+        큐가 빌 때까지 작업을 실행하는 함수
+
+        :return: {국가 코드: 영화 정보 리스트} 딕셔너리
+        """
+        self.started_at = time.monotonic()
+        self.crawler.rate_limiter = self.limiter
+        movies_by_code = {}
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                running = {}
+                while self.queue or running:
+                    while self.queue and len(running) < self.max_concurrency:
+                        _, _, country_code, country, skip_ranks = heapq.heappop(self.queue)
+                        future = executor.submit(self.run_job, country_code, country, skip_ranks)
+                        running[future] = (country_code, self.crawler.top_n - len(skip_ranks))
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        country_code, expected = running.pop(future)
+                        try:
+                            movies = future.result()
+                        except Exception as e:
+                            print(f"Scheduled job failed for country code {country_code}: {e}")
+                            movies = []
+                        movies_by_code[country_code] = movies
+                        success = len(movies) >= expected
+                        self.completed += 1
+                        self.failed += 0 if success else 1
+                        self.record_outcome(success)
+        finally:
+            self.crawler.rate_limiter = None
+            close_all_sessions()
+        return movies_by_code
+
+    def stats(self) -> dict:
+        """
+        처리량 조정을 위한 현재 통계
+
+        :return: {'requests', 'elapsed', 'requests_per_sec', 'queue_depth', 'max_queue_depth',
+                  'completed', 'failed', 'rate_scale'} 딕셔너리
+        """
+        elapsed = time.monotonic() - self.started_at if self.started_at else 0.0
+        return {
+            'requests': self.limiter.requests,
+            'elapsed': elapsed,
+            'requests_per_sec': self.limiter.requests / elapsed if elapsed else 0.0,
+            'queue_depth': len(self.queue),
+            'max_queue_depth': self.max_queue_depth,
+            'completed': self.completed,
+            'failed': self.failed,
+            'rate_scale': self.rate_scale,
+        }
@@ -0,0 +1,310 @@
+import json
+import os
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+from django.test import SimpleTestCase
+from selenium.common.exceptions import TimeoutException
+
+from crawl import driver_manager
+from crawl.backends import HttpSearchBackend, SearchPageParseError
+from crawl.crawler import MovieCrawler
+from crawl.driver_manager import DriverSession
+from crawl.scheduler import CrawlScheduler, TokenBucket
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'fixtures')
+
+
+class FixtureSearchHandler(BaseHTTPRequestHandler):
+    """`/search/title/?countries=XX` 요청에 저장된 HTML fixture를 돌려주는 로컬 IMDb 대역"""
+
+    def do_GET(self):
+        country_code = parse_qs(urlparse(self.path).query).get('countries', [''])[0]
+        fixture_path = os.path.join(FIXTURE_DIR, f'imdb_search_{country_code}.html')
+        if os.path.exists(fixture_path):
+            with open(fixture_path, 'rb') as f:
+                body = f.read()
+        else:
+            body = b'<html><body>no embedded data</body></html>'
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class HttpBackendCrawlTest(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureSearchHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.crawler = MovieCrawler(top_n=3, backend='http')
+        self.crawler.journal.path = os.path.join(self.tmpdir.name, 'movies_data_country.journal.jsonl')
+        self.crawler.save_at = os.path.join(self.tmpdir.name, 'movies_data_country.json')
+        self.crawler.fingerprints_path = os.path.join(self.tmpdir.name, 'country_fingerprints.json')
+        self.crawler.BASE_URL = f'http://127.0.0.1:{self.server.server_port}/search/title/?countries={{}}'
+
+    def test_crawl_country_from_fixture(self):
+        # 브라우저 없이 검색 페이지 요청 한 번으로 끝나야 함 (selenium 경로나 sleep 없음)
+        with mock.patch.object(HttpSearchBackend, 'fetch', autospec=True, side_effect=HttpSearchBackend.fetch) as fetch, \
+                mock.patch.object(MovieCrawler, 'crawl_country_selenium') as selenium, \
+                mock.patch('crawl.crawler.time.sleep') as sleep:
+            movies = self.crawler.crawl_country('KR', 'South Korea')
+        fetch.assert_called_once()
+        selenium.assert_not_called()
+        sleep.assert_not_called()
+
+        self.assertEqual([movie['rank'] for movie in movies], [1, 2, 3])
+        first = movies[0]
+        self.assertEqual(first['country'], 'South Korea')
+        self.assertEqual(first['movie']['title'], '오징어 게임')
+        self.assertEqual(first['movie']['release_year'], '2021–2025')
+        self.assertEqual(first['movie']['score'], '8.0')
+        self.assertEqual(first['movie']['genres'], ['Action', 'Drama', 'Mystery'])
+        self.assertEqual(first['movie']['actors'], ['Lee Jung-jae', 'Park Hae-soo', 'Nandito Hidayattullah Putra'])
+        self.assertTrue(first['movie']['image_url'].startswith('https://m.media-amazon.com/'))
+        self.assertEqual(movies[2]['movie']['release_year'], '2019')
+
+    def test_falls_back_to_selenium_when_parsing_fails(self):
+        with mock.patch.object(MovieCrawler, 'crawl_country_selenium', return_value=['selenium']) as selenium:
+            self.assertEqual(self.crawler.crawl_country('US', 'United States'), ['selenium'])
+        selenium.assert_called_once_with('US', 'United States', ())
+
+    def test_null_fields_in_item_are_tolerated_or_fall_back(self):
+        backend = HttpSearchBackend()
+        item = {
+            'titleText': {'text': 'Parasite'}, 'titleGenres': None, 'genres': None,
+            'principalCredits': [{'category': {'text': 'Stars'}, 'credits': [{'name': None}]}],
+        }
+        content = backend.parse_item(item, 1)
+        self.assertEqual(content['genre'], [])
+        self.assertEqual(content['stars'], [])
+
+        html = '<script id="__NEXT_DATA__">{}</script>'.format(json.dumps({
+            'props': {'pageProps': {'searchResults': {'titleResults': {'titleListItems': [item, None, item]}}}}
+        }))
+        with self.assertRaises(SearchPageParseError):
+            backend.parse(html, 3)
+
+        with mock.patch.object(HttpSearchBackend, 'fetch', return_value=html), \
+                mock.patch.object(MovieCrawler, 'crawl_country_selenium', return_value=['selenium']) as selenium:
+            self.assertEqual(self.crawler.crawl_country('KR', 'South Korea'), ['selenium'])
+        selenium.assert_called_once()
+
+    def test_unchanged_country_reuses_previous_records(self):
+        self.crawler.load_country_codes = lambda: {'KR': 'South Korea'}
+        first = self.crawler.crawling()
+
+        with mock.patch.object(MovieCrawler, 'transform_content_to_result') as transform:
+            second = self.crawler.crawling()
+
+        transform.assert_not_called()
+        self.assertEqual(second, first)
+        self.assertEqual(len(second['movies']), 3)
+
+
+class WaitTelemetryTest(SimpleTestCase):
+    def test_timed_wait_records_duration_and_timeouts(self):
+        crawler = MovieCrawler()
+        ready, absent = mock.Mock(), mock.Mock()
+        ready.until.return_value = 'element'
+        absent.until.side_effect = TimeoutException()
+
+        self.assertEqual(crawler.timed_wait('modal_open', ready, None), 'element')
+        with self.assertRaises(TimeoutException):
+            crawler.timed_wait('field:score', absent, None)
+
+        summary = crawler.wait_summary()
+        self.assertEqual(summary['modal_open']['count'], 1)
+        self.assertEqual(summary['modal_open']['timeouts'], 0)
+        self.assertEqual(summary['field:score']['timeouts'], 1)
+
+
+class BatchedModalExtractionTest(SimpleTestCase):
+    def test_single_script_call_with_declarative_spec(self):
+        crawler = MovieCrawler()
+        driver = mock.Mock()
+        driver.execute_script.return_value = {'title': 'Gisaengchung', 'genre': ['Drama'], 'stars': []}
+
+        content = crawler.scrape_modal(driver)
+
+        self.assertEqual(content['title'], 'Gisaengchung')
+        driver.execute_script.assert_called_once()
+        driver.find_element.assert_not_called()
+        _, fields, lists = driver.execute_script.call_args.args
+        self.assertEqual(set(fields), set(crawler.RELATIVE_XPATHS))
+        self.assertEqual(lists['genre'], crawler.BASE_XPATH + '/div[1]/div[2]/ul[2]/li')
+
+
+class ResumableCrawlTest(SimpleTestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.crawler = MovieCrawler(top_n=2)
+        self.crawler.save_at = os.path.join(self.tmpdir.name, 'movies_data_country.json')
+        self.crawler.journal.path = os.path.join(self.tmpdir.name, 'movies_data_country.journal.jsonl')
+        self.crawler.load_country_codes = lambda: {'KR': 'South Korea', 'US': 'United States'}
+
+    def record(self, country, rank):
+        return {'country': country, 'movie': {'title': f'{country} #{rank}'}, 'rank': rank}
+
+    def fake_selenium(self, country_code, country, skip_ranks=()):
+        movies = []
+        for rank in range(1, self.crawler.top_n + 1):
+            if rank not in skip_ranks:
+                self.crawler.record_movie(movies, self.record(country, rank))
+        return movies
+
+    def test_resume_skips_completed_pairs_and_compacts(self):
+        self.crawler.journal.append(self.record('South Korea', 1))
+        self.crawler.journal.append(self.record('South Korea', 2))
+        self.crawler.journal.append(self.record('United States', 2))
+        with open(self.crawler.journal.path, 'a', encoding='utf-8') as f:
+            f.write('{"country": "United St')  # 기록 도중 중단된 줄
+
+        with mock.patch.object(MovieCrawler, 'crawl_country_selenium', side_effect=self.fake_selenium) as selenium:
+            result = self.crawler.crawling()
+
+        selenium.assert_called_once_with('US', 'United States', {2})
+        self.assertEqual(
+            [(movie['country'], movie['rank']) for movie in result['movies']],
+            [('South Korea', 1), ('South Korea', 2), ('United States', 1), ('United States', 2)],
+        )
+        with open(self.crawler.save_at, encoding='utf-8') as f:
+            self.assertEqual(json.load(f), result)
+        self.assertFalse(os.path.exists(self.crawler.journal.path))
+
+    def test_iter_movies_keeps_journal_until_every_country_is_complete(self):
+        self.crawler.fingerprints_path = os.path.join(self.tmpdir.name, 'country_fingerprints.json')
+
+        def partial_selenium(country_code, country, skip_ranks=()):
+            # United States는 1위만 크롤링하고 실패
+            if country_code == 'US':
+                return self.fake_selenium(country_code, country, set(skip_ranks) | {2})
+            return self.fake_selenium(country_code, country, skip_ranks)
+
+        with mock.patch.object(MovieCrawler, 'crawl_country_selenium', side_effect=partial_selenium):
+            first = list(self.crawler.iter_movies())
+        self.assertEqual(len(first), 3)
+        self.assertTrue(os.path.exists(self.crawler.journal.path))
+        self.assertFalse(os.path.exists(self.crawler.fingerprints_path))
+
+        with mock.patch.object(MovieCrawler, 'crawl_country_selenium', side_effect=self.fake_selenium) as selenium:
+            second = list(self.crawler.iter_movies())
+        selenium.assert_called_once_with('US', 'United States', {1})
+        self.assertEqual(len(second), 4)
+        self.assertFalse(os.path.exists(self.crawler.journal.path))
+
+    def test_journal_repairs_truncated_line_and_ignores_expired_entries(self):
+        journal = self.crawler.journal
+        with open(journal.path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'run_id': 'old', 'ts': 0, 'record': self.record('South Korea', 1)}) + '\n')
+            f.write('{"run_id": "old", "ts": 0, "rec')  # 기록 도중 중단된 줄
+
+        journal.append(self.record('United States', 1))
+
+        # 깨진 줄 뒤에 붙지 않고 새 줄로 기록되며, max_age보다 오래된 기록은 무시됨
+        self.assertEqual(list(journal.load()), [('United States', 1)])
+        journal.max_age = None
+        self.assertEqual(set(journal.load()), {('South Korea', 1), ('United States', 1)})
+
+
+class DriverSessionTest(SimpleTestCase):
+    def test_warm_browser_is_reset_and_recycled_after_max_pages(self):
+        drivers = []
+
+        def factory():
+            driver = mock.Mock()
+            driver.execute_script.return_value = 0
+            drivers.append(driver)
+            return driver
+
+        session = DriverSession(factory, max_pages=2, max_memory_mb=512)
+        first = session.acquire()
+        self.assertIs(session.acquire(), first)
+        first.delete_all_cookies.assert_called_once()
+        first.get.assert_called_once_with('about:blank')
+
+        third = session.acquire()
+        self.assertIsNot(third, first)
+        first.quit.assert_called_once()
+        self.assertEqual(session.launches, 2)
+
+    def test_memory_ceiling_triggers_recycle(self):
+        session = DriverSession(mock.Mock, max_pages=100, max_memory_mb=1)
+        first = session.acquire()
+        first.execute_script.return_value = 2 * 1024 * 1024
+        self.assertIsNot(session.acquire(), first)
+
+    def test_driver_path_resolved_from_offline_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            binary = os.path.join(tmpdir, 'chromedriver')
+            cache_path = os.path.join(tmpdir, 'chromedriver_path.txt')
+            open(binary, 'w').close()
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                f.write(binary)
+            with mock.patch.object(driver_manager, '_driver_path', None), \
+                    mock.patch.object(driver_manager, 'ChromeDriverManager') as manager:
+                self.assertEqual(driver_manager.resolve_driver_path(cache_path), binary)
+            manager.assert_not_called()
+
+
+class CrawlSchedulerTest(SimpleTestCase):
+    def test_token_bucket_waits_for_refill(self):
+        now = [0.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        bucket = TokenBucket(rate=2, burst=2, clock=lambda: now[0], sleep=sleep)
+        bucket.acquire()
+        bucket.acquire()
+        self.assertAlmostEqual(bucket.acquire(), 0.5)
+        self.assertEqual(sleeps, [0.5])
+
+    def test_priority_order_and_backoff_on_errors(self):
+        crawler = MovieCrawler(top_n=1)
+        order = []
+
+        def crawl_country(country_code, country, skip_ranks=()):
+            crawler.throttle()
+            order.append(country_code)
+            return [] if country_code == 'BR' else [{'rank': 1}]
+
+        crawler.crawl_country = crawl_country
+        scheduler = CrawlScheduler(
+            crawler, rate=1000, burst=10, max_concurrency=1,
+            priorities={'US': 'high', 'BR': 'low'}, error_threshold=0.2,
+        )
+        for country_code in ('KR', 'BR', 'US'):
+            scheduler.submit(country_code, country_code)
+
+        movies_by_code = scheduler.run()
+
+        self.assertEqual(order, ['US', 'KR', 'BR'])
+        self.assertEqual(movies_by_code['BR'], [])
+        stats = scheduler.stats()
+        self.assertEqual(stats['requests'], 3)
+        self.assertEqual(stats['max_queue_depth'], 3)
+        self.assertEqual(stats['queue_depth'], 0)
+        self.assertEqual(stats['failed'], 1)
+        self.assertLess(stats['rate_scale'], 1.0)
@@ -6,6 +6,10 @@ admin.site.register(Genre)
 admin.site.register(Actor)
 admin.site.register(Movie)
 admin.site.register(Ranking)
+admin.site.register(CountryLeaderboard)
+admin.site.register(RankingSnapshot)
+admin.site.register(RankingDelta)
+admin.site.register(CrawlJob)
 
 # 이미 등록된 경우 중복 등록 방지
 if MovieActor not in admin.site._registry:
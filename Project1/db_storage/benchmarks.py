@@ -0,0 +1,258 @@
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+
+import django
+from django.conf import settings
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from .interning import clear_interning_caches, country_ids
+from .utils import get_movies_by_country_name, save_movies_from_json
+
+GENRE_POOL = [
+    'Action', 'Adventure', 'Animation', 'Biography', 'Comedy', 'Crime', 'Documentary', 'Drama', 'Family',
+    'Fantasy', 'History', 'Horror', 'Music', 'Mystery', 'Romance', 'Sci-Fi', 'Sport', 'Thriller', 'War', 'Western',
+]
+
+
+def generate_records(countries: int = 10, ranks: int = 10, genres_per_movie: int = 3, actors_per_movie: int = 5,
+                     overlap: float = 0.3, seed: int = 0) -> list[dict]:
+    '''
+    크롤링 결과와 같은 형태의 합성 영화 레코드를 만드는 함수 (seed가 같으면 항상 같은 결과)
+
+    Args:
+        countries: 국가 수
+        ranks: 국가별 순위 수
+        genres_per_movie: 영화별 장르 수
+        actors_per_movie: 영화별 배우 수
+        overlap: 다른 국가에 이미 나온 영화를 다시 쓰는 비율 (0~1)
+        seed: 난수 seed
+    Returns:
+        list[dict]: [{'country', 'movie', 'rank'}] 국가 순서대로 정렬된 레코드
+    '''
+    rng = random.Random(seed)
+    actor_pool = [f'Actor {i}' for i in range(max(actors_per_movie, countries * ranks * actors_per_movie // 4))]
+    movies = []
+    records = []
+    for country_index in range(countries):
+        country = f'Country {country_index:03d}'
+        # 한 국가 안에서는 같은 영화가 두 번 나오지 않도록 이미 쓴 영화는 제외
+        # (후보 목록을 매번 만들지 않고 무작위로 고른 뒤 겹치면 다시 고름)
+        used = set()
+        for rank in range(1, ranks + 1):
+            index = None
+            if len(used) < len(movies) and rng.random() < overlap:
+                index = rng.randrange(len(movies))
+                while index in used:
+                    index = rng.randrange(len(movies))
+            if index is None:
+                index = len(movies)
+                movies.append({
+                    'title': f'Movie {index:05d}',
+                    'release_year': str(rng.randint(1950, 2024)),
+                    'score': f'{rng.randint(10, 99) / 10:.1f}',
+                    'summary': f'Synthetic summary for movie {index}.',
+                    'image_url': f'https://example.com/images/{index}.jpg',
+                    'genres': rng.sample(GENRE_POOL, min(genres_per_movie, len(GENRE_POOL))),
+                    'actors': rng.sample(actor_pool, actors_per_movie),
+                })
+            used.add(index)
+            records.append({'country': country, 'movie': dict(movies[index]), 'rank': rank})
+    return records
+
+
+def measure(phase: str, fn) -> dict:
+    '''
+    fn 실행의 경과 시간, SQL 쿼리 수, 최대 메모리(tracemalloc)를 측정하는 함수
+
+    Returns:
+        dict: {'phase', 'seconds', 'queries', 'peak_kib'}
+    '''
+    tracemalloc.start()
+    try:
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            fn()
+            seconds = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'phase': phase, 'seconds': round(seconds, 6), 'queries': len(queries), 'peak_kib': round(peak / 1024, 1)}
+
+
+def run_benchmarks(countries: int = 10, ranks: int = 10, genres_per_movie: int = 3, actors_per_movie: int = 5,
+                   overlap: float = 0.3, seed: int = 0, keep: bool = False) -> dict:
+    '''
+    합성 데이터로 저장(ingest), 재저장(re-ingest), 국가별 조회(read)를 측정하는 함수.
+    keep이 False이면 측정이 끝난 뒤 저장한 데이터를 모두 롤백한다.
+
+    Returns:
+        dict: {'params', 'environment', 'results'}
+    '''
+    params = {
+        'countries': countries, 'ranks': ranks, 'genres_per_movie': genres_per_movie,
+        'actors_per_movie': actors_per_movie, 'overlap': overlap, 'seed': seed,
+    }
+    records = generate_records(**params)
+    country_names = list(dict.fromkeys(record['country'] for record in records))
+
+    results = []
+    try:
+        with transaction.atomic():
+            results.append(measure('ingest', lambda: save_movies_from_json(records)))
+            results.append(measure('reingest', lambda: save_movies_from_json(records)))
+            # 조회는 커밋된 뒤처럼 국가 이름 캐시가 채워진 상태에서 측정
+            country_ids.preload(country_names)
+            reads = [measure('read', lambda name=name: get_movies_by_country_name(name)) for name in country_names]
+            if reads:
+                results.append({
+                    'phase': 'read_per_country',
+                    'seconds': round(sum(r['seconds'] for r in reads) / len(reads), 6),
+                    'seconds_max': max(r['seconds'] for r in reads),
+                    'queries': round(sum(r['queries'] for r in reads) / len(reads), 2),
+                    'peak_kib': max(r['peak_kib'] for r in reads),
+                })
+            if not keep:
+                transaction.set_rollback(True)
+    finally:
+        # 롤백되었을 수 있는 id가 캐시에 남지 않도록 비움
+        clear_interning_caches()
+
+    return {
+        'params': {**params, 'records': len(records), 'unique_movies': len({r['movie']['title'] for r in records})},
+        'environment': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+        },
+        'results': results,
+    }
+
+
+def _sqlite_connect(path: str, pragmas: list) -> sqlite3.Connection:
+    '''Django 설정을 거치지 않는 sqlite3 연결 (pragmas 를 연결마다 실행)'''
+    conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+    for pragma in pragmas:
+        conn.execute(f'PRAGMA {pragma}')
+    return conn
+
+
+def measure_read_latency(pragmas: list, records: list, batch_size: int = 50, rounds: int = 20, seed: int = 0) -> dict:
+    '''
+    임시 SQLite 파일에서 배치 단위 저장(쓰기 스레드)과 국가별 랭킹 조회(읽기 스레드)를 동시에 실행해
+    조회 지연 시간을 측정하는 함수
+
+    Args:
+        pragmas: 연결마다 실행할 PRAGMA 목록 ([]이면 SQLite 기본값)
+        records: generate_records 결과
+        batch_size: 커밋 한 번에 저장할 레코드 수
+        rounds: records 전체를 반복 저장할 횟수 (조회가 충분히 겹치도록)
+    Returns:
+        dict: {'reads', 'read_p50_ms', 'read_p95_ms', 'read_max_ms', 'ingest_seconds'}
+    '''
+    with tempfile.TemporaryDirectory(prefix='sqlite-bench-') as tmpdir:
+        path = os.path.join(tmpdir, 'bench.sqlite3')
+        writer = _sqlite_connect(path, pragmas)
+        writer.executescript('''
+            CREATE TABLE movie (id INTEGER PRIMARY KEY, title TEXT, summary TEXT, score REAL);
+            CREATE TABLE ranking (id INTEGER PRIMARY KEY, country TEXT, rank INTEGER, movie_id INTEGER);
+            CREATE INDEX ranking_country ON ranking (country, rank);
+        ''')
+        countries = list(dict.fromkeys(record['country'] for record in records))
+
+        def insert(batch):
+            with writer:
+                for record in batch:
+                    movie = record['movie']
+                    cursor = writer.execute(
+                        'INSERT INTO movie (title, summary, score) VALUES (?, ?, ?)',
+                        (movie['title'], movie['summary'] * 20, float(movie['score'])),
+                    )
+                    writer.execute(
+                        'INSERT INTO ranking (country, rank, movie_id) VALUES (?, ?, ?)',
+                        (record['country'], record['rank'], cursor.lastrowid),
+                    )
+
+        # 조회할 데이터가 처음부터 있도록 첫 배치는 미리 저장
+        insert(records[:batch_size])
+        latencies = []
+        ready, done = threading.Event(), threading.Event()
+
+        def read_loop():
+            reader = _sqlite_connect(path, pragmas)
+            rng = random.Random(seed)
+            ready.set()
+            try:
+                while not done.is_set():
+                    started = time.perf_counter()
+                    reader.execute(
+                        'SELECT r.rank, m.title, m.score FROM ranking r JOIN movie m ON m.id = r.movie_id '
+                        'WHERE r.country = ? ORDER BY r.rank LIMIT 5', (rng.choice(countries),)
+                    ).fetchall()
+                    latencies.append(time.perf_counter() - started)
+            finally:
+                reader.close()
+
+        reader_thread = threading.Thread(target=read_loop, daemon=True)
+        reader_thread.start()
+        ready.wait()
+        started = time.perf_counter()
+        for _ in range(rounds):
+            for i in range(0, len(records), batch_size):
+                insert(records[i:i + batch_size])
+        ingest_seconds = time.perf_counter() - started
+        done.set()
+        reader_thread.join()
+        writer.close()
+
+    latencies.sort()
+    to_ms = lambda seconds: round(seconds * 1000, 3)
+    return {
+        'reads': len(latencies),
+        'read_p50_ms': to_ms(statistics.median(latencies)) if latencies else None,
+        'read_p95_ms': to_ms(latencies[int(len(latencies) * 0.95) - 1]) if latencies else None,
+        'read_max_ms': to_ms(latencies[-1]) if latencies else None,
+        'ingest_seconds': round(ingest_seconds, 6),
+    }
+
+
+def run_read_latency_benchmark(countries: int = 50, ranks: int = 50, batch_size: int = 50, rounds: int = 20,
+                               seed: int = 0) -> dict:
+    '''
+    SQLite 기본 설정과 settings.SQLITE_PRAGMAS(WAL 등) 설정에서
+    동시 저장 중 조회 지연 시간을 비교하는 함수
+
+    Returns:
+        dict: {'params', 'environment', 'results': [{'profile', ...measure_read_latency 결과}]}
+    '''
+    records = generate_records(countries=countries, ranks=ranks, seed=seed)
+    profiles = {'default': [], 'tuned': list(settings.SQLITE_PRAGMAS)}
+    results = [
+        {'profile': name, 'pragmas': pragmas, **measure_read_latency(pragmas, records, batch_size, rounds, seed)}
+        for name, pragmas in profiles.items()
+    ]
+    return {
+        'params': {'countries': countries, 'ranks': ranks, 'batch_size': batch_size, 'rounds': rounds, 'seed': seed},
+        'environment': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+        },
+        'results': results,
+    }
+
+
+def write_results(report: dict, output_path: str):
+    '''측정 결과를 JSON 파일로 저장'''
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=4)
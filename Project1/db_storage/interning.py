@@ -0,0 +1,183 @@
+import string
+import threading
+from collections import OrderedDict
+
+from django.db import transaction
+from django.db.models import Q, Value
+from django.db.models.functions import Lower
+from django.db.models.lookups import Exact
+from django.db.models.signals import post_delete
+
+from .models import Actor, Country, Genre
+
+# IN 조회 한 번에 넣을 이름 수 (SQLite 바인딩 변수 제한)
+LOOKUP_CHUNK_SIZE = 500
+# SQLite LOWER() 와 같은 규칙의 소문자 변환 (ASCII A-Z만 변환)
+ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+class NameInterner:
+    '''
+    이름 -> id 를 프로세스 전체에서 공유하는 LRU 캐시.
+        - 처음 사용할 때 maxsize 만큼을 쿼리 한 번으로 미리 채우고(warm), 이후에는 없는 이름만 DB에서 조회
+        - 커밋된 행만 캐시에 넣음 (트랜잭션 안에서 본 id는 on_commit 이후 반영되어 롤백된 id가 남지 않음)
+        - 삭제된 행은 post_delete 시그널로 제거
+    '''
+
+    def __init__(self, model, maxsize: int = 10_000, case_insensitive: bool = False):
+        self.model = model
+        self.maxsize = maxsize
+        self.case_insensitive = case_insensitive
+        self.hits = 0
+        self.misses = 0
+        self._ids = OrderedDict()
+        self._warmed = False
+        self._lock = threading.Lock()
+        post_delete.connect(self._evict_deleted, sender=model, weak=False)
+
+    def key(self, name: str) -> str:
+        '''
+        캐시 key (앞뒤 공백 제거, case_insensitive이면 소문자)
+        소문자 변환은 SQLite LOWER() 와 같이 ASCII 문자만 바꾸므로 DB 조회/unique 제약과 결과가 같다.
+        (ASCII가 아닌 문자는 대소문자를 구분: "TÜRKIYE"와 "Türkiye"는 다른 이름)
+        '''
+        name = name.strip()
+        return name.translate(ASCII_LOWER) if self.case_insensitive else name
+
+    def get_ids(self, names) -> dict:
+        '''
+        이름 목록의 id를 반환하는 함수 (캐시에 없는 이름만 IN 조회)
+
+        Returns:
+            dict: {이름: id} (DB에 없는 이름은 제외)
+        '''
+        self._warm()
+        found, missing = {}, {}
+        with self._lock:
+            for name in dict.fromkeys(names):
+                key = self.key(name)
+                if key in self._ids:
+                    self._ids.move_to_end(key)
+                    found[name] = self._ids[key]
+                    self.hits += 1
+                else:
+                    missing.setdefault(key, []).append(name)
+                    self.misses += 1
+        if missing:
+            fetched = self._fetch([variants[0] for variants in missing.values()])
+            for key, pk in fetched.items():
+                for name in missing.get(key, ()):
+                    found[name] = pk
+            self._remember(fetched)
+        return found
+
+    def get_id(self, name: str):
+        '''이름 하나의 id 반환 (없으면 None)'''
+        return self.get_ids([name]).get(name)
+
+    def get_or_create_ids(self, names) -> dict:
+        '''
+        이름 목록의 id를 반환하고, DB에 없는 이름은 bulk_create로 생성하는 함수
+
+        Returns:
+            dict: {이름: id}
+        '''
+        names = list(dict.fromkeys(names))
+        ids = self.get_ids(names)
+        new_names = {}
+        for name in names:
+            if name not in ids:
+                new_names.setdefault(self.key(name), name)
+        if new_names:
+            self.model.objects.bulk_create(
+                [self.model(name=name) for name in new_names.values()], ignore_conflicts=True
+            )
+            # ignore_conflicts 에서는 PK가 채워지지 않으므로 다시 조회
+            created = self._fetch(list(new_names.values()))
+            for name in names:
+                if name not in ids:
+                    ids[name] = created[self.key(name)]
+            self._remember(created)
+        return ids
+
+    def preload(self, names=()):
+        '''
+        warm 과 names 조회 결과를 커밋을 기다리지 않고 바로 캐시에 넣는 함수.
+        롤백할 트랜잭션 안에서 커밋 이후의 조회 비용을 측정할 때 사용 (롤백한 뒤에는 clear() 필요)
+        '''
+        rows = self.model.objects.order_by('-id').values_list('id', 'name')[:self.maxsize]
+        ids = {self.key(name): pk for pk, name in rows}
+        ids.update(self._fetch(list(dict.fromkeys(names))))
+        self._store(ids, warmed=True)
+
+    def clear(self):
+        '''캐시와 통계를 비움'''
+        with self._lock:
+            self._ids.clear()
+            self._warmed = False
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        '''캐시 크기와 hit/miss 수'''
+        with self._lock:
+            return {'size': len(self._ids), 'maxsize': self.maxsize, 'hits': self.hits, 'misses': self.misses}
+
+    def _fetch(self, names: list) -> dict:
+        '''이름 목록을 DB에서 조회 (같은 key가 여러 행이면 id가 가장 작은 행)'''
+        fetched = {}
+        for i in range(0, len(names), LOOKUP_CHUNK_SIZE):
+            chunk = names[i:i + LOOKUP_CHUNK_SIZE]
+            if self.case_insensitive:
+                # LOWER(name) = LOWER(?) 형태여야 country_name_lower_unique index 를 사용
+                condition = Q()
+                for name in chunk:
+                    condition |= Q(Exact(Lower('name'), Lower(Value(name))))
+            else:
+                condition = Q(name__in=chunk)
+            rows = self.model.objects.filter(condition).order_by('-id').values_list('id', 'name')
+            for pk, name in rows:
+                fetched[self.key(name)] = pk
+        return fetched
+
+    def _warm(self):
+        '''
+        처음 사용할 때 maxsize 개까지 한 번에 불러옴
+        (warm 완료 표시도 커밋 이후에 하므로, 롤백된 트랜잭션에서 처음 호출되면 다음 호출에서 다시 warm)
+        '''
+        if self._warmed:
+            return
+        rows = self.model.objects.order_by('-id').values_list('id', 'name')[:self.maxsize]
+        self._remember({self.key(name): pk for pk, name in rows}, warmed=True)
+
+    def _remember(self, ids: dict, warmed: bool = False):
+        '''조회/생성한 id를 커밋 이후 캐시에 넣음 (트랜잭션 밖이면 바로 반영)'''
+        if ids or warmed:
+            transaction.on_commit(lambda: self._store(ids, warmed))
+
+    def _store(self, ids: dict, warmed: bool = False):
+        with self._lock:
+            for key, pk in ids.items():
+                self._ids[key] = pk
+                self._ids.move_to_end(key)
+            while len(self._ids) > self.maxsize:
+                self._ids.popitem(last=False)
+            if warmed:
+                self._warmed = True
+
+    def _evict_deleted(self, sender, instance, **kwargs):
+        with self._lock:
+            key = self.key(instance.name)
+            if self._ids.get(key) == instance.pk:
+                del self._ids[key]
+
+
+genre_ids = NameInterner(Genre, maxsize=1_000)
+actor_ids = NameInterner(Actor, maxsize=50_000)
+# 국가 조회는 ASCII 대소문자를 구분하지 않음 (LOWER(name) unique index)
+country_ids = NameInterner(Country, maxsize=1_000, case_insensitive=True)
+
+
+def clear_interning_caches():
+    '''모든 이름 캐시를 비움 (테스트/대량 삭제 후 사용)'''
+    for interner in (genre_ids, actor_ids, country_ids):
+        interner.clear()
@@ -0,0 +1,102 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.db import close_old_connections, connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from crawl.crawler import MovieCrawler
+from .models import CrawlJob
+from .utils import ingest_movie_stream
+
+logger = logging.getLogger(__name__)
+
+# 프로세스 내 크롤링 작업 풀 (브라우저를 띄우므로 동시에 하나만 실행)
+executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='crawl-job')
+_submit_lock = threading.Lock()
+# 이 시간 동안 heartbeat_at이 갱신되지 않은 진행 중 작업은 중단된 것으로 처리 (진행률을 기록할 때마다 갱신)
+HEARTBEAT_TIMEOUT = timedelta(minutes=10)
+
+
+def submit_crawl_job(params: dict) -> tuple:
+    """
+    크롤링 작업을 백그라운드로 제출하는 함수.
+    이미 진행 중인 작업이 있으면 새 작업을 만들지 않고 그 작업을 반환한다.
+    진행 중 여부는 DB의 heartbeat_at으로 판단하므로 서버 프로세스가 여러 개여도 같은 결과가 된다.
+
+    Args:
+        params (dict): {'top_n', 'backend', 'workers', 'stream'} 크롤링 옵션.
+
+    Returns:
+        tuple: (CrawlJob, created) - created가 False이면 기존 작업에 연결된 것.
+    """
+    with _submit_lock:
+        with transaction.atomic():
+            now = timezone.now()
+            active_jobs = CrawlJob.objects.select_for_update().filter(status__in=CrawlJob.ACTIVE_STATUSES)
+            # 서버 재시작 등으로 heartbeat가 끊긴 작업은 중단된 것으로 처리
+            active_jobs.filter(
+                Q(heartbeat_at__lt=now - HEARTBEAT_TIMEOUT)
+                | Q(heartbeat_at__isnull=True, created_at__lt=now - HEARTBEAT_TIMEOUT)
+            ).update(status=CrawlJob.STATUS_FAILED, error='Interrupted before completion.', finished_at=now)
+            job = active_jobs.order_by('created_at').first()
+            if job is not None:
+                return job, False
+            job = CrawlJob.objects.create(params=params, heartbeat_at=now)
+        executor.submit(run_crawl_job, job.id)
+    return job, True
+
+
+def run_crawl_job(job_id):
+    """
+    크롤링 작업을 실행하고 상태/진행률을 CrawlJob에 기록하는 함수 (작업 풀 스레드에서 실행)
+
+    Args:
+        job_id (UUID): 실행할 CrawlJob의 id.
+    """
+    in_worker_thread = threading.current_thread() is not threading.main_thread()
+    if in_worker_thread:
+        close_old_connections()
+    try:
+        job = CrawlJob.objects.get(pk=job_id)
+        params = job.params
+        crawler = MovieCrawler(top_n=params.get('top_n', 10), backend=params.get('backend', 'selenium'))
+        total = crawler.top_n * len(crawler.load_country_code_dict())
+        now = timezone.now()
+        CrawlJob.objects.filter(pk=job_id).update(
+            status=CrawlJob.STATUS_RUNNING, started_at=now, heartbeat_at=now, total=total
+        )
+
+        progress = {'count': 0}
+
+        def report_progress(record):
+            progress['count'] += 1
+            CrawlJob.objects.filter(pk=job_id).update(progress=progress['count'], heartbeat_at=timezone.now())
+
+        # 병렬 크롤링에서는 워커로 보내는 crawler에서 콜백이 빠지고, 부모가 완료된 국가 단위로 호출함
+        crawler.progress_callback = report_progress
+        workers = params.get('workers', 1)
+        if params.get('stream'):
+            result = ingest_movie_stream(crawler.iter_movies())
+        else:
+            movies = (crawler.crawling_parallel(max_workers=workers) if workers > 1 else crawler.crawling())['movies']
+            result = {'movies_count': len(movies), 'save_at': crawler.save_at}
+            if crawler.failed_countries:
+                result['failed_countries'] = crawler.failed_countries
+                if not movies:
+                    raise RuntimeError(f"All crawl workers failed: {', '.join(crawler.failed_countries)}")
+
+        CrawlJob.objects.filter(pk=job_id).update(
+            status=CrawlJob.STATUS_SUCCEEDED, result=result, finished_at=timezone.now(),
+            progress=max(progress['count'], result.get('movies_count', 0)),
+        )
+    except Exception as e:
+        logger.error(f"Crawl job {job_id} failed: {e}")
+        CrawlJob.objects.filter(pk=job_id).update(
+            status=CrawlJob.STATUS_FAILED, error=str(e), finished_at=timezone.now()
+        )
+    finally:
+        if in_worker_thread:
+            connection.close()
@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand
+
+from db_storage.benchmarks import run_benchmarks, run_read_latency_benchmark, write_results
+
+
+class Command(BaseCommand):
+    help = '합성 데이터로 영화 저장/재저장/국가별 조회 성능(시간, 쿼리 수, 최대 메모리)을 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--countries', type=int, default=10, help='국가 수')
+        parser.add_argument('--ranks', type=int, default=10, help='국가별 순위 수')
+        parser.add_argument('--genres-per-movie', type=int, default=3, help='영화별 장르 수')
+        parser.add_argument('--actors-per-movie', type=int, default=5, help='영화별 배우 수')
+        parser.add_argument('--overlap', type=float, default=0.3, help='여러 국가에 겹쳐 나오는 영화 비율 (0~1)')
+        parser.add_argument('--seed', type=int, default=0, help='합성 데이터 seed')
+        parser.add_argument('--output', default='benchmark_results.json', help='결과 JSON 파일 경로')
+        parser.add_argument('--keep', action='store_true', help='측정에 사용한 데이터를 롤백하지 않고 남김')
+        parser.add_argument(
+            '--read-latency', action='store_true',
+            help='SQLite 기본 설정과 WAL 설정에서 동시 저장 중 조회 지연 시간을 비교 (임시 DB 파일 사용)',
+        )
+        parser.add_argument('--batch-size', type=int, default=50, help='--read-latency 에서 커밋 한 번에 저장할 레코드 수')
+        parser.add_argument('--rounds', type=int, default=20, help='--read-latency 에서 데이터를 반복 저장할 횟수')
+
+    def handle(self, *args, **options):
+        if options['read_latency']:
+            report = run_read_latency_benchmark(
+                countries=options['countries'], ranks=options['ranks'],
+                batch_size=options['batch_size'], rounds=options['rounds'], seed=options['seed'],
+            )
+            write_results(report, options['output'])
+            for result in report['results']:
+                self.stdout.write(
+                    f"{result['profile']:<8} reads={result['reads']:<8} p50={result['read_p50_ms']}ms "
+                    f"p95={result['read_p95_ms']}ms max={result['read_max_ms']}ms ingest={result['ingest_seconds']:.3f}s"
+                )
+            self.stdout.write(self.style.SUCCESS(f"Saved benchmark results to {options['output']}"))
+            return
+
+        report = run_benchmarks(
+            countries=options['countries'], ranks=options['ranks'],
+            genres_per_movie=options['genres_per_movie'], actors_per_movie=options['actors_per_movie'],
+            overlap=options['overlap'], seed=options['seed'], keep=options['keep'],
+        )
+        write_results(report, options['output'])
+        for result in report['results']:
+            self.stdout.write(
+                f"{result['phase']:<18} {result['seconds']:>10.4f}s {result['queries']:>8} queries "
+                f"{result['peak_kib']:>10.1f} KiB"
+            )
+        self.stdout.write(self.style.SUCCESS(f"Saved benchmark results to {options['output']}"))
@@ -0,0 +1,36 @@
+# Generated by Django 5.1.3 on 2026-10-18 15:51
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db_storage', '0005_crawljob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RankingSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('changed_rows', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='RankingDelta',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveSmallIntegerField()),
+                ('country', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='db_storage.country')),
+                ('movie', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='db_storage.movie')),
+                ('snapshot', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='deltas', to='db_storage.rankingsnapshot')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['country', 'rank', 'snapshot'], name='rankingdelta_lookup_idx')],
+                'unique_together': {('snapshot', 'country', 'rank')},
+            },
+        ),
+    ]
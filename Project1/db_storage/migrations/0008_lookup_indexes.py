@@ -0,0 +1,74 @@
+# Generated by Django 5.1.3 on 2026-10-18 16:00
+
+import logging
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models.functions import Lower
+
+logger = logging.getLogger(__name__)
+
+
+def merge_case_duplicate_countries(apps, schema_editor):
+    """
+    대소문자만 다른 국가를 id가 가장 작은 국가로 합침 (unique 제약 추가 전)
+    합칠 국가에 이미 같은 순위가 있으면 중복 국가의 순위는 버리며, 버린 행은 모두 경고로 남김
+    """
+    Country = apps.get_model('db_storage', 'Country')
+    Ranking = apps.get_model('db_storage', 'Ranking')
+    RankingDelta = apps.get_model('db_storage', 'RankingDelta')
+
+    canonical = {}
+    dropped_rankings = dropped_deltas = 0
+    rows = Country.objects.annotate(lower_name=Lower('name')).order_by('id').values_list('id', 'name', 'lower_name')
+    for country_id, name, lower_name in rows:
+        keep_id, keep_name = canonical.setdefault(lower_name, (country_id, name))
+        if keep_id == country_id:
+            continue
+        taken_ranks = set(Ranking.objects.filter(country_id=keep_id).values_list('rank', flat=True))
+        conflicts = Ranking.objects.filter(country_id=country_id, rank__in=taken_ranks)
+        for rank, movie_id in conflicts.values_list('rank', 'movie_id'):
+            logger.warning(
+                f"Dropping ranking of '{name}'(id={country_id}) rank {rank} movie_id={movie_id}: "
+                f"rank already taken in '{keep_name}'(id={keep_id})."
+            )
+        dropped_rankings += conflicts.delete()[0]
+        Ranking.objects.filter(country_id=country_id).update(country_id=keep_id)
+        for snapshot_id, rank in RankingDelta.objects.filter(country_id=keep_id).values_list('snapshot_id', 'rank'):
+            conflicts = RankingDelta.objects.filter(country_id=country_id, snapshot_id=snapshot_id, rank=rank)
+            for movie_id in conflicts.values_list('movie_id', flat=True):
+                logger.warning(
+                    f"Dropping ranking history of '{name}'(id={country_id}) snapshot {snapshot_id} rank {rank} "
+                    f"movie_id={movie_id}: already recorded for '{keep_name}'(id={keep_id})."
+                )
+            dropped_deltas += conflicts.delete()[0]
+        RankingDelta.objects.filter(country_id=country_id).update(country_id=keep_id)
+        Country.objects.filter(id=country_id).delete()
+        logger.warning(f"Merged country '{name}'(id={country_id}) into '{keep_name}'(id={keep_id}).")
+    if dropped_rankings or dropped_deltas:
+        logger.warning(
+            f"Case-duplicate country merge dropped {dropped_rankings} rankings and {dropped_deltas} ranking deltas."
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db_storage', '0007_movie_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(fields=['title'], name='movie_title_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ranking',
+            index=models.Index(fields=['country', 'rank', 'movie'], name='ranking_country_rank_movie_idx'),
+        ),
+        migrations.RunPython(merge_case_duplicate_countries, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='country',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('name'), name='country_name_lower_unique'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.1.3 on 2026-10-18 16:01
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def build_leaderboards(apps, schema_editor):
+    """기존 랭킹으로 모든 국가의 leaderboard 를 채움"""
+    Ranking = apps.get_model('db_storage', 'Ranking')
+    CountryLeaderboard = apps.get_model('db_storage', 'CountryLeaderboard')
+    rankings = Ranking.objects.select_related('movie').prefetch_related('movie__genres', 'movie__actors')
+    CountryLeaderboard.objects.bulk_create([
+        CountryLeaderboard(
+            country_id=ranking.country_id, rank=ranking.rank, movie_id=ranking.movie_id,
+            title=ranking.movie.title, release_year=ranking.movie.release_year, score=ranking.movie.score,
+            summary=ranking.movie.summary, image_url=ranking.movie.image_url,
+            genres=[genre.name for genre in ranking.movie.genres.all()],
+            actors=[actor.name for actor in ranking.movie.actors.all()],
+        )
+        for ranking in rankings
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db_storage', '0008_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CountryLeaderboard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveSmallIntegerField()),
+                ('title', models.CharField(max_length=200)),
+                ('release_year', models.CharField(max_length=20)),
+                ('score', models.DecimalField(decimal_places=1, max_digits=3)),
+                ('summary', models.TextField(blank=True, null=True)),
+                ('image_url', models.URLField(blank=True, null=True)),
+                ('genres', models.JSONField(default=list)),
+                ('actors', models.JSONField(default=list)),
+                ('country', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='leaderboard', to='db_storage.country')),
+                ('movie', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='db_storage.movie')),
+            ],
+            options={
+                'unique_together': {('country', 'rank')},
+            },
+        ),
+        migrations.RunPython(build_leaderboards, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.3 on 2026-10-18 16:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db_storage', '0009_country_leaderboard'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='crawljob',
+            name='heartbeat_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.1.3 on 2026-10-18 16:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_history(apps, schema_editor):
+    """기존 delta 에 영화 제목을 채우고, 영화가 없는 행(사라진 순위)은 removed 로 표시"""
+    RankingDelta = apps.get_model('db_storage', 'RankingDelta')
+    Movie = apps.get_model('db_storage', 'Movie')
+    RankingDelta.objects.filter(movie__isnull=True).update(removed=True)
+    RankingDelta.objects.filter(movie__isnull=False).update(
+        title=Subquery(Movie.objects.filter(pk=OuterRef('movie_id')).values('title')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db_storage', '0010_crawljob_heartbeat'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rankingdelta',
+            name='removed',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='rankingdelta',
+            name='title',
+            field=models.CharField(blank=True, default='', max_length=200),
+        ),
+        migrations.AlterField(
+            model_name='rankingdelta',
+            name='movie',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='db_storage.movie'),
+        ),
+        migrations.RunPython(backfill_history, migrations.RunPython.noop),
+    ]
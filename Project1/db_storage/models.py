@@ -1,8 +1,16 @@
+import uuid
 from django.db import models
+from django.db.models.functions import Lower
 
 # Create your models here.
 class Country(models.Model):
     name = models.CharField(max_length=100)
+
+    class Meta:
+        constraints = [
+            # 대소문자를 구분하지 않는 이름 조회(LOWER(name) = LOWER(?))를 index 탐색으로 처리
+            models.UniqueConstraint(Lower('name'), name='country_name_lower_unique'),
+        ]
     
     def __str__(self):
         return self.name
@@ -30,6 +38,14 @@ class Movie(models.Model):
     image_url = models.URLField(null=True, blank=True)
     genres = models.ManyToManyField(Genre, through='MovieGenre', related_name='movies')
     actors = models.ManyToManyField(Actor, through='MovieActor', related_name='movies')
+    # 정규화된 필드 + 장르/배우 집합의 sha256 (변경 없는 레코드 저장 생략용)
+    content_hash = models.CharField(max_length=64, blank=True, default='')
+
+    class Meta:
+        indexes = [
+            # 저장 시 제목으로 기존 영화 조회
+            models.Index(fields=['title'], name='movie_title_idx'),
+        ]
 
     def __str__(self):
         genres = ', '.join([genre.name for genre in self.genres.all()])
@@ -73,6 +89,107 @@ class Ranking(models.Model):
     
     class Meta:
         unique_together = ('country', 'rank')
+        indexes = [
+            # 국가별 순위 순 조회를 테이블 접근 없이 index 만으로 처리 (covering index)
+            models.Index(fields=['country', 'rank', 'movie'], name='ranking_country_rank_movie_idx'),
+        ]
     
     def __str__(self):
-        return f'{self.country.name} - {self.rank} - {self.movie.title}'
\ No newline at end of file
+        return f'{self.country.name} - {self.rank} - {self.movie.title}'
+
+
+class CountryLeaderboard(models.Model):
+    '''
+        국가별 순위 화면용 비정규화 테이블 (저장 시 바뀐 국가만 다시 만듦)
+            - genres/actors: 이름 리스트(JSON)
+    '''
+    country = models.ForeignKey(Country, on_delete=models.CASCADE, related_name='leaderboard')
+    rank = models.PositiveSmallIntegerField()
+    movie = models.ForeignKey(Movie, on_delete=models.CASCADE)
+    title = models.CharField(max_length=200)
+    release_year = models.CharField(max_length=20)
+    score = models.DecimalField(max_digits=3, decimal_places=1)
+    summary = models.TextField(null=True, blank=True)
+    image_url = models.URLField(null=True, blank=True)
+    genres = models.JSONField(default=list)
+    actors = models.JSONField(default=list)
+
+    class Meta:
+        # (country, rank) unique index 로 국가별 조회가 index 범위 탐색 한 번
+        unique_together = ('country', 'rank')
+
+    def __str__(self):
+        return f'{self.country_id} - {self.rank} - {self.title}'
+
+
+class RankingSnapshot(models.Model):
+    '''
+        랭킹 저장(ingestion) 실행 1회
+            - changed_rows: 직전 실행 대비 바뀐 (국가, 순위) 수
+    '''
+    created_at = models.DateTimeField(auto_now_add=True)
+    changed_rows = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f'Snapshot {self.id} ({self.created_at:%Y-%m-%d %H:%M}, {self.changed_rows} changes)'
+
+
+class RankingDelta(models.Model):
+    '''
+        스냅샷에서 직전 상태와 달라진 (국가, 순위) 행만 저장
+            - movie: 해당 순위의 영화 (영화가 삭제되어도 이력이 남도록 SET_NULL)
+            - title: 기록 당시 영화 제목 (영화가 삭제된 뒤에도 이력 조회용)
+            - removed: True이면 이 스냅샷에서 순위가 사라짐
+    '''
+    snapshot = models.ForeignKey(RankingSnapshot, on_delete=models.CASCADE, related_name='deltas')
+    country = models.ForeignKey(Country, on_delete=models.CASCADE)
+    rank = models.PositiveSmallIntegerField()
+    movie = models.ForeignKey(Movie, on_delete=models.SET_NULL, null=True, blank=True)
+    title = models.CharField(max_length=200, blank=True, default='')
+    removed = models.BooleanField(default=False)
+
+    class Meta:
+        unique_together = ('snapshot', 'country', 'rank')
+        indexes = [
+            # "X 시점의 랭킹" 재구성 시 (국가, 순위)별 최신 스냅샷 탐색용
+            models.Index(fields=['country', 'rank', 'snapshot'], name='rankingdelta_lookup_idx'),
+        ]
+
+    def __str__(self):
+        title = '-' if self.removed else self.title
+        return f'{self.snapshot_id}: {self.country.name} - {self.rank} - {title}'
+
+
+class CrawlJob(models.Model):
+    '''
+        백그라운드 크롤링 작업
+            - status: pending -> running -> succeeded | failed
+            - progress/total: 처리한 영화 수 / 예상 영화 수
+            - heartbeat_at: 실행 중인 작업이 마지막으로 진행을 기록한 시각 (오래되면 중단된 것으로 판단)
+    '''
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_SUCCEEDED = 'succeeded'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_SUCCEEDED, 'Succeeded'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+    ACTIVE_STATUSES = (STATUS_PENDING, STATUS_RUNNING)
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    params = models.JSONField(default=dict)
+    progress = models.PositiveIntegerField(default=0)
+    total = models.PositiveIntegerField(default=0)
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f'{self.id} - {self.status} ({self.progress}/{self.total})'
@@ -0,0 +1,22 @@
+from rest_framework.pagination import CursorPagination
+
+
+class KeysetPagination(CursorPagination):
+    """
+    index 컬럼 기준 keyset(cursor) 페이지네이션.
+    다음 페이지는 OFFSET 대신 `ordering > 마지막 값` 조건으로 조회하므로 깊은 페이지도 첫 페이지와 비용이 같음.
+    `?page_size=` 로 크기를 지정하되 max_page_size 를 넘지 않음
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class RankingPagination(KeysetPagination):
+    # (country, rank, movie) index 순서
+    ordering = 'rank'
+
+
+class MoviePagination(KeysetPagination):
+    # PK 순서
+    ordering = 'id'
@@ -0,0 +1,62 @@
+import threading
+import time
+
+from django.core.cache import cache
+
+from .interning import country_ids
+from .utils import get_movies_by_country_name
+
+# 저장(ingestion)이 커밋될 때마다 바뀌는 전역 데이터 버전 키
+DATA_VERSION_KEY = 'db_storage:data_version'
+
+_stats_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0}
+
+
+def get_data_version() -> int:
+    '''현재 데이터 버전 (캐시에 없으면 새로 만듦)'''
+    version = cache.get(DATA_VERSION_KEY)
+    if version is None:
+        # 버전 키가 축출된 경우에도 예전 버전과 겹치지 않도록 시각으로 만듦
+        cache.add(DATA_VERSION_KEY, time.time_ns())
+        version = cache.get(DATA_VERSION_KEY)
+    return version
+
+
+def bump_data_version():
+    '''데이터 버전을 바꿔 이전 버전 키의 캐시를 모두 무효화 (저장 커밋 이후 호출)'''
+    cache.set(DATA_VERSION_KEY, time.time_ns())
+
+
+def get_cached_movies_by_country_name(name: str) -> list[dict]:
+    '''
+    get_movies_by_country_name 의 read-through 캐시.
+    (데이터 버전, 국가 이름)으로 저장하므로 저장이 커밋되기 전까지는 DB를 조회하지 않음
+
+    Args:
+        name: 국가 이름
+    Returns:
+        get_movies_by_country_name 과 같은 결과 (오류 dict는 캐시하지 않음)
+    '''
+    # 국가 조회와 같은 정규화 (ASCII만 소문자로 바꿔 DB에서 다른 국가인 이름이 같은 key가 되지 않도록)
+    key = f'db_storage:movies:{get_data_version()}:{country_ids.key(name)}'
+    movies = cache.get(key)
+    with _stats_lock:
+        _stats['hits' if movies is not None else 'misses'] += 1
+    if movies is None:
+        movies = get_movies_by_country_name(name)
+        if isinstance(movies, list):
+            cache.set(key, movies)
+    return movies
+
+
+def cache_stats() -> dict:
+    '''캐시 hit/miss 수와 hit 비율'''
+    with _stats_lock:
+        total = _stats['hits'] + _stats['misses']
+        return {**_stats, 'hit_ratio': round(_stats['hits'] / total, 3) if total else None}
+
+
+def reset_cache_stats():
+    with _stats_lock:
+        _stats.update(hits=0, misses=0)
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import Country, Genre, Actor, Movie, Ranking
+from .models import Country, Genre, Actor, Movie, Ranking, CrawlJob
 
 class GenreSerializer(serializers.ModelSerializer):
     class Meta:
@@ -13,9 +13,20 @@ class ActorSerializer(serializers.ModelSerializer):
         fields = ['id', 'name']
 
 
-class MovieSerializer(serializers.ModelSerializer):
-    genres = serializers.ListField(child=serializers.CharField())
-    actors = serializers.ListField(child=serializers.CharField())
+class DynamicFieldsMixin:
+    """`fields` 인자로 지정한 필드만 직렬화하는 mixin (None이면 전체)"""
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
+
+
+class MovieSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    # 이름 리스트로 직렬화 (prefetch_related 한 genres/actors 를 그대로 사용)
+    genres = serializers.SlugRelatedField(many=True, read_only=True, slug_field='name')
+    actors = serializers.SlugRelatedField(many=True, read_only=True, slug_field='name')
 
     class Meta:
         model = Movie
@@ -26,3 +37,15 @@ class RankingSerializer(serializers.Serializer):
     name = serializers.CharField(source='country.name', max_length=10)
     movie = MovieSerializer()
     rank = serializers.IntegerField()
+
+    def __init__(self, *args, movie_fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if movie_fields is not None:
+            self.fields['movie'] = MovieSerializer(fields=movie_fields)
+
+
+class CrawlJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = CrawlJob
+        fields = ['id', 'status', 'params', 'progress', 'total', 'result', 'error',
+                  'created_at', 'started_at', 'finished_at', 'heartbeat_at']
@@ -0,0 +1,155 @@
+from django.db.models import OuterRef, Subquery
+
+from .interning import country_ids
+from .models import RankingDelta, RankingSnapshot
+
+
+def ranking_state(snapshot_id: int, country_ids=None) -> dict:
+    '''
+    snapshot_id 시점의 랭킹을 재구성하는 함수.
+    (국가, 순위)별로 snapshot_id 이하의 가장 최근 변경(delta) 하나만 읽는다.
+
+    Args:
+        snapshot_id: 기준 스냅샷 id (이 스냅샷까지 반영)
+        country_ids: 재구성할 국가 id 목록 (None이면 전체)
+    Returns:
+        dict: {(country_id, rank): movie_id} (사라진 순위는 제외, 영화가 삭제된 순위는 movie_id None)
+    '''
+    deltas = RankingDelta.objects.filter(snapshot_id__lte=snapshot_id)
+    if country_ids is not None:
+        deltas = deltas.filter(country_id__in=list(country_ids))
+    latest = (
+        RankingDelta.objects.filter(
+            country_id=OuterRef('country_id'), rank=OuterRef('rank'), snapshot_id__lte=snapshot_id
+        )
+        .order_by('-snapshot_id')
+        .values('snapshot_id')[:1]
+    )
+    rows = (
+        deltas.filter(snapshot_id=Subquery(latest), removed=False)
+        .values_list('country_id', 'rank', 'movie_id')
+    )
+    return {(country_id, rank): movie_id for country_id, rank, movie_id in rows}
+
+
+def get_ranking_as_of(snapshot_id: int, country_name: str) -> list[dict]:
+    '''
+    국가 이름으로 snapshot_id 시점의 랭킹을 반환
+
+    Args:
+        snapshot_id: 기준 스냅샷 id
+        country_name: 국가 이름
+    Returns:
+        list[dict]: [{'rank', 'movie_id', 'title'}] 순위 오름차순
+    '''
+    country_id = country_ids.get_id(country_name)
+    if country_id is None:
+        return []
+    rows = (
+        RankingDelta.objects.filter(
+            pk__in=Subquery(
+                RankingDelta.objects.filter(
+                    country_id=country_id, rank=OuterRef('rank'), snapshot_id__lte=snapshot_id
+                ).order_by('-snapshot_id').values('pk')[:1]
+            ),
+            country_id=country_id,
+            removed=False,
+        )
+        .order_by('rank')
+        .values('rank', 'movie_id', 'title')
+    )
+    # 제목은 기록 당시 값 (영화가 삭제되어도 남아 있음)
+    return list(rows)
+
+
+class SnapshotRecorder:
+    '''
+    저장 실행 1회의 랭킹을 RankingSnapshot으로 기록하는 클래스.
+    배치마다 record()를 호출하면 직전 상태와 달라진 (국가, 순위)만 RankingDelta로 저장하고,
+    finish()에서 이번 실행에 등장한 국가의 사라진 순위를 기록한다.
+    스냅샷은 첫 record()에서 만들어지므로 기록된 배치가 없으면 스냅샷도 남지 않는다.
+    저장에 실패했거나 끝까지 읽지 못한 국가는 skip()으로 표시하면 사라진 순위를 기록하지 않는다.
+    '''
+
+    def __init__(self):
+        self.snapshot = None
+        self.seen = {}
+        # 이번 실행의 순위를 모두 알 수 없는 국가 이름 (실패한 배치 등)
+        self.skipped = set()
+
+    def begin(self):
+        '''스냅샷을 미리 생성하는 함수 (배치마다 별도 트랜잭션으로 기록할 때 사용)'''
+        if self.snapshot is None:
+            self.snapshot = RankingSnapshot.objects.create()
+        return self.snapshot
+
+    def record(self, rows):
+        '''
+        이번 실행의 랭킹 행을 기록하는 함수 (호출한 쪽의 트랜잭션 안에서 실행)
+
+        Args:
+            rows: (country_id, rank, movie_id, title) iterable
+        '''
+        assignments = {}
+        for country_id, rank, movie_id, title in rows:
+            assignments[(country_id, rank)] = (movie_id, title)
+            self.seen.setdefault(country_id, set()).add(rank)
+        if not assignments:
+            return
+
+        self.begin()
+        current = ranking_state(self.snapshot.pk, {country_id for country_id, _ in assignments})
+        changed = [
+            RankingDelta(snapshot=self.snapshot, country_id=country_id, rank=rank, movie_id=movie_id, title=title)
+            for (country_id, rank), (movie_id, title) in assignments.items()
+            if current.get((country_id, rank)) != movie_id
+        ]
+        self.write(changed)
+
+    def discard_if_rolled_back(self):
+        '''
+        호출한 쪽의 트랜잭션이 롤백된 뒤 호출하는 함수.
+        스냅샷이 그 트랜잭션에서 만들어져 함께 롤백되었으면 버리고, 다음 record()에서 다시 만든다.
+        '''
+        if self.snapshot is not None and not RankingSnapshot.objects.filter(pk=self.snapshot.pk).exists():
+            self.snapshot = None
+
+    def skip(self, country_name: str):
+        '''이번 실행에서 순위를 모두 기록하지 못한 국가 (finish()에서 사라진 순위로 기록하지 않음)'''
+        self.skipped.add(country_name)
+
+    def complete_ranks(self) -> dict:
+        '''이번 실행에서 순위를 모두 기록한 국가(skip()된 국가 제외)의 순위 {country_id: {rank}}'''
+        skipped_ids = set(country_ids.get_ids(self.skipped).values())
+        return {country_id: ranks for country_id, ranks in self.seen.items() if country_id not in skipped_ids}
+
+    def write(self, deltas: list):
+        '''같은 스냅샷의 (국가, 순위) 행은 덮어쓰며 delta 저장'''
+        if deltas:
+            RankingDelta.objects.bulk_create(
+                deltas, update_conflicts=True,
+                unique_fields=['snapshot', 'country', 'rank'], update_fields=['movie', 'title', 'removed'],
+            )
+
+    def finish(self):
+        '''
+        이번 실행에 등장한 국가에서 사라진 순위를 기록하고 변경 수를 저장하는 함수
+
+        Returns:
+            RankingSnapshot: 기록된 스냅샷 (기록할 랭킹이 없었으면 None)
+        '''
+        if self.snapshot is None:
+            return None
+        # 이번 실행까지 반영된 상태에서, 등장한 국가의 순위 중 이번에 없던 것은 사라진 것으로 기록
+        # (skip()된 국가는 빠진 순위가 실제로 사라진 것인지 알 수 없으므로 제외)
+        complete = self.complete_ranks()
+        current = ranking_state(self.snapshot.pk, complete)
+        removed = [
+            RankingDelta(snapshot=self.snapshot, country_id=country_id, rank=rank, movie_id=None, removed=True)
+            for (country_id, rank) in current
+            if rank not in complete[country_id]
+        ]
+        self.write(removed)
+        self.snapshot.changed_rows = self.snapshot.deltas.count()
+        self.snapshot.save(update_fields=['changed_rows'])
+        return self.snapshot
@@ -0,0 +1,142 @@
+import json
+import logging
+import os
+import re
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import groupby
+
+import django
+from django.db import transaction
+
+from .snapshots import SnapshotRecorder
+from .utils import _normalize_score, _unique, finish_ingestion, movie_content_hash, save_movies_from_json
+
+logger = logging.getLogger(__name__)
+
+
+def _init_worker():
+    """워커 프로세스에서 Django 설정을 불러옴 (spawn 방식에서도 utils/models import 가능하도록)"""
+    django.setup()
+
+
+def normalize_movie_record(record: dict) -> dict:
+    """
+    레코드 하나를 저장 형태로 정규화하고 content_hash를 미리 계산하는 함수 (DB 접근 없음)
+
+    Args:
+        record (dict): {'country', 'movie', 'rank'} 형태의 영화 레코드.
+
+    Returns:
+        dict: 정규화된 레코드 + 'content_hash'
+    """
+    movie_info = dict(record['movie'])
+    movie_info['score'] = str(_normalize_score(movie_info.get('score', 0.0)))
+    movie_info['genres'] = _unique(movie_info.get('genres', []))
+    movie_info['actors'] = _unique(movie_info.get('actors', []))
+    return {
+        'country': record['country'],
+        'movie': movie_info,
+        'rank': record['rank'],
+        'content_hash': movie_content_hash(movie_info),
+    }
+
+
+def stage_country(sequence: int, country: str, records: list, staging_dir: str) -> tuple:
+    """
+    국가 하나의 레코드를 정규화해 워커 전용 staging 파일(JSONL)에 쓰는 함수 (워커 프로세스에서 실행)
+
+    Args:
+        sequence (int): 입력에서 이 국가 묶음의 순서 (merge 순서)
+        country (str): 국가 이름
+        records (list): 이 국가의 영화 레코드 리스트
+        staging_dir (str): staging 파일을 쓸 디렉터리
+
+    Returns:
+        tuple: (sequence, staging 파일 경로, 레코드 수)
+    """
+    safe_name = re.sub(r'[^0-9A-Za-z_-]+', '_', country)
+    path = os.path.join(staging_dir, f'{sequence:06d}-{safe_name}.jsonl')
+    with open(path, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(normalize_movie_record(record), ensure_ascii=False) + '\n')
+    return sequence, path, len(records)
+
+
+def iter_staged_records(paths: list):
+    """staging 파일들을 순서대로 읽어 레코드를 하나씩 반환하는 제너레이터"""
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def ingest_movies_parallel(records, workers: int = None, staging_dir: str = None, collect_titles: bool = False,
+                           executor_class=ProcessPoolExecutor) -> dict:
+    """
+    영화 레코드를 국가별로 나눠 여러 프로세스에서 정규화(staging)한 뒤 한 번에 병합 저장하는 함수.
+        1. stage: 연속된 같은 국가의 레코드를 워커에 보내 정규화 + content_hash 계산 후 국가별 staging 파일에 씀
+           (DB에 쓰지 않으므로 워커 수만큼 코어를 사용)
+        2. merge: 모든 staging 파일의 레코드를 입력 순서대로 모아 save_movies_from_json 한 번으로 저장
+           (국가/배치 경계 없이 조회, bulk_create, leaderboard 갱신, 스냅샷 기록을 한 번씩만 수행)
+    병합은 트랜잭션 하나에서 실행되며 저장 중 예외는 그대로 전달되므로, 실패하면 아무것도 커밋되지 않는다.
+
+    Args:
+        records (iterable): {'country', 'movie', 'rank'} 형태의 영화 레코드 iterable.
+        workers (int): 워커 프로세스 수 (None이면 CPU 수).
+        staging_dir (str): staging 파일 디렉터리 (None이면 임시 디렉터리를 만들고 끝나면 삭제).
+        collect_titles (bool): True이면 저장/중복/업데이트된 영화 제목도 반환.
+        executor_class: 워커 풀 클래스 (기본 ProcessPoolExecutor).
+
+    Returns:
+        dict: ingest_movie_stream 과 같은 형태의 결과 + {'staged_countries': int, 'workers': int}
+    """
+    workers = workers or os.cpu_count() or 1
+    temp_dir = None
+    if staging_dir is None:
+        temp_dir = tempfile.TemporaryDirectory(prefix='movie-staging-')
+        staging_dir = temp_dir.name
+    os.makedirs(staging_dir, exist_ok=True)
+
+    staged = []
+    try:
+        with executor_class(max_workers=workers, initializer=_init_worker) as executor:
+            pending = set()
+            country_groups = groupby(records, key=lambda record: record['country'])
+            for sequence, (country, group) in enumerate(country_groups):
+                # 대기 중인 묶음을 워커 수의 2배로 제한해 입력 전체를 메모리에 올리지 않음
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    staged.extend(future.result() for future in done)
+                pending.add(executor.submit(stage_country, sequence, country, list(group), staging_dir))
+            staged.extend(future.result() for future in wait(pending).done)
+        logger.info(f"Staged {sum(count for _, _, count in staged)} records in {len(staged)} country files.")
+
+        # staging 파일을 입력 순서대로 모아 한 번에 병합 (예외 시 전체 롤백)
+        staged_records = list(iter_staged_records([path for _, path, _ in sorted(staged)]))
+        recorder = SnapshotRecorder()
+        with transaction.atomic():
+            result = save_movies_from_json(staged_records, recorder=recorder, raise_errors=True)
+            snapshot = finish_ingestion(recorder)
+    finally:
+        if temp_dir is not None:
+            temp_dir.cleanup()
+
+    summary = {
+        'saved_count': len(result['saved_movies']),
+        'duplicate_count': len(result['duplicate_movies']),
+        'updated_count': len(result['updated_movies']),
+        'unchanged_count': result['unchanged_count'],
+        'batches': 1 if staged_records else 0,
+        'records': len(staged_records),
+        'failed_batches': 0, 'failed_records': 0, 'errors': [], 'parse_error': None,
+        'snapshot_id': snapshot.pk if snapshot else None,
+        'staged_countries': len(staged),
+        'workers': workers,
+    }
+    if collect_titles:
+        for key in ('saved_movies', 'duplicate_movies', 'updated_movies'):
+            summary[key] = [movie.title for movie in result[key]]
+        summary['updated_fields'] = result['updated_fields']
+    return summary
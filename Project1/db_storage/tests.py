@@ -1,8 +1,33 @@
+import io
+import json
+import os
+import tempfile
 from decimal import Decimal
+from unittest import mock
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.test import APIClient, APITestCase
+from django.core.cache import cache
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Value
+from django.db.models.functions import Lower
+from django.db.models.lookups import Exact
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
-from .models import Country, Genre, Actor, Movie, Ranking
+from django.utils import timezone
+from crawl.crawler import MovieCrawler
+from visualizations.visualizer import Visualizer
+from . import jobs
+from .models import Country, Genre, Actor, Movie, Ranking, CountryLeaderboard, CrawlJob, RankingDelta, RankingSnapshot
+from .benchmarks import generate_records, run_benchmarks
+from .interning import clear_interning_caches, country_ids, genre_ids
+from .read_cache import cache_stats, get_cached_movies_by_country_name, reset_cache_stats
+from .snapshots import get_ranking_as_of
+from .staging import ingest_movies_parallel
+from .utils import (
+    get_movies_by_country_name, get_movies_by_country_names, ingest_movie_stream, iter_movies_from_json,
+    iter_movies_from_json_file, save_movies_from_json,
+)
 
 """class BulkInsertRankingViewTest(APITestCase):
     
@@ -108,8 +133,7 @@ from .models import Country, Genre, Actor, Movie, Ranking
         response = self.client.post(self.url, invalid_payload, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 """
-from django.test import TestCase
-from rest_framework.test import APIClient
+
 
 class BulkInsertRankingTest(TestCase):
     def setUp(self):
@@ -266,4 +290,641 @@ class BulkInsertRankingTest(TestCase):
 
     def test_bulk_insert_ranking(self):
         response = self.client.post(self.url, self.payload, format='json')
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['details']['records_count'], len(self.payload['movies']))
+        self.assertTrue(Movie.objects.filter(title="Interstellar").exists())
+
+    def test_bulk_insert_ranking_ndjson_upload(self):
+        body = '\n'.join(json.dumps(movie, ensure_ascii=False) for movie in self.payload['movies']) + '\n'
+        response = self.client.post(
+            self.url + '?batch_size=3', data=body.encode('utf-8'), content_type='application/x-ndjson'
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['details']['records_count'], len(self.payload['movies']))
+        self.assertIn("오징어 게임", response.data['saved_movies'])
+
+    def test_bulk_insert_ranking_rejects_malformed_ndjson(self):
+        response = self.client.post(self.url, data=b'{"country": ', content_type='application/x-ndjson')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_invalid_query_parameters_are_rejected(self):
+        cases = (('?batch_size=abc', 'batch_size'), ('?batch_size=0', 'batch_size'), ('?workers=-1', 'workers'))
+        for query, name in cases:
+            response = self.client.post(self.url + query, self.payload, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, query)
+            self.assertIn(name, response.data['error'])
+        self.assertFalse(Movie.objects.exists())
+
+    def test_malformed_line_after_committed_batches_is_reported_as_partial(self):
+        lines = [json.dumps(movie, ensure_ascii=False) for movie in self.payload['movies'][:2]]
+        body = '\n'.join(lines + ['{"country": "KR", "mo']) + '\n'
+        response = self.client.post(
+            self.url + '?batch_size=1', data=body.encode('utf-8'), content_type='application/x-ndjson'
+        )
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual(response.data['details']['records_count'], 2)
+        self.assertIsNotNone(response.data['details']['parse_error'])
+        self.assertEqual(Movie.objects.count(), 2)
+
+    def test_failed_batch_is_counted_and_not_reported_as_created(self):
+        broken = make_record("Brazil", 1, None)
+        payload = {"movies": self.payload['movies'][:2] + [broken]}
+        response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        details = response.data['details']
+        self.assertEqual((details['failed_batches_count'], details['failed_records_count']), (1, 1))
+        self.assertEqual(details['errors'][0]['country'], "Brazil")
+        self.assertEqual(Movie.objects.count(), 2)
+
+        response = self.client.post(self.url, {"movies": [broken]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+def make_record(country, rank, title, genres=("Drama",), actors=("Song Kang-ho",)):
+    return {
+        "country": country,
+        "movie": {
+            "title": title,
+            "release_year": "2019",
+            "score": "8.5",
+            "summary": f"{title} summary",
+            "image_url": f"https://example.com/{rank}.jpg",
+            "genres": list(genres),
+            "actors": list(actors),
+        },
+        "rank": rank,
+    }
+
+
+class IngestMovieStreamTest(TestCase):
+    def test_stream_is_committed_in_country_batches(self):
+        consumed = []
+
+        def records():
+            for country in ("South Korea", "Brazil"):
+                for rank in range(1, 4):
+                    consumed.append((country, rank))
+                    yield make_record(country, rank, f"{country} {rank}")
+
+        summary = ingest_movie_stream(records(), batch_size=2)
+
+        self.assertEqual(len(consumed), 6)
+        # 국가마다 2건 + 1건 배치
+        self.assertEqual(summary["batches"], 4)
+        self.assertEqual(summary["saved_count"], 6)
+        self.assertEqual(Ranking.objects.filter(country__name="Brazil").count(), 3)
+
+
+def fake_crawl_country(crawler, country_code, country, skip_ranks=()):
+    """워커 프로세스에서 실행되는 crawl_country 대역 (pickle 가능하도록 모듈 수준 함수)"""
+    return [
+        make_record(country, rank, f"{country} {rank}")
+        for rank in range(1, crawler.top_n + 1) if rank not in skip_ranks
+    ]
+
+
+class DeferredExecutor:
+    """제출된 작업을 바로 실행하지 않고 모아 두는 테스트용 executor"""
+
+    def __init__(self):
+        self.calls = []
+
+    def submit(self, fn, *args):
+        self.calls.append((fn, args))
+
+    def run_all(self):
+        for fn, args in self.calls:
+            fn(*args)
+
+
+class CrawlJobTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.executor = DeferredExecutor()
+        patcher = mock.patch.object(jobs, 'executor', self.executor)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_trigger_returns_job_and_deduplicates_running_job(self):
+        first = self.client.get('/api/crawl_movies/?stream=true')
+        second = self.client.get('/api/crawl_movies/?stream=true')
+
+        self.assertEqual(first.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(second.json()['job_id'], first.json()['job_id'])
+        self.assertTrue(second.json()['deduplicated'])
+        self.assertEqual(len(self.executor.calls), 1)
+
+        crawler = mock.Mock(top_n=2)
+        crawler.load_country_code_dict.return_value = {'KR': 'South Korea'}
+        crawler.iter_movies.return_value = iter([make_record('South Korea', 1, 'Gisaengchung')])
+        with mock.patch.object(jobs, 'MovieCrawler', return_value=crawler):
+            self.executor.run_all()
+
+        job = self.client.get(first.json()['status_url']).json()
+        self.assertEqual(job['status'], CrawlJob.STATUS_SUCCEEDED)
+        self.assertEqual(job['total'], 2)
+        self.assertEqual(job['result']['saved_count'], 1)
+
+    def test_invalid_workers_are_rejected_without_submitting(self):
+        for query in ('?workers=abc', '?workers=0'):
+            response = self.client.get('/api/crawl_movies/' + query)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, query)
+            self.assertIn('workers', response.json()['error'])
+        self.assertFalse(CrawlJob.objects.exists())
+        self.assertEqual(self.executor.calls, [])
+
+    def test_only_jobs_without_recent_heartbeat_are_interrupted(self):
+        # 다른 서버 프로세스에서 실행 중인 작업(heartbeat 최근)은 그대로 연결
+        running = CrawlJob.objects.create(status=CrawlJob.STATUS_RUNNING, heartbeat_at=timezone.now())
+        job, created = jobs.submit_crawl_job({})
+        self.assertFalse(created)
+        self.assertEqual(job.pk, running.pk)
+
+        CrawlJob.objects.filter(pk=running.pk).update(heartbeat_at=timezone.now() - jobs.HEARTBEAT_TIMEOUT * 2)
+        job, created = jobs.submit_crawl_job({})
+        self.assertTrue(created)
+        running.refresh_from_db()
+        self.assertEqual(running.status, CrawlJob.STATUS_FAILED)
+        self.assertEqual(running.error, 'Interrupted before completion.')
+
+    def test_parallel_job_reports_progress_from_worker_results(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+
+        def make_crawler(**kwargs):
+            crawler = MovieCrawler(**kwargs)
+            crawler.save_at = os.path.join(tmpdir.name, 'movies_data_country.json')
+            crawler.journal.path = os.path.join(tmpdir.name, 'movies_data_country.journal.jsonl')
+            crawler.fingerprints_path = os.path.join(tmpdir.name, 'country_fingerprints.json')
+            return crawler
+
+        job, _ = jobs.submit_crawl_job({'top_n': 2, 'workers': 2})
+        countries = {'KR': 'South Korea', 'US': 'United States'}
+        # 워커 프로세스는 fork로 패치된 crawl_country를 그대로 사용
+        with mock.patch.object(jobs, 'MovieCrawler', side_effect=make_crawler), \
+                mock.patch.object(MovieCrawler, 'load_country_codes', return_value=countries), \
+                mock.patch.object(MovieCrawler, 'crawl_country', fake_crawl_country):
+            self.executor.run_all()
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, CrawlJob.STATUS_SUCCEEDED)
+        self.assertEqual(job.result['movies_count'], 4)
+        self.assertEqual(job.progress, 4)
+        self.assertEqual(job.total, 4)
+
+
+class SaveMoviesFromJsonTest(TestCase):
+    def records(self, count, country="South Korea"):
+        return [
+            make_record(country, rank, f"{country} {rank}", genres=("Drama", f"Genre {rank % 3}"),
+                        actors=(f"Actor {rank}", "Song Kang-ho"))
+            for rank in range(1, count + 1)
+        ]
+
+    def test_breakdown_of_saved_duplicate_and_updated_movies(self):
+        save_movies_from_json(self.records(3))
+        payload = self.records(3)
+        payload[1]["movie"]["score"] = "7.0"
+        payload.append(make_record("Brazil", 1, "South Korea 1"))
+
+        result = save_movies_from_json(payload)
+
+        self.assertEqual(result["saved_movies"], [])
+        self.assertEqual([movie.title for movie in result["duplicate_movies"]],
+                         ["South Korea 1", "South Korea 2", "South Korea 3", "South Korea 1"])
+        self.assertEqual([movie.title for movie in result["updated_movies"]], ["South Korea 2"])
+        self.assertEqual(result["updated_fields"], {"South Korea 2": ["score"]})
+        self.assertEqual(Movie.objects.get(title="South Korea 2").score, Decimal("7.0"))
+        self.assertEqual(Movie.objects.get(title="South Korea 1").genres.count(), 2)
+        self.assertEqual(Ranking.objects.filter(country__name="Brazil").count(), 1)
+
+    def test_query_count_does_not_grow_with_payload(self):
+        with CaptureQueriesContext(connection) as small:
+            save_movies_from_json(self.records(3, "Brazil"))
+        with CaptureQueriesContext(connection) as large:
+            save_movies_from_json(self.records(40, "South Africa"))
+        # 두 번째 호출은 장르가 이미 있어 INSERT가 하나 적을 수 있음
+        self.assertLessEqual(len(large), len(small))
+        self.assertEqual(Movie.objects.count(), 43)
+
+    def test_changed_movies_are_updated_in_one_statement(self):
+        save_movies_from_json(self.records(20))
+        payload = self.records(20)
+        for record in payload:
+            record["movie"]["score"] = "6.1"
+        payload[0]["movie"]["summary"] = "changed"
+
+        with CaptureQueriesContext(connection) as queries:
+            result = save_movies_from_json(payload)
+
+        updates = [q for q in queries.captured_queries if q["sql"].startswith('UPDATE "db_storage_movie"')]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(result["updated_fields"]["South Korea 1"], ["score", "summary"])
+        self.assertEqual(Movie.objects.filter(score=Decimal("6.1")).count(), 20)
+
+    def test_unchanged_records_skip_field_and_relation_work(self):
+        # 이름 캐시가 warm 된 상태(커밋 이후)에서 비교
+        self.addCleanup(clear_interning_caches)
+        with self.captureOnCommitCallbacks(execute=True):
+            save_movies_from_json(self.records(30))
+        payload = self.records(30)
+        payload[4]["movie"]["genres"].append("Thriller")
+
+        with CaptureQueriesContext(connection) as queries:
+            result = save_movies_from_json(payload)
+
+        self.assertEqual(result["unchanged_count"], 29)
+        self.assertEqual(result["updated_fields"], {})
+        self.assertEqual(Movie.objects.get(title="South Korea 5").genres.count(), 3)
+        # 바뀐 레코드 하나의 장르/배우만 조회
+        relation_lookups = [q for q in queries.captured_queries if 'FROM "db_storage_moviegenre"' in q["sql"]]
+        self.assertEqual(len(relation_lookups), 1)
+
+        # 모두 같은 내용이면 장르/배우는 조회하지 않음
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(save_movies_from_json(payload)["unchanged_count"], 30)
+        self.assertFalse([q for q in queries.captured_queries if '"db_storage_genre"' in q["sql"]])
+
+
+class IterMoviesFromJsonFileTest(TestCase):
+    def test_incremental_parse_matches_json_load(self):
+        records = [make_record("South Korea", rank, f"영화 {rank} \"quoted\" [x]") for rank in range(1, 30)]
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False, encoding='utf-8') as f:
+            json.dump({"movies": records}, f, ensure_ascii=False, indent=4)
+        self.addCleanup(os.remove, f.name)
+
+        # 작은 chunk 로 레코드가 chunk 경계에 걸리는 경우까지 확인
+        self.assertEqual(list(iter_movies_from_json_file(f.name, chunk_size=7)), records)
+
+        progress = []
+        summary = ingest_movie_stream(
+            iter_movies_from_json_file(f.name), batch_size=10, progress_callback=lambda s: progress.append(s['records'])
+        )
+        self.assertEqual(progress, [10, 20, 29])
+        self.assertEqual(summary["saved_count"], 29)
+
+    def test_malformed_record_fails_without_reading_the_rest(self):
+        records = [make_record("South Korea", rank, f"영화 {rank}") for rank in range(1, 3001)]
+        body = json.dumps({"movies": records}, ensure_ascii=False)
+        bad_start = body.index('{"country"', body.index('{"country"') + 1)
+        body = body[:bad_start] + '{"country": "South Korea", oops' + body[bad_start:]
+        stream = mock.Mock(wraps=io.StringIO(body))
+
+        movies = iter_movies_from_json(stream, chunk_size=4 * 1024)
+        self.assertEqual(next(movies), records[0])
+        with self.assertRaises(json.JSONDecodeError):
+            next(movies)
+        # 잘못된 레코드가 있는 chunk 까지만 읽음
+        self.assertLessEqual(stream.read.call_count, 3)
+        self.assertGreater(len(body) // (4 * 1024), 100)
+
+
+class RankingSnapshotTest(TestCase):
+    def test_only_changed_ranks_are_stored_and_history_is_reconstructed(self):
+        first_run = [make_record("South Korea", rank, f"영화 {rank}") for rank in range(1, 4)]
+        first = ingest_movie_stream(iter(first_run))
+        # 3위와 4위가 바뀌고 나머지는 그대로
+        second_run = first_run[:2] + [make_record("South Korea", 3, "영화 4")]
+        second = ingest_movie_stream(iter(second_run))
+        third = ingest_movie_stream(iter(second_run))
+
+        self.assertEqual(RankingDelta.objects.filter(snapshot_id=first["snapshot_id"]).count(), 3)
+        self.assertEqual(RankingDelta.objects.filter(snapshot_id=second["snapshot_id"]).count(), 1)
+        self.assertEqual(RankingDelta.objects.filter(snapshot_id=third["snapshot_id"]).count(), 0)
+
+        as_of_first = get_ranking_as_of(first["snapshot_id"], "South Korea")
+        as_of_third = get_ranking_as_of(third["snapshot_id"], "south korea")
+        self.assertEqual([row["title"] for row in as_of_first], ["영화 1", "영화 2", "영화 3"])
+        self.assertEqual([row["title"] for row in as_of_third], ["영화 1", "영화 2", "영화 4"])
+
+    def test_rank_missing_from_new_run_is_recorded_as_removed(self):
+        save_movies_from_json([make_record("Brazil", rank, f"Filme {rank}") for rank in range(1, 3)])
+        save_movies_from_json([make_record("Brazil", 1, "Filme 1")])
+
+        latest = RankingDelta.objects.latest("snapshot_id")
+        self.assertEqual((latest.rank, latest.movie, latest.removed), (2, None, True))
+        self.assertEqual(len(get_ranking_as_of(latest.snapshot_id, "Brazil")), 1)
+
+    def test_failed_batch_is_not_recorded_as_removed(self):
+        ingest_movie_stream(iter([make_record("Brazil", rank, f"Filme {rank}") for rank in range(1, 4)]))
+        run = [make_record("Brazil", 1, "Filme 1"), make_record("Brazil", 2, None), make_record("Brazil", 3, "Filme 3")]
+
+        summary = ingest_movie_stream(iter(run), batch_size=1)
+
+        self.assertEqual(summary["failed_batches"], 1)
+        self.assertFalse(RankingDelta.objects.filter(removed=True).exists())
+        self.assertEqual(len(get_ranking_as_of(summary["snapshot_id"], "Brazil")), 3)
+
+    def test_rejected_runs_leave_no_snapshot(self):
+        client = APIClient()
+        self.assertEqual(client.post('/api/bulk-insert-ranking/', {"movies": []}, format='json').status_code,
+                         status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(client.post('/api/bulk-insert-ranking/', data=b'{"country": ',
+                                     content_type='application/x-ndjson').status_code, status.HTTP_400_BAD_REQUEST)
+        failed = ingest_movie_stream(iter([make_record("Brazil", 1, None), make_record("Japan", 1, None)]))
+        self.assertEqual((failed["failed_batches"], failed["snapshot_id"]), (2, None))
+        save_movies_from_json([])
+        self.assertFalse(RankingSnapshot.objects.exists())
+
+        # 첫 배치가 실패해도 이후 커밋된 배치는 스냅샷 하나에 기록
+        summary = ingest_movie_stream(iter([make_record("Brazil", 1, None), make_record("Japan", 1, "映画 1")]))
+        self.assertEqual(RankingSnapshot.objects.get().pk, summary["snapshot_id"])
+        self.assertEqual(get_ranking_as_of(summary["snapshot_id"], "Japan")[0]["title"], "映画 1")
+
+    def test_history_keeps_title_after_movie_is_deleted(self):
+        first = ingest_movie_stream(iter([make_record("Brazil", 1, "Filme 1")]))
+        Movie.objects.filter(title="Filme 1").delete()
+
+        self.assertEqual(
+            get_ranking_as_of(first["snapshot_id"], "Brazil"), [{"rank": 1, "movie_id": None, "title": "Filme 1"}]
+        )
+
+
+class ParallelIngestTest(TestCase):
+    def test_staged_ingest_matches_serial_result(self):
+        records = [
+            make_record(country, rank, f"{country} {rank}", genres=("Drama", "Drama", f"Genre {rank}"))
+            for country in ("South Korea", "Brazil", "Japan") for rank in range(1, 6)
+        ]
+        records[6]["movie"]["score"] = ""
+
+        with tempfile.TemporaryDirectory() as staging_dir:
+            summary = ingest_movies_parallel(iter(records), workers=2, staging_dir=staging_dir)
+            self.assertEqual(len(os.listdir(staging_dir)), 3)
+
+        self.assertEqual(summary["staged_countries"], 3)
+        self.assertEqual(summary["batches"], 1)
+        self.assertEqual(summary["saved_count"], 15)
+        self.assertEqual(
+            list(Ranking.objects.filter(country__name="Brazil").order_by("rank").values_list("movie__title", flat=True)),
+            [f"Brazil {rank}" for rank in range(1, 6)],
+        )
+        self.assertEqual(Movie.objects.get(title="Brazil 2").score, Decimal("0"))
+        self.assertEqual(Movie.objects.get(title="Japan 1").genres.count(), 2)
+        # 다시 저장하면 미리 계산한 해시가 저장된 해시와 같아 모두 변경 없음으로 처리
+        self.assertEqual(ingest_movie_stream(iter(records))["unchanged_count"], 15)
+
+    def test_merge_failure_rolls_back_every_staged_country(self):
+        records = [make_record(country, 1, f"{country} 1") for country in ("South Korea", "Brazil")]
+        records.append(make_record("Japan", 1, None))
+
+        with self.assertRaises(IntegrityError):
+            ingest_movies_parallel(iter(records), workers=2)
+
+        self.assertFalse(Movie.objects.exists())
+        self.assertFalse(Ranking.objects.exists())
+
+
+class BenchmarkHarnessTest(TestCase):
+    def test_generator_is_seeded_and_benchmark_rolls_back(self):
+        records = generate_records(countries=4, ranks=5, actors_per_movie=2, overlap=0.5, seed=7)
+        self.assertEqual(records, generate_records(countries=4, ranks=5, actors_per_movie=2, overlap=0.5, seed=7))
+        self.assertLess(len({record["movie"]["title"] for record in records}), len(records))
+
+        report = run_benchmarks(countries=4, ranks=5, actors_per_movie=2, overlap=0.5, seed=7)
+
+        self.assertEqual([r["phase"] for r in report["results"]], ["ingest", "reingest", "read_per_country"])
+        self.assertTrue(all(r["queries"] > 0 and r["peak_kib"] > 0 for r in report["results"]))
+        # 국가별 조회는 커밋 이후와 같이 leaderboard 조회 한 번
+        self.assertEqual(report["results"][-1]["queries"], 1)
+        self.assertFalse(Movie.objects.exists())
+
+
+class NameInterningTest(TestCase):
+    def setUp(self):
+        clear_interning_caches()
+        self.addCleanup(clear_interning_caches)
+
+    def test_known_names_are_served_without_queries(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            save_movies_from_json([make_record("South Korea", 1, "기생충", genres=("Drama", "Thriller"))])
+
+        korea = Country.objects.get(name="South Korea")
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(set(genre_ids.get_ids(["Drama", "Thriller"])), {"Drama", "Thriller"})
+            self.assertEqual(country_ids.get_id("south korea"), korea.pk)
+        self.assertEqual(len(queries), 0)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(get_movies_by_country_name("SOUTH KOREA")[0]["title"], "기생충")
+        self.assertFalse([q for q in queries.captured_queries if 'FROM "db_storage_country"' in q["sql"]])
+
+    def test_lru_eviction_and_delete_invalidation(self):
+        interner = genre_ids
+        interner.maxsize = 2
+        self.addCleanup(setattr, interner, "maxsize", 1_000)
+        Genre.objects.bulk_create([Genre(name=name) for name in ("A", "B", "C")])
+        with self.captureOnCommitCallbacks(execute=True):
+            interner.get_ids(["A", "B", "C"])
+        self.assertEqual(interner.stats()["size"], 2)
+
+        Genre.objects.get(name="C").delete()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(interner.get_ids(["C"]), {})
+
+    def test_warm_in_rolled_back_transaction_is_retried(self):
+        Genre.objects.bulk_create([Genre(name=name) for name in ("Drama", "Comedy")])
+        with self.assertRaises(IntegrityError):
+            with transaction.atomic():
+                genre_ids.get_ids(["Drama"])
+                raise IntegrityError("rolled back")
+        self.assertEqual(genre_ids.stats()["size"], 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            genre_ids.get_ids(["Drama"])
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(set(genre_ids.get_ids(["Drama", "Comedy"])), {"Drama", "Comedy"})
+        self.assertEqual(len(queries), 0)
+
+
+class CountryReadPathTest(TestCase):
+    def setUp(self):
+        # 저장이 커밋된 뒤(이름 캐시 warm)의 조회 쿼리 수를 확인
+        clear_interning_caches()
+        self.addCleanup(clear_interning_caches)
+        with self.captureOnCommitCallbacks(execute=True):
+            for country in ("South Korea", "Brazil", "Japan"):
+                save_movies_from_json([
+                    make_record(country, rank, f"{country} {rank}", genres=("Drama", f"Genre {rank}"),
+                                actors=(f"{country} Actor {rank}", "Song Kang-ho"))
+                    for rank in range(1, 8)
+                ])
+
+    def test_single_country_uses_fixed_query_count(self):
+        with CaptureQueriesContext(connection) as queries:
+            movies = get_movies_by_country_name("Brazil")
+        self.assertEqual([movie["rank"] for movie in movies], [1, 2, 3, 4, 5])
+        self.assertEqual(sorted(movies[0]["genres"]), ["Drama", "Genre 1"])
+        self.assertEqual(sorted(movies[0]["actors"]), ["Brazil Actor 1", "Song Kang-ho"])
+        self.assertLessEqual(len(queries), 2)
+
+    def test_multi_country_top_k_in_one_pass(self):
+        with CaptureQueriesContext(connection) as queries:
+            result = get_movies_by_country_names(["Japan", "South Korea", "Nowhere"], k=3)
+        # 캐시에 없는 국가 이름 조회 1번 + leaderboard 1번
+        self.assertEqual(len(queries), 2)
+        self.assertEqual([movie["title"] for movie in result["Japan"]], ["Japan 1", "Japan 2", "Japan 3"])
+        self.assertEqual([movie["rank"] for movie in result["South Korea"]], [1, 2, 3])
+        self.assertEqual(result["Nowhere"], [])
+        self.assertEqual(result["Japan"][0], get_movies_by_country_name("Japan")[0])
+
+    def test_visualizers_skip_unknown_countries_without_extra_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            visualizers = Visualizer.for_countries(["Japan", "Nowhere"])
+        self.assertEqual(len(queries), 2)
+        self.assertEqual([visualizer.country_name for visualizer in visualizers], ["Japan"])
+        self.assertIn("Japan 1", visualizers[0].visualize_TOPK())
+
+        # 빈 영화 리스트는 조회 결과로 그대로 사용
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(Visualizer(country_name="Nowhere", movies=[]).movies, [])
+        self.assertEqual(len(queries), 0)
+
+    def test_leaderboard_follows_movie_changes_from_other_countries(self):
+        # Brazil 데이터로 Japan 1위 영화의 점수와 장르가 바뀌면 Japan leaderboard 도 갱신
+        brazil = [make_record("Brazil", rank, f"Brazil {rank}", genres=("Drama", f"Genre {rank}"),
+                              actors=(f"Brazil Actor {rank}", "Song Kang-ho")) for rank in range(1, 8)]
+        save_movies_from_json(brazil + [make_record("Brazil", 8, "Japan 1", genres=("Drama", "Genre 1", "Anime"),
+                                                    actors=("Japan Actor 1", "Song Kang-ho"))])
+        japan_first = get_movies_by_country_name("Japan")[0]
+        self.assertEqual(sorted(japan_first["genres"]), ["Anime", "Drama", "Genre 1"])
+        self.assertEqual(CountryLeaderboard.objects.filter(country__name="Brazil").count(), 8)
+
+    def test_rank_changes_reach_ranking_and_leaderboard(self):
+        # 1위와 2위가 자리를 바꾸고 3위에 새 영화가 들어옴
+        records = [make_record("Japan", rank, f"Japan {rank}", genres=("Drama", f"Genre {rank}"),
+                               actors=(f"Japan Actor {rank}", "Song Kang-ho")) for rank in range(1, 8)]
+        records[0]["rank"], records[1]["rank"] = 2, 1
+        records[2] = make_record("Japan", 3, "Japan New")
+        save_movies_from_json(records)
+
+        expected = ["Japan 2", "Japan 1", "Japan New", "Japan 4", "Japan 5"]
+        self.assertEqual([movie["title"] for movie in get_movies_by_country_name("Japan")], expected)
+        self.assertEqual(
+            list(Ranking.objects.filter(country__name="Japan").order_by("rank")
+                 .values_list("movie__title", flat=True)[:5]),
+            expected,
+        )
+
+    def test_shorter_run_removes_missing_ranks(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        get_cached_movies_by_country_name("Japan")
+        # 7개였던 Japan 순위가 2개로 줄어든 실행 (Japan 이 두 배치에 걸침)
+        run = [make_record("Japan", 1, "Japan 3"), make_record("Japan", 2, "Japan 1")]
+        with self.captureOnCommitCallbacks(execute=True):
+            summary = ingest_movie_stream(iter(run), batch_size=1)
+
+        expected = ["Japan 3", "Japan 1"]
+        self.assertEqual(
+            list(Ranking.objects.filter(country__name="Japan").order_by("rank").values_list("movie__title", flat=True)),
+            expected,
+        )
+        self.assertEqual([movie["title"] for movie in get_movies_by_country_name("Japan")], expected)
+        self.assertEqual([movie["title"] for movie in get_cached_movies_by_country_name("Japan")], expected)
+        self.assertEqual([row["title"] for row in get_ranking_as_of(summary["snapshot_id"], "Japan")], expected)
+        self.assertEqual(CountryLeaderboard.objects.filter(country__name="Brazil").count(), 7)
+
+        # 한 번의 호출로 저장해도 같음
+        save_movies_from_json([make_record("Japan", 1, "Japan 3")])
+        self.assertEqual(list(CountryLeaderboard.objects.filter(country__name="Japan").values_list("title", flat=True)),
+                         ["Japan 3"])
+
+
+class CountryReadCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        reset_cache_stats()
+        # on_commit 콜백을 실행하면 이름 캐시에 테스트 트랜잭션의 id가 들어가므로 끝나면 비움
+        self.addCleanup(clear_interning_caches)
+        with self.captureOnCommitCallbacks(execute=True):
+            save_movies_from_json([make_record("Brazil", rank, f"Filme {rank}") for rank in range(1, 4)])
+
+    def test_repeated_reads_skip_database_until_ingest_commits(self):
+        first = get_cached_movies_by_country_name("Brazil")
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(get_cached_movies_by_country_name("brazil"), first)
+        self.assertEqual(len(queries), 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            save_movies_from_json([make_record("Brazil", rank, f"Filme {rank}") for rank in range(1, 5)])
+        self.assertEqual(len(get_cached_movies_by_country_name("Brazil")), 4)
+        self.assertEqual(cache_stats(), {"hits": 1, "misses": 2, "hit_ratio": 0.333})
+
+
+class LookupIndexPlanTest(TestCase):
+    def assertUsesIndex(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertIn(index_name, plan)
+        self.assertNotRegex(plan, r"SCAN db_storage_(country|movie|ranking)\b")
+
+    def test_hot_lookups_are_index_searches(self):
+        self.assertUsesIndex(
+            Country.objects.filter(Exact(Lower("name"), Lower(Value("South Korea")))), "country_name_lower_unique"
+        )
+        self.assertUsesIndex(Movie.objects.filter(title="기생충"), "movie_title_idx")
+        self.assertUsesIndex(
+            Ranking.objects.filter(country_id=1).order_by("rank").values_list("rank", "movie_id"),
+            "COVERING INDEX ranking_country_rank_movie_idx",
+        )
+
+    def test_country_names_are_unique_regardless_of_case(self):
+        Country.objects.create(name="South Korea")
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Country.objects.create(name="south korea")
+
+    def test_non_ascii_case_folding_matches_sqlite_lower(self):
+        # SQLite LOWER() 는 ASCII만 바꾸므로 "TÜRKIYE"와 "Türkiye"는 서로 다른 국가
+        ids = country_ids.get_or_create_ids(["Türkiye", "TÜRKIYE"])
+        self.assertNotEqual(ids["Türkiye"], ids["TÜRKIYE"])
+        self.assertEqual(Country.objects.filter(name__in=["Türkiye", "TÜRKIYE"]).count(), 2)
+
+        clear_interning_caches()
+        self.assertEqual(country_ids.get_id("türkiye"), ids["Türkiye"])
+        self.assertEqual(country_ids.get_id("TüRKIYE"), ids["Türkiye"])
+        self.assertEqual(country_ids.get_id("TÜRKIYE"), ids["TÜRKIYE"])
+        self.assertNotEqual(country_ids.key("TÜRKIYE"), country_ids.key("Türkiye"))
+
+
+class KeysetPaginatedApiTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        save_movies_from_json([
+            make_record("South Korea", rank, f"영화 {rank:02d}", genres=("Drama", f"Genre {rank}"))
+            for rank in range(1, 31)
+        ])
+
+    def test_rankings_are_paged_by_cursor_without_offset(self):
+        url = reverse("rankings-by-country", kwargs={"country_name": "south korea"})
+        first = self.client.get(url, {"page_size": 10}).json()
+        self.assertEqual([row["rank"] for row in first["results"]], list(range(1, 11)))
+        self.assertEqual(first["results"][0]["movie"]["genres"], ["Drama", "Genre 1"])
+
+        with CaptureQueriesContext(connection) as queries:
+            second = self.client.get(first["next"]).json()
+        self.assertEqual([row["rank"] for row in second["results"]], list(range(11, 21)))
+        self.assertFalse([q for q in queries.captured_queries if "OFFSET" in q["sql"]])
+
+        self.assertEqual(self.client.get(reverse("rankings-by-country", kwargs={"country_name": "Nowhere"})).status_code,
+                         status.HTTP_404_NOT_FOUND)
+
+    def test_fields_projection_skips_unrequested_relations(self):
+        Movie.objects.bulk_create([Movie(title=f"Extra {i}", release_year="2000", score=5) for i in range(100)])
+        url = reverse("movie-list")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {"fields": "id,title", "page_size": 1000})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["results"]), 100)
+        self.assertEqual(set(response.json()["results"][0]), {"id", "title"})
+        self.assertFalse([q for q in queries.captured_queries if "db_storage_genre" in q["sql"]])
+        self.assertFalse([q for q in queries.captured_queries if '"summary"' in q["sql"]])
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse("rankings-by-country", kwargs={"country_name": "South Korea"}), {"fields": "title"}
+            )
+        self.assertEqual(set(response.json()["results"][0]["movie"]), {"title"})
+        self.assertFalse([q for q in queries.captured_queries if '"summary"' in q["sql"]])
+
+        self.assertEqual(self.client.get(url, {"fields": "title,budget"}).status_code, status.HTTP_400_BAD_REQUEST)
@@ -1,12 +1,16 @@
 from django.contrib import admin
 from django.urls import path
-from .views import BulkInsertRankingView, GetMovieListByCountryAPIView, CrawlMoviesView
+from .views import BulkInsertRankingView, GetMovieListByCountryAPIView, CrawlMoviesView, CrawlJobStatusView
+from .views import RankingListView, MovieListView
 from django.urls import path
 from .views import home
 
 urlpatterns = [
     path('bulk-insert-ranking/', BulkInsertRankingView.as_view(), name='bulk-insert-ranking'),
+    path('movies/', MovieListView.as_view(), name='movie-list'),
+    path('rankings/<str:country_name>/', RankingListView.as_view(), name='rankings-by-country'),
     path('movies/<str:country_name>/', GetMovieListByCountryAPIView.as_view(), name='movies-by-country'),
     path('crawl_movies/', CrawlMoviesView.as_view(), name='crawl_movies'),
+    path('crawl_jobs/<uuid:job_id>/', CrawlJobStatusView.as_view(), name='crawl-job-status'),
     path('', home, name='home'),  # 루트 URL에 home 뷰 연결
 ]
\ No newline at end of file
@@ -1,65 +1,172 @@
 from decimal import Decimal
+import codecs
+import hashlib
+import json
 import logging
+import re
 from django.db import transaction
-from .models import Movie, Genre, Actor, Country, Ranking, MovieGenre, MovieActor
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+from .models import Movie, Ranking, MovieGenre, MovieActor, CountryLeaderboard
+from .snapshots import SnapshotRecorder
+from .interning import actor_ids, country_ids, genre_ids
 
-def save_movies_from_json(parsed_data: list) -> dict:
+# SQLite의 바인딩 변수 제한을 넘지 않도록 IN 조회를 나누는 크기
+IN_QUERY_CHUNK_SIZE = 500
+# 기존 영화 bulk_update 시 UPDATE 문 하나에 담을 영화 수
+BULK_UPDATE_BATCH_SIZE = 500
+# 버퍼 끝에서 잘려도 오류 위치가 토큰 시작으로 보고되는 가장 긴 토큰 길이 (\uXXXX, false)
+TRUNCATED_TOKEN_MAX_LENGTH = 6
+
+
+def _chunked(values: list, size: int = IN_QUERY_CHUNK_SIZE):
+    """리스트를 size 크기로 나누어 반환하는 제너레이터"""
+    for i in range(0, len(values), size):
+        yield values[i:i + size]
+
+
+def _unique(values) -> list:
+    """순서를 유지하며 중복을 제거한 리스트 반환"""
+    return list(dict.fromkeys(values))
+
+
+def _fetch_by_field(model, field: str, values: list) -> dict:
+    """
+    field 값 목록으로 객체를 IN 조회하는 함수 (같은 값이 여러 개면 id가 가장 작은 객체)
+
+    Returns:
+        dict: {field 값: 객체}
+    """
+    found = {}
+    for chunk in _chunked(values):
+        for obj in model.objects.filter(**{f'{field}__in': chunk}).order_by('-id'):
+            found[getattr(obj, field)] = obj
+    return found
+
+
+def _bump_data_version():
+    # read_cache 가 utils 를 import 하므로 호출 시점에 import
+    from .read_cache import bump_data_version
+    bump_data_version()
+
+
+def _normalize_score(score):
+    """score null 처리 ('', None, 'null' -> 0)"""
+    if not score or score == 'null':
+        return Decimal(0)
+    return score
+
+
+def movie_content_hash(movie_info: dict) -> str:
+    """
+    영화 레코드의 내용 해시를 계산하는 함수.
+    제목/개봉연도/점수/줄거리/이미지와 장르, 배우 집합을 정규화해 sha256으로 만든다.
+
+    Args:
+        movie_info (dict): 레코드의 'movie' 값.
+
+    Returns:
+        str: 16진수 sha256 (64자)
+    """
+    normalized = [
+        movie_info['title'],
+        movie_info.get('release_year', ''),
+        str(Decimal(str(_normalize_score(movie_info.get('score', 0.0)))).quantize(Decimal('0.1'))),
+        movie_info.get('summary', ''),
+        movie_info.get('image_url', ''),
+        sorted(set(movie_info.get('genres', []))),
+        sorted(set(movie_info.get('actors', []))),
+    ]
+    return hashlib.sha256(json.dumps(normalized, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+def save_movies_from_json(parsed_data: list, recorder: SnapshotRecorder = None, raise_errors: bool = False) -> dict:
     """
     JSON 데이터를 파싱하여 Django 데이터베이스에 저장하는 함수.
     중복 데이터 및 업데이트된 데이터를 반환.
 
+    장르/배우/국가는 이름 캐시(interning)에서, 영화는 제목별 IN 조회로 찾고 없는 것만 bulk_create하며,
+    관계(MovieGenre, MovieActor)는 미리 조회한 기존 쌍과 메모리에서 비교해 한 번에 생성하고,
+    Ranking은 (국가, 순위)별 현재 영화와 다른 행만 한 번에 upsert 하고,
+    recorder 없이 호출하면 이번 데이터의 국가에서 이번에 없는 순위를 삭제한다
+    (recorder를 넘기면 호출한 쪽이 마지막 배치 뒤에 finish_ingestion()으로 삭제).
+    저장 후 영향을 받은 국가의 CountryLeaderboard 만 다시 만든다.
+    기존 영화의 변경된 필드는 메모리에서 비교한 뒤 배치마다 bulk_update 한 번으로 반영한다.
+    따라서 쿼리 수는 데이터 건수와 거의 무관하다.
+    저장된 content_hash와 내용 해시가 같은 레코드는 필드 비교와 장르/배우 처리를 건너뛰고
+    랭킹만 저장하므로, 재수집 시 작업량은 바뀐 레코드 수에 비례한다.
+    이번 데이터의 (국가, 순위, 영화)는 RankingSnapshot에 직전 상태와 달라진 행만 기록한다.
+
     Args:
         parsed_data (list): 영화 데이터 리스트.
+        recorder (SnapshotRecorder): 여러 배치를 스냅샷 하나로 기록할 때 넘기는 recorder.
+            None이면 이번 호출을 스냅샷 하나로 기록한다.
+        raise_errors (bool): True이면 저장 중 예외를 그대로 전달 (바깥 트랜잭션까지 롤백할 때 사용).
+            False이면 이번 호출만 롤백하고 'error'에 메시지를 담아 빈 결과를 반환한다.
 
     Returns:
-        dict: {'saved_movies': list, 'duplicate_movies': list, 'updated_movies': list}
+        dict: {'saved_movies': list, 'duplicate_movies': list, 'updated_movies': list,
+               'updated_fields': {영화 제목: 변경된 필드 리스트}, 'unchanged_count': int,
+               'error': 실패 시 예외 메시지 (성공 시 None)}
     """
     saved_movies = []
     duplicate_movies = []
     updated_movies = []
+    # 기존 영화별 변경된 필드 (bulk_update 대상)
+    changed_fields = {}
+    unchanged_count = 0
 
     try:
         # 트랜잭션 시작
         with transaction.atomic():
-            movie_genre_relations = []
-            movie_actor_relations = []
-            ranking_relations = []
-
-            for movie_data in parsed_data:
-                # 1. 장르 저장
-                genres = []
-                for genre_name in movie_data['movie'].get('genres', []):
-                    genre, _ = Genre.objects.get_or_create(name=genre_name)
-                    genres.append(genre)
+            # 1. 영화 조회: 제목으로 한 번에 조회한 뒤 content_hash가 같은 레코드는 변경 없음으로 분류
+            movies = _fetch_by_field(Movie, 'title', _unique(data['movie']['title'] for data in parsed_data))
+            # staging 단계에서 미리 계산한 해시가 있으면 그대로 사용
+            hashes = [data.get('content_hash') or movie_content_hash(data['movie']) for data in parsed_data]
+            changed_data = [
+                data for data, content_hash in zip(parsed_data, hashes)
+                if data['movie']['title'] not in movies or movies[data['movie']['title']].content_hash != content_hash
+            ]
 
-                # 2. 배우 저장
-                actors = []
-                for actor_name in movie_data['movie'].get('actors', []):
-                    actor, _ = Actor.objects.get_or_create(name=actor_name)
-                    actors.append(actor)
+            # 2. 장르, 배우, 국가 저장 (이름별 IN 조회 + 없는 것만 bulk_create, 장르/배우는 바뀐 레코드만)
+            genres = genre_ids.get_or_create_ids(
+                name for data in changed_data for name in data['movie'].get('genres', [])
+            )
+            actors = actor_ids.get_or_create_ids(
+                name for data in changed_data for name in data['movie'].get('actors', [])
+            )
+            countries = country_ids.get_or_create_ids(data['country'] for data in parsed_data)
 
-                # 3. 영화 저장
+            # 3. 영화 저장: 새 영화는 모아서 bulk_create, 기존 영화는 바뀐 필드만 bulk_update
+            new_movies = []
+            record_movies = []
+            # 관계(장르/배우)를 확인할 레코드 (내용 해시가 달라진 레코드)
+            changed_records = []
+            for movie_data, content_hash in zip(parsed_data, hashes):
                 movie_info = movie_data['movie']
-                # score null 처리
-                score = movie_info.get('score', 0.0)
-                if not score or score == 'null':
-                    score = Decimal(0)
-                movie, created = Movie.objects.get_or_create(
-                    title=movie_info['title'],
-                    defaults={
-                        'release_year': movie_info.get('release_year', ''),
-                        'score': score,
-                        'summary': movie_info.get('summary', ''),
-                        'image_url': movie_info.get('image_url', ''),
-                    }
-                )
+                score = _normalize_score(movie_info.get('score', 0.0))
+                movie = movies.get(movie_info['title'])
 
-                if created:  # 새로 저장된 영화
+                if movie is None:  # 새로 저장된 영화
+                    movie = Movie(
+                        title=movie_info['title'],
+                        release_year=movie_info.get('release_year', ''),
+                        score=score,
+                        summary=movie_info.get('summary', ''),
+                        image_url=movie_info.get('image_url', ''),
+                        content_hash=content_hash,
+                    )
+                    movies[movie.title] = movie
+                    new_movies.append(movie)
                     saved_movies.append(movie)
+                    changed_records.append((movie_data, movie))
+                elif movie.content_hash == content_hash:  # 저장된 내용과 같은 영화
+                    duplicate_movies.append(movie)
+                    unchanged_count += 1
                 else:  # 기존에 존재하던 영화
                     duplicate_movies.append(movie)  # 중복 영화 목록에 추가
                     updated_fields = []
-                    
+
                     # 필드 비교 후 업데이트
                     if movie.release_year != movie_info.get('release_year', ''):
                         movie.release_year = movie_info.get('release_year', '')
@@ -76,46 +183,436 @@ def save_movies_from_json(parsed_data: list) -> dict:
                         movie.image_url = movie_info.get('image_url', '')
                         updated_fields.append('image_url')
 
+                    movie.content_hash = content_hash
+                    # 이번 데이터에서 새로 만든 영화는 아직 저장 전이므로 값만 바꿔 둠
+                    if movie.pk is not None:
+                        changed_fields.setdefault(movie, set()).update(updated_fields)
                     if updated_fields:
-                        movie.save(update_fields=updated_fields)
                         updated_movies.append(movie)  # 실제로 업데이트된 영화만 추가
+                    changed_records.append((movie_data, movie))
+                record_movies.append(movie)
 
-                # 영화와 장르/배우 관계 추가
-                for genre in genres:
-                    if not MovieGenre.objects.filter(movie=movie, genre=genre).exists():
-                        movie_genre_relations.append(MovieGenre(movie=movie, genre=genre))
+            if changed_fields:
+                # 변경된 필드의 합집합으로 배치당 UPDATE 한 번 (장르/배우만 바뀌어도 해시는 갱신)
+                fields = sorted(set().union(*changed_fields.values(), {'content_hash'}))
+                Movie.objects.bulk_update(list(changed_fields), fields, batch_size=BULK_UPDATE_BATCH_SIZE)
 
-                for actor in actors:
-                    if not MovieActor.objects.filter(movie=movie, actor=actor).exists():
-                        movie_actor_relations.append(MovieActor(movie=movie, actor=actor))
+            if new_movies:
+                Movie.objects.bulk_create(new_movies)
+                if any(movie.pk is None for movie in new_movies):
+                    created = _fetch_by_field(Movie, 'title', [movie.title for movie in new_movies])
+                    for movie in new_movies:
+                        movie.pk = created[movie.title].pk
 
-                # 4. 랭킹 저장
-                country_name = movie_data['country']
-                country, _ = Country.objects.get_or_create(name=country_name)
-                rank = movie_data['rank']
+            # 4. 관계 저장: 기존 쌍을 한 번에 조회한 뒤 없는 쌍만 bulk_create
+            existing_genre_pairs, existing_actor_pairs = set(), set()
+            for chunk in _chunked(_unique(movie.pk for _, movie in changed_records)):
+                existing_genre_pairs.update(
+                    MovieGenre.objects.filter(movie_id__in=chunk).values_list('movie_id', 'genre_id')
+                )
+                existing_actor_pairs.update(
+                    MovieActor.objects.filter(movie_id__in=chunk).values_list('movie_id', 'actor_id')
+                )
+            # 이번 데이터에 나온 국가의 현재 순위 {(country_id, rank): movie_id}
+            existing_ranks = {}
+            for chunk in _chunked(_unique(countries[data['country']] for data in parsed_data)):
+                existing_ranks.update(
+                    ((country_id, rank), movie_id) for country_id, rank, movie_id in
+                    Ranking.objects.filter(country_id__in=chunk).values_list('country_id', 'rank', 'movie_id')
+                )
 
-                if not Ranking.objects.filter(country=country, movie=movie).exists():
-                    ranking_relations.append(Ranking(country=country, movie=movie, rank=rank))
+            movie_genre_relations = []
+            movie_actor_relations = []
+            ranking_relations = []
+            for movie_data, movie in changed_records:
+                # 영화와 장르/배우 관계 추가
+                for genre_name in movie_data['movie'].get('genres', []):
+                    pair = (movie.pk, genres[genre_name])
+                    if pair not in existing_genre_pairs:
+                        existing_genre_pairs.add(pair)
+                        movie_genre_relations.append(MovieGenre(movie=movie, genre_id=genres[genre_name]))
+
+                for actor_name in movie_data['movie'].get('actors', []):
+                    pair = (movie.pk, actors[actor_name])
+                    if pair not in existing_actor_pairs:
+                        existing_actor_pairs.add(pair)
+                        movie_actor_relations.append(MovieActor(movie=movie, actor_id=actors[actor_name]))
+
+            # 5. 랭킹 저장: (국가, 순위)별로 마지막 레코드의 영화가 현재 영화와 다른 행만 upsert
+            ranked_movies = {}
+            for movie_data, movie in zip(parsed_data, record_movies):
+                ranked_movies[(countries[movie_data['country']], movie_data['rank'])] = movie
+            for (country_id, rank), movie in ranked_movies.items():
+                if existing_ranks.get((country_id, rank)) != movie.pk:
+                    ranking_relations.append(Ranking(country_id=country_id, movie=movie, rank=rank))
 
             # Bulk 저장
             MovieGenre.objects.bulk_create(movie_genre_relations, ignore_conflicts=True)
             MovieActor.objects.bulk_create(movie_actor_relations, ignore_conflicts=True)
-            Ranking.objects.bulk_create(ranking_relations, ignore_conflicts=True)
+            # 이미 있는 (국가, 순위)는 영화만 바꿈 (순위가 바뀐 영화도 반영)
+            Ranking.objects.bulk_create(
+                ranking_relations, update_conflicts=True, unique_fields=['country', 'rank'], update_fields=['movie'],
+            )
+
+            # 이번 호출이 실행 전체이면 이번 데이터에 없는 순위는 삭제 (스냅샷에 removed 로 기록되는 행과 같음)
+            removed_country_ids = set()
+            if recorder is None:
+                ranks_by_country = {}
+                for country_id, rank in ranked_movies:
+                    ranks_by_country.setdefault(country_id, set()).add(rank)
+                removed_country_ids = delete_missing_ranks(ranks_by_country)
+
+            # 6. 순위가 바뀌거나 사라진 국가 + 필드/장르/배우가 바뀐 기존 영화가 순위에 있는 국가의 leaderboard 갱신
+            touched_country_ids = {ranking.country_id for ranking in ranking_relations} | removed_country_ids
+            for chunk in _chunked([movie.pk for movie in changed_fields]):
+                touched_country_ids.update(
+                    Ranking.objects.filter(movie_id__in=chunk).values_list('country_id', flat=True)
+                )
+            rebuild_country_leaderboards(touched_country_ids)
+
+            # 7. 랭킹 스냅샷 기록 (직전 상태와 달라진 순위만 저장)
+            ranking_rows = [
+                (countries[movie_data['country']], movie_data['rank'], movie.pk, movie.title)
+                for movie_data, movie in zip(parsed_data, record_movies)
+            ]
+            if recorder is None:
+                single_run = SnapshotRecorder()
+                single_run.record(ranking_rows)
+                single_run.finish()
+            else:
+                recorder.record(ranking_rows)
+
+            # 커밋 이후 조회 캐시 무효화 (데이터 버전 변경)
+            transaction.on_commit(_bump_data_version)
 
     except Exception as e:
+        if raise_errors:
+            raise
         logging.error(f"Error while saving movies: {e}")
-        return {'saved_movies': [], 'duplicate_movies': [], 'updated_movies': []}
+        return {
+            'saved_movies': [], 'duplicate_movies': [], 'updated_movies': [], 'updated_fields': {},
+            'unchanged_count': 0, 'error': str(e),
+        }
 
-    logging.info(f"Successfully saved {len(saved_movies)} movies.")
+    logging.info(f"Successfully saved {len(saved_movies)} movies ({unchanged_count} unchanged records skipped).")
     return {
         'saved_movies': saved_movies,
         'duplicate_movies': duplicate_movies,
-        'updated_movies': updated_movies
+        'updated_movies': updated_movies,
+        'updated_fields': {movie.title: sorted(fields) for movie, fields in changed_fields.items() if fields},
+        'unchanged_count': unchanged_count,
+        'error': None,
     }
-    
+
+
+def _iter_text_chunks(stream, chunk_size: int):
+    """파일/요청 스트림에서 chunk_size 만큼씩 읽어 문자열로 반환하는 제너레이터 (bytes는 UTF-8로 디코딩)"""
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            tail = decoder.decode(b'', final=True)
+            if tail:
+                yield tail
+            return
+        yield decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+
+
+def iter_movies_from_json(stream, chunk_size: int = 64 * 1024):
+    """
+    크롤링 결과 JSON({"movies": [...]})의 movies 배열을 레코드 단위로 읽는 제너레이터.
+    전체를 json.load 하지 않고 chunk_size 만큼씩 읽으므로 메모리 사용량이 입력 크기와 무관하다.
+
+    Args:
+        stream: read(size)를 지원하는 파일 또는 요청 스트림 (str 또는 bytes).
+        chunk_size (int): 한 번에 읽을 크기.
+
+    Yields:
+        dict: movies 배열의 레코드.
+
+    Raises:
+        json.JSONDecodeError: movies 배열을 찾을 수 없거나 형식이 잘못된 경우.
+    """
+    decoder = json.JSONDecoder()
+    movies_start = re.compile(r'"movies"\s*:\s*\[')
+    whitespace = re.compile(r'[\s,]*')
+    chunks = _iter_text_chunks(stream, chunk_size)
+    buffer = ''
+    eof = False
+
+    def read_more():
+        nonlocal buffer, eof
+        chunk = next(chunks, None)
+        eof = chunk is None
+        buffer += chunk or ''
+
+    # 1. movies 배열의 시작 위치 찾기
+    match = None
+    while match is None:
+        read_more()
+        match = movies_start.search(buffer)
+        if match is None and eof:
+            raise json.JSONDecodeError('"movies" array not found', buffer, 0)
+    pos = match.end()
+
+    # 2. 배열의 요소를 하나씩 디코딩 (요소가 chunk 경계에 걸리면 더 읽고 재시도)
+    while True:
+        pos = whitespace.match(buffer, pos).end()
+        if pos >= len(buffer):
+            if eof:
+                raise json.JSONDecodeError('Unterminated "movies" array', buffer, pos)
+            buffer, pos = buffer[pos:], 0
+            read_more()
+            continue
+        if buffer[pos] == ']':
+            return
+        try:
+            record, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError as e:
+            # 버퍼 끝에서 잘린 레코드만 더 읽고 재시도 (중간의 잘못된 레코드는 나머지를 읽지 않고 바로 실패)
+            if eof or not _is_truncated_json(e, buffer):
+                raise
+            buffer, pos = buffer[pos:], 0
+            read_more()
+            continue
+        yield record
+        pos = end
+
+
+def _is_truncated_json(error: json.JSONDecodeError, buffer: str) -> bool:
+    """raw_decode 오류가 버퍼 끝에서 레코드가 잘려서 난 것인지 (더 읽으면 디코딩될 수 있는지) 판단하는 함수"""
+    # 닫히지 않은 문자열은 문자열 시작 위치가, 잘린 토큰은 토큰 시작 위치가 오류 위치로 보고됨
+    return error.msg.startswith('Unterminated string') or error.pos >= len(buffer) - TRUNCATED_TOKEN_MAX_LENGTH
+
+
+def iter_movies_from_json_file(file_path: str, chunk_size: int = 64 * 1024):
+    """
+    크롤링 결과 JSON 파일의 movies 배열을 레코드 단위로 읽는 제너레이터 (iter_movies_from_json 참고)
+
+    Args:
+        file_path (str): JSON 파일 경로.
+        chunk_size (int): 한 번에 읽을 문자 수.
+
+    Yields:
+        dict: movies 배열의 레코드.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        yield from iter_movies_from_json(f, chunk_size)
+
+
+def iter_movies_from_ndjson(stream, chunk_size: int = 64 * 1024):
+    """
+    NDJSON(한 줄에 레코드 하나) 스트림을 도착하는 대로 레코드 단위로 읽는 제너레이터. 빈 줄은 무시한다.
+
+    Args:
+        stream: read(size)를 지원하는 파일 또는 요청 스트림 (str 또는 bytes).
+        chunk_size (int): 한 번에 읽을 크기.
+
+    Yields:
+        dict: 영화 레코드.
+
+    Raises:
+        json.JSONDecodeError: 줄의 형식이 잘못된 경우.
+    """
+    pending = ''
+    for chunk in _iter_text_chunks(stream, chunk_size):
+        pending += chunk
+        *lines, pending = pending.split('\n')
+        for line in lines:
+            if line.strip():
+                yield json.loads(line)
+    if pending.strip():
+        yield json.loads(pending)
+
+
+def ingest_movie_stream(records, batch_size: int = 100, collect_titles: bool = False, progress_callback=None) -> dict:
+    """
+    영화 레코드 스트림(제너레이터 등)을 배치 단위로 저장하는 함수.
+    배치가 가득 차거나 국가가 바뀔 때마다 save_movies_from_json을 호출하므로
+    국가 단위로 커밋되며, 메모리 사용량은 batch_size에만 비례한다.
+
+    배치마다 따로 커밋하므로 실패는 부분 커밋이 된다.
+        - 저장에 실패한 배치는 그 배치만 롤백되고 failed_batches/failed_records/errors 에 기록된다.
+        - 스트림 중간에 형식이 잘못된 레코드(JSONDecodeError)가 있으면 그 앞까지 읽은 레코드만 저장하고
+          parse_error 에 메시지를 남긴 뒤 멈춘다.
+    호출한 쪽은 이 값들로 부분 커밋 여부를 판단해야 한다.
+    이번 실행에 없는 순위는 마지막 배치 뒤에 별도 트랜잭션으로 삭제한다 (실패/형식 오류가 있던 국가는 제외).
+
+    Args:
+        records (iterable): {'country', 'movie', 'rank'} 형태의 영화 레코드 iterable.
+        batch_size (int): 한 번에 저장할 최대 레코드 수.
+        collect_titles (bool): True이면 저장/중복/업데이트된 영화 제목과 변경 필드도 반환.
+        progress_callback (callable): 배치가 커밋될 때마다 summary를 인자로 호출되는 함수.
+
+    Returns:
+        dict: {'saved_count': int, 'duplicate_count': int, 'updated_count': int, 'unchanged_count': int,
+               'batches': int, 'records': int, 'failed_batches': int, 'failed_records': int,
+               'errors': [{'batch', 'country', 'records', 'error'}], 'parse_error': str | None}
+               (collect_titles이면 'saved_movies', 'duplicate_movies', 'updated_movies', 'updated_fields' 포함)
+               + 'snapshot_id': 이번 실행의 RankingSnapshot id (커밋된 배치가 없으면 None)
+    """
+    summary = {
+        'saved_count': 0, 'duplicate_count': 0, 'updated_count': 0, 'unchanged_count': 0, 'batches': 0, 'records': 0,
+        'failed_batches': 0, 'failed_records': 0, 'errors': [], 'parse_error': None,
+    }
+    # 실행 전체를 스냅샷 하나로 기록 (스냅샷은 처음 커밋되는 배치에서 생성)
+    recorder = SnapshotRecorder()
+    if collect_titles:
+        summary.update({'saved_movies': [], 'duplicate_movies': [], 'updated_movies': [], 'updated_fields': {}})
+
+    def flush(batch):
+        result = save_movies_from_json(batch, recorder=recorder)
+        summary['saved_count'] += len(result['saved_movies'])
+        summary['duplicate_count'] += len(result['duplicate_movies'])
+        summary['updated_count'] += len(result['updated_movies'])
+        summary['unchanged_count'] += result['unchanged_count']
+        summary['batches'] += 1
+        summary['records'] += len(batch)
+        if result['error'] is not None:
+            summary['failed_batches'] += 1
+            summary['failed_records'] += len(batch)
+            summary['errors'].append({
+                'batch': summary['batches'], 'country': batch[0]['country'], 'records': len(batch),
+                'error': result['error'],
+            })
+            logging.error(f"Batch {summary['batches']} ({len(batch)} records, country: {batch[0]['country']}) failed.")
+            # 실패한 배치의 순위가 스냅샷에서 사라진 것으로 기록되지 않도록 제외
+            recorder.skip(batch[0]['country'])
+            # 이 배치에서 만든 스냅샷은 배치와 함께 롤백됨
+            recorder.discard_if_rolled_back()
+            return
+        if collect_titles:
+            for key in ('saved_movies', 'duplicate_movies', 'updated_movies'):
+                summary[key].extend(movie.title for movie in result[key])
+            summary['updated_fields'].update(result['updated_fields'])
+        logging.info(
+            f"Committed batch {summary['batches']} ({len(batch)} records, country: {batch[0]['country']}, "
+            f"total {summary['records']} records)."
+        )
+        if progress_callback is not None:
+            progress_callback(summary)
+
+    batch = []
+    last_country = None
+    records = iter(records)
+    while True:
+        try:
+            record = next(records)
+        except StopIteration:
+            break
+        except json.JSONDecodeError as e:
+            # 앞서 읽은 레코드까지만 저장하고 멈춤
+            logging.error(f"Stopped reading movie records after {summary['records'] + len(batch)} records: {e}")
+            summary['parse_error'] = str(e)
+            # 읽던 국가는 나머지 순위를 알 수 없으므로 스냅샷에서 사라진 순위를 기록하지 않음
+            if last_country is not None:
+                recorder.skip(last_country)
+            break
+        if batch and (len(batch) >= batch_size or record['country'] != batch[-1]['country']):
+            flush(batch)
+            batch = []
+        batch.append(record)
+        last_country = record['country']
+    if batch:
+        flush(batch)
+    # 마지막 배치 뒤에 사라진 순위를 스냅샷에 기록하고 Ranking/leaderboard 에서도 삭제
+    snapshot = finish_ingestion(recorder)
+    summary['snapshot_id'] = snapshot.pk if snapshot else None
+    return summary
+
+
+def delete_missing_ranks(ranks_by_country: dict) -> set:
+    """
+    국가별로 이번 실행의 순위에 없는 Ranking 행을 삭제하는 함수
+
+    Args:
+        ranks_by_country (dict): {country_id: 이번 실행의 순위 set}
+
+    Returns:
+        set: 순위가 삭제된 국가 id
+    """
+    stale = {}
+    for chunk in _chunked(list(ranks_by_country)):
+        rows = Ranking.objects.filter(country_id__in=chunk).values_list('pk', 'country_id', 'rank')
+        for pk, country_id, rank in rows:
+            if rank not in ranks_by_country[country_id]:
+                stale[pk] = country_id
+    for chunk in _chunked(list(stale)):
+        Ranking.objects.filter(pk__in=chunk).delete()
+    return set(stale.values())
+
+
+def finish_ingestion(recorder: SnapshotRecorder):
+    """
+    여러 배치로 나눠 저장한 실행을 트랜잭션 하나로 마무리하는 함수.
+    스냅샷에 사라진 순위를 기록하고, 같은 (국가, 순위)를 Ranking 에서 삭제한 뒤 그 국가의 leaderboard 를 다시 만든다.
+
+    Args:
+        recorder (SnapshotRecorder): 배치마다 record() 한 recorder.
+
+    Returns:
+        RankingSnapshot: 기록된 스냅샷 (커밋된 배치가 없었으면 None)
+    """
+    with transaction.atomic():
+        snapshot = recorder.finish()
+        if snapshot is None:
+            return None
+        removed_country_ids = delete_missing_ranks(recorder.complete_ranks())
+        if removed_country_ids:
+            rebuild_country_leaderboards(removed_country_ids)
+            transaction.on_commit(_bump_data_version)
+    return snapshot
+
+
+def _rankings_with_movies(rankings):
+    """랭킹의 영화(select_related)와 장르/배우(prefetch_related)를 한 번에 불러오는 queryset"""
+    return rankings.select_related('movie').prefetch_related('movie__genres', 'movie__actors')
+
+
+def rebuild_country_leaderboards(country_ids) -> int:
+    """
+    국가별 leaderboard 를 현재 Ranking/Movie/장르/배우로 다시 만드는 함수 (주어진 국가만)
+
+    Args:
+        country_ids (iterable): 다시 만들 국가 id 목록.
+
+    Returns:
+        int: 새로 만든 leaderboard 행 수
+    """
+    rows = []
+    for chunk in _chunked(_unique(country_ids)):
+        CountryLeaderboard.objects.filter(country_id__in=chunk).delete()
+        for ranking in _rankings_with_movies(Ranking.objects.filter(country_id__in=chunk)):
+            movie = ranking.movie
+            rows.append(CountryLeaderboard(
+                country_id=ranking.country_id, rank=ranking.rank, movie_id=movie.pk,
+                title=movie.title, release_year=movie.release_year, score=movie.score,
+                summary=movie.summary, image_url=movie.image_url,
+                genres=[genre.name for genre in movie.genres.all()],
+                actors=[actor.name for actor in movie.actors.all()],
+            ))
+    CountryLeaderboard.objects.bulk_create(rows, batch_size=BULK_UPDATE_BATCH_SIZE)
+    return len(rows)
+
+
+def _leaderboard_to_dict(row: CountryLeaderboard) -> dict:
+    """leaderboard 행을 응답 dict로 변환"""
+    return {
+        "rank": row.rank,
+        "title": row.title,
+        "release_year": row.release_year,
+        "score": float(row.score),
+        "summary": row.summary,
+        "image": row.image_url,
+        "genres": row.genres,
+        "actors": row.actors,
+    }
+
+
 def get_movies_by_country_name(name: str) -> list[dict]:
     '''
     국가 이름에 따라 1~5위 영화를 반환
+    (국가 id는 이름 캐시에서, 영화는 CountryLeaderboard 의 (country, rank) index 범위 탐색 쿼리 1번)
     
     Args:
         name: 국가 이름
@@ -124,30 +621,40 @@ def get_movies_by_country_name(name: str) -> list[dict]:
     
     '''
     try:
-        country = Country.objects.filter(name__iexact=name).first() # 국가를 DB에서 get
-        if not country:
+        country_id = country_ids.get_id(name) # 국가 id를 이름 캐시에서 get
+        if not country_id:
             return {'status_code': 404, 'method': 'get_movies_by_country_name', 'error': f'{name} does not exist'}
-        # 랭킹 데이터를 1~5위 까지 get
-        rankings = (
-            Ranking.objects.filter(country = country)
-            .select_related('movie')
-            .order_by('rank')[:5]
-        ) 
+        # 랭킹 데이터를 1~5위 까지 get (장르/배우까지 담긴 leaderboard 에서)
+        rows = CountryLeaderboard.objects.filter(country_id = country_id).order_by('rank')[:5]
         # 데이터를 list[dict] 형태로 변환
-        movies = []
-        for ranking in rankings:
-            movie = ranking.movie
-            movies.append({
-                "rank": ranking.rank,
-                "title": movie.title,
-                "release_year": movie.release_year,
-                "score": float(movie.score),
-                "summary": movie.summary,
-                "image": movie.image_url,
-                "genres": list(movie.genres.values_list("name", flat=True)),
-                "actors": list(movie.actors.values_list("name", flat=True)),       
-            })
+        movies = [_leaderboard_to_dict(row) for row in rows]
         return movies if movies else {'status_code': 500, 'method': 'get_movies_by_country_name', 'error': 'movies list is empty'} 
     
     except Exception as e:
         return {'status_code': 500, 'method': 'get_movies_by_country_name', 'error': str(e)}
+
+
+def get_movies_by_country_names(names: list, k: int = 5) -> dict:
+    '''
+    여러 국가의 1~k위 영화를 한 번에 반환
+    국가별 순위 번호(ROW_NUMBER)로 leaderboard 에서 상위 k개만 고르므로
+    국가 수와 무관하게 쿼리 1번 (+ 캐시에 없는 국가 이름 조회 1번)
+
+    Args:
+        names: 국가 이름 리스트
+        k: 국가별 반환할 영화 수
+    Returns:
+        dict: {국가 이름: 1~k위 영화 정보 리스트} (없는 국가는 빈 리스트)
+    '''
+    ids = country_ids.get_ids(names)
+    movies_by_country_id = {country_id: [] for country_id in ids.values()}
+    if movies_by_country_id:
+        rows = (
+            CountryLeaderboard.objects.filter(country_id__in=list(movies_by_country_id))
+            .annotate(position=Window(RowNumber(), partition_by=[F('country_id')], order_by=F('rank').asc()))
+            .filter(position__lte=k)
+            .order_by('country_id', 'rank')
+        )
+        for row in rows:
+            movies_by_country_id[row.country_id].append(_leaderboard_to_dict(row))
+    return {name: movies_by_country_id[ids[name]] if name in ids else [] for name in names}
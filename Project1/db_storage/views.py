@@ -4,63 +4,157 @@ import logging
 from pathlib import Path
 from typing import Final
 from django.http import HttpResponse
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.generics import ListAPIView
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from db_storage.utils import *  # utils.py에서 함수 호출
 from db_storage.models import *
 from visualizations.visualizer import Visualizer
-from crawl.crawler import MovieCrawler
+from db_storage.jobs import submit_crawl_job
+from db_storage.staging import ingest_movies_parallel
+from db_storage.read_cache import get_cached_movies_by_country_name
+from db_storage.serializers import CrawlJobSerializer, MovieSerializer, RankingSerializer
+from db_storage.pagination import MoviePagination, RankingPagination
+from db_storage.interning import country_ids
 from django.shortcuts import render
+from django.urls import reverse
 
 
 # JSON 파일 경로를 절대 경로로 설정
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 JSON_PATH = os.path.join(BASE_DIR, 'crawl', 'data', 'raw', 'movies_data_country.json')
+# 대용량 파일 저장 시 한 번에 커밋할 레코드 수
+DEFAULT_INGEST_BATCH_SIZE = 500
+# 한 줄에 레코드 하나씩 스트리밍 업로드할 때 사용하는 Content-Type
+NDJSON_CONTENT_TYPES = ('application/x-ndjson', 'application/ndjson', 'application/jsonl')
 
 logger = logging.getLogger(__name__)
 
+
+def int_query_param(request, name: str, default: int, minimum: int) -> int:
+    """
+    정수 query parameter를 읽는 함수 (없으면 default)
+
+    Raises:
+        ValueError: 정수가 아니거나 minimum 보다 작은 경우 (뷰에서 400으로 응답)
+    """
+    value = request.query_params.get(name)
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise ValueError(f"'{name}' must be an integer, got {value!r}.") from None
+    if number < minimum:
+        raise ValueError(f"'{name}' must be at least {minimum}, got {number}.")
+    return number
+
+
 class BulkInsertRankingView(APIView):
+    def movie_records(self, request):
+        """
+        요청에서 영화 레코드 스트림을 만드는 함수.
+            - NDJSON(application/x-ndjson): 한 줄씩 도착하는 대로 읽음 (chunked 업로드 가능)
+            - JSON 본문: {"movies": [...]} 을 레코드 단위로 읽음
+            - 본문 없음: 서버의 JSON_PATH 파일을 읽음
+        """
+        content_type = request.content_type.split(';')[0].strip().lower()
+        stream = request.stream
+        if stream is None and request.META.get('HTTP_TRANSFER_ENCODING', '').lower() == 'chunked' \
+                and request.META.get('wsgi.input_terminated'):
+            # Content-Length 없는 chunked 업로드는 서버가 디코딩한 wsgi.input 을 직접 읽음
+            stream = request.META['wsgi.input']
+        if stream is None:
+            return iter_movies_from_json_file(JSON_PATH)
+        if content_type in NDJSON_CONTENT_TYPES:
+            return iter_movies_from_ndjson(stream)
+        return iter_movies_from_json(stream)
+
     def post(self, request, *args, **kwargs):
+        """
+        크롤링 결과를 레코드 단위로 읽어 배치마다 커밋하며 저장합니다.
+        요청 본문(JSON 또는 NDJSON)이 있으면 본문을, 없으면 서버의 크롤링 결과 파일을 사용합니다.
+        `?batch_size=500` 으로 배치 크기를, `?details=false` 로 영화 제목 목록 응답 생략을 지정할 수 있습니다.
+        `?workers=4` 와 같이 워커 수를 지정하면 국가별로 여러 프로세스에서 정규화한 뒤 트랜잭션 하나로 병합 저장합니다
+        (이 경우 batch_size는 사용하지 않으며, 실패하면 아무것도 저장되지 않습니다).
+
+        배치마다 커밋하므로 일부 배치가 실패하거나 본문 중간에 잘못된 레코드가 있으면 그 앞의 배치는 이미 저장됩니다.
+            - 201: 모든 배치 저장 성공
+            - 207: 일부 배치만 저장됨 (details 에 실패한 배치 수/레코드 수와 errors, parse_error 포함)
+            - 400: 본문 형식 오류로 저장된 레코드 없음, 또는 batch_size/workers 가 올바른 정수가 아님
+            - 500: 모든 배치 저장 실패
+        """
         try:
-            # JSON 파일 읽기
-            with open(JSON_PATH, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            batch_size = int_query_param(request, 'batch_size', DEFAULT_INGEST_BATCH_SIZE, minimum=1)
+            workers = int_query_param(request, 'workers', 0, minimum=0)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
-            movies_data = data.get('movies', [])
-            if not movies_data:
+        try:
+            collect_titles = request.query_params.get('details', 'true').lower() != 'false'
+
+            def log_progress(summary):
+                logger.info(f"Bulk insert progress: {summary['records']} records in {summary['batches']} batches.")
+
+            # 레코드 단위로 읽으며 save_movies_from_json 으로 배치 저장 (전송과 저장이 겹쳐 진행됨)
+            if workers > 0:
+                result = ingest_movies_parallel(self.movie_records(request), workers=workers, collect_titles=collect_titles)
+            else:
+                result = ingest_movie_stream(
+                    self.movie_records(request), batch_size=batch_size,
+                    collect_titles=collect_titles, progress_callback=log_progress,
+                )
+            committed_records = result['records'] - result['failed_records']
+            details = {
+                "saved_movies_count": result['saved_count'],
+                "duplicate_movies_count": result['duplicate_count'],
+                "updated_movies_count": result['updated_count'],
+                "unchanged_movies_count": result['unchanged_count'],
+                "records_count": result['records'],
+                "batches_count": result['batches'],
+                "failed_batches_count": result['failed_batches'],
+                "failed_records_count": result['failed_records'],
+                "errors": result['errors'],
+                "parse_error": result['parse_error'],
+            }
+            if not committed_records:
+                if result['failed_batches']:
+                    return Response({"error": "Failed to save movie data.", "details": details},
+                                    status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+                if result['parse_error']:
+                    return Response({"error": "Error decoding JSON data.", "details": details},
+                                    status=status.HTTP_400_BAD_REQUEST)
                 return Response({"error": "No movie data provided."}, status=status.HTTP_400_BAD_REQUEST)
-            
-            # save_movies_from_json 함수 호출, 여기서 데이터 저장
-            result = save_movies_from_json(movies_data)
-            
-            saved_movies = result['saved_movies']
-            duplicate_movies = result['duplicate_movies']
-            updated_movies = result['updated_movies']
-            
-            # 응답 메시지 구성
-            message = "Movies processed successfully."
-            if not saved_movies:
+
+            # 응답 메시지 구성 (실패한 배치나 형식 오류가 있으면 앞서 커밋된 배치만 저장된 것)
+            partial = bool(result['failed_batches'] or result['parse_error'])
+            if partial:
+                message = f"Movies partially processed: {committed_records} of {result['records']} records were saved."
+                if result['parse_error']:
+                    message += " Reading stopped at malformed data."
+            else:
+                message = "Movies processed successfully."
+            if not result['saved_count']:
                 message += " No new movies were saved."
-            
-            return Response({
-                "message": message,
-                "details": {
-                    "saved_movies_count": len(saved_movies),
-                    "duplicate_movies_count": len(duplicate_movies),
-                    "updated_movies_count": len(updated_movies),
-                },
-                "saved_movies": [movie.title for movie in saved_movies],
-                "duplicate_movies": [movie.title for movie in duplicate_movies],
-                "updated_movies": [movie.title for movie in updated_movies],
-            }, status=status.HTTP_201_CREATED)
+
+            response = {"message": message, "details": details}
+            if collect_titles:
+                response.update({
+                    "saved_movies": result['saved_movies'],
+                    "duplicate_movies": result['duplicate_movies'],
+                    "updated_movies": result['updated_movies'],
+                    "updated_fields": result['updated_fields'],
+                })
+            return Response(response, status=status.HTTP_207_MULTI_STATUS if partial else status.HTTP_201_CREATED)
 
         except FileNotFoundError:
             logger.error("JSON file not found.")
             return Response({"error": f"File not found: {JSON_PATH}"}, status=status.HTTP_404_NOT_FOUND)
         except json.JSONDecodeError:
-            logger.error("Error decoding JSON file.")
-            return Response({"error": "Error decoding JSON file."}, status=status.HTTP_400_BAD_REQUEST)
+            logger.error("Error decoding JSON data.")
+            return Response({"error": "Error decoding JSON data."}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             logger.error(f"Error saving movies: {e}")
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -74,13 +168,13 @@ class GetMovieListByCountryAPIView(APIView):
         if not country_name:
             return Response({"error": "Required: country_name"}, status=status.HTTP_400_BAD_REQUEST)
         try:
-            movies = get_movies_by_country_name(country_name)
+            movies = get_cached_movies_by_country_name(country_name)
             if not movies:
                 return Response({
                     "error": f"No movies found for country: {country_name}"}, status=status.HTTP_404_NOT_FOUND
                 ) # TODO: Validation Visualizer로 이전
             # visualizer 
-            visualizer = Visualizer(country_name=country_name)
+            visualizer = Visualizer(country_name=country_name, movies=movies)  # 조회한 영화를 재사용
             output_path = visualizer.create_combined_html() # HTML 파일 생성
             
             # 3. 생성된 HTML 파일 읽기 및 반환
@@ -93,26 +187,120 @@ class GetMovieListByCountryAPIView(APIView):
             ) 
         
 class CrawlMoviesView(APIView):
-    """영화 크롤링을 트리거하는 APIView"""
+    """영화 크롤링 작업을 백그라운드로 제출하는 APIView"""
 
     def get(self, request, *args, **kwargs):
         """
-        영화 정보를 크롤링하여 JSON 형식으로 반환합니다.
-        예를 들어, `GET /api/crawl_movies/` 요청 시 영화 데이터를 크롤링하여 반환합니다.
+        영화 크롤링 작업을 제출하고 작업 id를 바로 반환합니다.
+        예를 들어, `GET /api/crawl_movies/` 요청 시 202와 함께 작업 id와 상태 조회 URL을 반환합니다.
+        이미 진행 중인 작업이 있으면 새로 크롤링하지 않고 그 작업을 반환합니다.
+        `?workers=4` 와 같이 워커 수를 지정하면 국가별 병렬 크롤링을 수행합니다.
+        `?backend=http` 를 지정하면 브라우저 없이 검색 페이지를 직접 파싱합니다.
+        `?stream=true` 를 지정하면 크롤링 결과를 국가 단위로 바로 DB에 저장합니다.
         """
         try:
-            # 크롤러 인스턴스 생성
-            crawler = MovieCrawler(top_n=10)
-            # 영화 크롤링 실행
-            result = crawler.crawling()
+            workers = int_query_param(request, 'workers', 1, minimum=1)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
-            # 크롤링된 결과 반환
-            return Response(result, status=status.HTTP_200_OK)
+        try:
+            params = {
+                'top_n': 10,
+                'workers': workers,
+                'backend': request.query_params.get('backend', 'selenium'),
+                'stream': request.query_params.get('stream', '').lower() == 'true',
+            }
+            job, created = submit_crawl_job(params)
+            return Response({
+                "job_id": str(job.id),
+                "status": job.status,
+                "deduplicated": not created,
+                "status_url": reverse('crawl-job-status', kwargs={'job_id': job.id}),
+            }, status=status.HTTP_202_ACCEPTED)
 
         except Exception as e:
             # 오류 발생 시 500 Internal Server Error 반환
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        
+
+
+class CrawlJobStatusView(APIView):
+    """크롤링 작업의 상태/진행률을 조회하는 APIView"""
+
+    def get(self, request, job_id):
+        try:
+            job = CrawlJob.objects.get(pk=job_id)
+        except CrawlJob.DoesNotExist:
+            return Response({"error": f"Crawl job not found: {job_id}"}, status=status.HTTP_404_NOT_FOUND)
+        return Response(CrawlJobSerializer(job).data, status=status.HTTP_200_OK)
+
+
+class MovieFieldsMixin:
+    """`?fields=title,score` 로 영화 필드를 고르고, 고르지 않은 genres/actors 는 조회(prefetch)하지 않음"""
+
+    def movie_fields(self):
+        fields = self.request.query_params.get('fields')
+        if not fields:
+            return None
+        fields = [field.strip() for field in fields.split(',') if field.strip()]
+        unknown = set(fields) - set(MovieSerializer.Meta.fields)
+        if unknown:
+            raise ValidationError({"fields": f"Unknown fields: {', '.join(sorted(unknown))}. "
+                                             f"Allowed: {', '.join(MovieSerializer.Meta.fields)}"})
+        return fields
+
+    def movie_prefetches(self, prefix: str = '') -> list:
+        fields = self.movie_fields()
+        return [prefix + name for name in ('genres', 'actors') if fields is None or name in fields]
+
+    def movie_columns(self, prefix: str = '') -> list:
+        """고른 필드 중 Movie 테이블 컬럼 (id는 항상 포함, 필드를 고르지 않았으면 빈 리스트 = 전체 컬럼)"""
+        fields = self.movie_fields()
+        if fields is None:
+            return []
+        return [prefix + name for name in dict.fromkeys(['id', *fields]) if name not in ('genres', 'actors')]
+
+
+class RankingListView(MovieFieldsMixin, ListAPIView):
+    """
+    국가별 랭킹 JSON 목록 (rank 순, keyset 페이지네이션)
+    예: `GET /api/rankings/South Korea/?page_size=10&fields=title,score`
+    """
+    serializer_class = RankingSerializer
+    pagination_class = RankingPagination
+
+    def get_queryset(self):
+        country_id = country_ids.get_id(self.kwargs['country_name'])
+        if country_id is None:
+            raise NotFound(f"Country not found: {self.kwargs['country_name']}")
+        rankings = (
+            Ranking.objects.filter(country_id=country_id)
+            .select_related('country', 'movie')
+            .prefetch_related(*self.movie_prefetches('movie__'))
+        )
+        columns = self.movie_columns('movie__')
+        return rankings.only('rank', 'country__name', *columns) if columns else rankings
+
+    def get_serializer(self, *args, **kwargs):
+        return super().get_serializer(*args, movie_fields=self.movie_fields(), **kwargs)
+
+
+class MovieListView(MovieFieldsMixin, ListAPIView):
+    """
+    영화 JSON 목록 (id 순, keyset 페이지네이션)
+    예: `GET /api/movies/?page_size=50&fields=id,title`
+    """
+    serializer_class = MovieSerializer
+    pagination_class = MoviePagination
+
+    def get_queryset(self):
+        movies = Movie.objects.prefetch_related(*self.movie_prefetches())
+        # 고른 필드만 SELECT (`fields=id,title` 이면 summary 등 큰 컬럼을 읽지 않음)
+        columns = self.movie_columns()
+        return movies.only(*columns) if columns else movies
+
+    def get_serializer(self, *args, **kwargs):
+        return super().get_serializer(*args, fields=self.movie_fields(), **kwargs)
+
 
 def home(request):
     """
@@ -16,7 +16,7 @@ from wordcloud import WordCloud, STOPWORDS
 from jinja2 import Environment, FileSystemLoader
 
 # 사용자 정의 모듈 (가정: 직접 정의한 함수나 데이터)
-from db_storage.utils import get_movies_by_country_name
+from db_storage.utils import get_movies_by_country_name, get_movies_by_country_names
 from visualizations.constant import *
 
 TEMPLATE_OUTPUT_PATH: Final = 'db_storage/templates/'
@@ -25,11 +25,21 @@ class Visualizer:
     matplotlib.use('Agg')
     def __init__(self, country_name: str, movies=None, mask_path: str = None, template_path: str = "visualizations/templates/"):
         self.country_name = country_name
-        self.movies = movies or get_movies_by_country_name(self.country_name)
+        # 빈 리스트도 조회 결과이므로 movies를 넘기지 않았을 때만 다시 조회
+        self.movies = movies if movies is not None else get_movies_by_country_name(self.country_name)
         self.mask_path = MASK_PATH
         self.env = Environment(loader=FileSystemLoader(template_path))
         self.template = self.env.get_template("combined_visualization.html")
 
+    @classmethod
+    def for_countries(cls, country_names: list, k: int = 5, **kwargs) -> list:
+        """여러 국가의 영화를 한 번에 조회해 국가별 Visualizer 리스트를 반환 (영화가 없거나 존재하지 않는 국가는 제외)"""
+        movies_by_country = get_movies_by_country_names(country_names, k=k)
+        return [
+            cls(country_name=name, movies=movies_by_country[name], **kwargs)
+            for name in country_names if movies_by_country.get(name)
+        ]
+
     def visualize_TOPK(self, k: int = 5):
         filtered_movies = [movie for movie in self.movies if 1 <= movie.get('rank', 0) <= k]
         movie_cards = ''.join([self.create_movie_card(movie) for movie in filtered_movies])